@@ -1,7 +1,7 @@
 """
 Generic utility functions and classes which can be used throughout the entire package.
 """
-from collections.abc import Iterator, Iterable
+from collections.abc import Iterator, Iterable, AsyncIterator, AsyncIterable
 from typing import Any
 
 from aiohttp import RequestInfo
@@ -35,6 +35,18 @@ def get_iterator(value: Any) -> Iterator | None:
     return iter(value)
 
 
+def get_async_iterator[T](value: Iterable[T] | AsyncIterable[T]) -> AsyncIterator[T]:
+    """Safely get an asynchronous iterator from either an iterable or asynchronous iterable."""
+    if isinstance(value, AsyncIterable):
+        return aiter(value)
+
+    async def _iterator() -> AsyncIterator[T]:
+        for item in value:
+            yield item
+
+    return _iterator()
+
+
 def format_url_log(method: str, url: URL, messages: UnitIterable[Any]) -> str:
     """Format a request for a given ``url`` of a given ``method`` appending the given ``messages``"""
     url = str(url.with_query(None))
@@ -0,0 +1,203 @@
+"""
+Implements batching of many individual requests for single items into batched requests
+to HTTP services which expose endpoints for getting many items at once.
+
+Calls to load items made within a short time window are collected into one batched request,
+and the response of this batched request is split back out to each caller.
+"""
+import asyncio
+from collections.abc import Callable, Hashable, Mapping, Sequence
+from http import HTTPMethod
+from typing import Any
+
+from aiohttp import RequestInfo
+from multidict import CIMultiDict, CIMultiDictProxy
+from yarl import URL
+
+from aiorequestful.cache.backend.base import ResponseRepository
+from aiorequestful.cache.session import CachedSession
+from aiorequestful.exception import InputError
+from aiorequestful.request import RequestHandler
+from aiorequestful.types import Number, RequestKwargs
+
+
+class BatchLoader[K: Hashable, V: Any]:
+    """
+    Collects calls to :py:meth:`load` made within a short time window into one batched request
+    sent through the given :py:class:`.RequestHandler`, splitting the response back out to each caller.
+
+    When the ``handler`` uses a :py:class:`.CachedSession` and an ``item_request`` is given,
+    the value for each key is first looked up in the cache from the request for that single item.
+    Only the keys not found in the cache are sent in the batched request,
+    and the value for each key returned by the batched request is saved to the cache as the response
+    for the request for that single item.
+
+    :param handler: The handler to send batched requests through.
+    :param batch_request: Returns the kwargs of the batched request for the given keys.
+        See :py:meth:`.RequestHandler.request` for more info on the available kwargs.
+    :param split: Returns a map of each key to its value from the given keys and the payload of their batched request.
+    :param item_request: Returns the kwargs of the request for the single item of the given key.
+        Used to look up and save the value for each key in the cache.
+    :param max_batch_size: The maximum number of keys to send in one batched request.
+    :param delay: The time in seconds to wait for more keys after the first key of a batch is loaded
+        before sending the batched request.
+    """
+
+    __slots__ = (
+        "handler", "batch_request", "split", "item_request", "max_batch_size", "delay", "_pending", "_timer", "_tasks"
+    )
+
+    def __init__(
+            self,
+            handler: RequestHandler,
+            batch_request: Callable[[Sequence[K]], RequestKwargs],
+            split: Callable[[Sequence[K], Any], Mapping[K, V]],
+            item_request: Callable[[K], RequestKwargs] | None = None,
+            max_batch_size: int = 50,
+            delay: Number = 0.005,
+    ):
+        if max_batch_size < 1:
+            raise InputError(f"Max batch size must be at least 1: {max_batch_size}")
+
+        #: The handler to send batched requests through
+        self.handler = handler
+        #: Returns the kwargs of the batched request for the given keys
+        self.batch_request = batch_request
+        #: Returns a map of each key to its value from the given keys and the payload of their batched request
+        self.split = split
+        #: Returns the kwargs of the request for the single item of the given key
+        self.item_request = item_request
+        #: The maximum number of keys to send in one batched request
+        self.max_batch_size = max_batch_size
+        #: The time in seconds to wait for more keys after the first key of a batch is loaded
+        self.delay = delay
+
+        self._pending: dict[K, asyncio.Future[V]] = {}
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+    async def load(self, key: K) -> V | None:
+        """
+        Load the value for the given ``key``, batching it with all other keys loaded within the ``delay``.
+        Loading the same key many times within the same batch only sends the key once.
+
+        :return: The value for the key, or None if the batched request did not return a value for the key.
+        :raise RequestError: For any batched request which fails.
+        :raise ResponseError: For any batched request which returns an invalid response.
+        """
+        future = self._pending.get(key)
+        if future is None:
+            future = self._pending[key] = asyncio.get_running_loop().create_future()
+
+            if len(self._pending) >= self.max_batch_size:
+                self._dispatch()
+            elif self._timer is None:
+                self._timer = asyncio.get_running_loop().call_later(self.delay, self._dispatch)
+
+        # other callers may be waiting for the same key so never cancel the future itself
+        return await asyncio.shield(future)
+
+    async def load_many(self, keys: Sequence[K]) -> list[V | None]:
+        """
+        Load the values for all the given ``keys`` as per :py:meth:`load`.
+
+        :return: The values for each key in the order of the given ``keys``.
+        """
+        return list(await asyncio.gather(*map(self.load, keys)))
+
+    def _dispatch(self) -> None:
+        """Send a batched request for all pending keys."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, {}
+        if not batch:
+            return
+
+        task = asyncio.create_task(self._load_batch(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _load_batch(self, batch: Mapping[K, asyncio.Future[V]]) -> None:
+        """Load the values for the given ``batch`` of keys, setting the result of the future for each key."""
+        try:
+            values = await self._get_cached(list(batch))
+            keys = [key for key in batch if key not in values]
+
+            if keys:
+                kwargs = self.batch_request(keys)
+                kwargs.setdefault("method", HTTPMethod.GET)
+                payload = await self.handler.request(**kwargs)
+
+                values_sent = {key: value for key, value in self.split(keys, payload).items() if key in batch}
+                await self._save_cached(values_sent)
+                values |= values_sent
+        except BaseException as ex:
+            for future in batch.values():
+                if future.done():
+                    continue
+                if isinstance(ex, asyncio.CancelledError):
+                    future.cancel()
+                else:
+                    future.set_exception(ex)
+
+            if not isinstance(ex, Exception):  # never swallow cancellation or exit signals
+                raise
+            return
+
+        for key, future in batch.items():
+            if not future.done():
+                future.set_result(values.get(key))
+
+    def _get_item_request_info(self, key: K) -> RequestInfo:
+        """Get the request info of the request for the single item of the given ``key``."""
+        kwargs = self.item_request(key)
+
+        url = URL(kwargs["url"])
+        if kwargs.get("params"):
+            url = url.update_query(kwargs["params"])
+        method = HTTPMethod(kwargs.get("method", HTTPMethod.GET).upper())
+
+        return RequestInfo(url=url, method=method.name, headers=CIMultiDictProxy(CIMultiDict()), real_url=url)
+
+    def _get_cache_target(self, key: K) -> tuple[ResponseRepository, RequestInfo] | None:
+        """
+        Get the repository of the cache and the request info of the request for the single item of the given ``key``.
+
+        :return: The repository and request info, or None if the value for the key cannot be cached.
+        """
+        session = self.handler.session
+        if self.item_request is None or not isinstance(session, CachedSession):
+            return
+
+        request = self._get_item_request_info(key)
+        repository = session.cache.get_repository_from_url(request.url)
+        if repository is None:
+            return
+
+        return repository, request
+
+    async def _get_cached(self, keys: Sequence[K]) -> dict[K, V]:
+        """Get the values of all the given ``keys`` found in the cache."""
+        values = {}
+        for key in keys:
+            if (target := self._get_cache_target(key)) is None:
+                continue
+
+            repository, request = target
+            value = await repository.get_response(request)
+            if value is not None:
+                values[key] = value
+
+        return values
+
+    async def _save_cached(self, values: Mapping[K, V]) -> None:
+        """Save the given ``values`` to the cache as the responses to the request for the single item of each key."""
+        for key, value in values.items():
+            if value is None or (target := self._get_cache_target(key)) is None:
+                continue
+
+            repository, request = target
+            if cache_key := repository.get_key_from_request(request):
+                await repository.save_response((cache_key, value))
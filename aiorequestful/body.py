@@ -0,0 +1,221 @@
+"""
+Implements bodies for requests which may be sent again from their start for each attempt of a request.
+
+A request body given as an iterator, async generator, or file object is consumed by the first attempt
+of a request, leaving an empty or partial body for any retried attempt.
+A :py:class:`RequestBody` is instead opened from its start for each attempt and streams its content in chunks,
+such that uploads of any size are sent in constant memory and may be retried safely.
+"""
+import asyncio
+import io
+import os
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Callable, Iterable, AsyncIterable
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from aiohttp.payload import AsyncIterablePayload
+
+from aiorequestful._utils import get_async_iterator
+from aiorequestful.exception import InputError
+
+type BodyContent = bytes | bytearray | memoryview | Iterable[bytes] | AsyncIterable[bytes]
+
+
+class RequestBodyPayload(AsyncIterablePayload):
+    """
+    The payload for one attempt of a request streaming the content of a :py:class:`RequestBody`.
+
+    :param value: The chunks of content to stream.
+    :param size: The number of bytes in the content if known.
+        A known size sends the payload with a Content-Length header in place of chunked transfer encoding.
+    """
+
+    def __init__(self, value: AsyncIterator[bytes], size: int | None = None, *args: Any, **kwargs: Any):
+        super().__init__(value, *args, **kwargs)
+        self._size = size
+
+    async def close(self) -> None:
+        """Stop streaming the content, releasing any files opened to read the content of this payload."""
+        self._iter = None
+        if (aclose := getattr(self._value, "aclose", None)) is not None:
+            await aclose()
+
+
+class RequestBody(ABC):
+    """
+    A request body which is opened from its start for each attempt of a request.
+
+    Give a request body as the ``data`` kwarg of any request to stream its content in chunks of ``chunk_size`` bytes.
+    The content is never buffered in full, and a retried request sends the body again from its start.
+    Requests with a request body are never hedged.
+
+    :param chunk_size: The maximum number of bytes to read for each chunk of the body.
+    :param content_type: The value of the Content-Type header to send with the body.
+    """
+
+    __slots__ = ("chunk_size", "content_type")
+
+    @property
+    def size(self) -> int | None:
+        """The number of bytes in the body if known, or None to send the body with chunked transfer encoding."""
+        return
+
+    def __init__(self, chunk_size: int = 2 ** 16, content_type: str = "application/octet-stream"):
+        if chunk_size < 1:
+            raise InputError(f"Chunk size must be at least 1: {chunk_size}")
+
+        #: The maximum number of bytes to read for each chunk of the body
+        self.chunk_size = chunk_size
+        #: The value of the Content-Type header to send with the body
+        self.content_type = content_type
+
+    def open(self) -> RequestBodyPayload:
+        """Open the body from its start to send with one attempt of a request."""
+        return RequestBodyPayload(self.iterate(), size=self.size, content_type=self.content_type)
+
+    @abstractmethod
+    def iterate(self) -> AsyncIterator[bytes]:
+        """Read the body from its start, yielding its content in chunks of at most :py:attr:`chunk_size` bytes."""
+        raise NotImplementedError
+
+    async def read(self) -> bytes:
+        """Read the entire content of the body. Buffers the body in full, use for small bodies only."""
+        return b"".join([chunk async for chunk in self.iterate()])
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(size={self.size})"
+
+
+class FileBody(RequestBody):
+    """
+    A request body which streams the content of the file at the given ``path``.
+
+    :param path: The path of the file to stream.
+    :param chunk_size: The maximum number of bytes to read for each chunk of the body.
+    :param content_type: The value of the Content-Type header to send with the body.
+    """
+
+    __slots__ = ("path",)
+
+    @property
+    def size(self) -> int:
+        return self.path.stat().st_size
+
+    def __init__(
+            self, path: str | Path, chunk_size: int = 2 ** 16, content_type: str = "application/octet-stream"
+    ):
+        super().__init__(chunk_size=chunk_size, content_type=content_type)
+
+        path = Path(path)
+        if not path.is_file():
+            raise InputError(f"Path is not a file: {path}")
+
+        #: The path of the file to stream
+        self.path = path
+
+    async def iterate(self) -> AsyncIterator[bytes]:
+        loop = asyncio.get_running_loop()
+        with self.path.open("rb") as file:
+            while chunk := await loop.run_in_executor(None, file.read, self.chunk_size):
+                yield chunk
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(path={str(self.path)!r}, size={self.size})"
+
+
+class StreamBody(RequestBody):
+    """
+    A request body which streams the content of the given seekable binary ``stream`` from its current position.
+    The stream is returned to this position for each attempt of a request.
+
+    The stream is not closed by this body and must stay open until all requests which send it are complete.
+
+    :param stream: The seekable binary stream to stream e.g. a file opened in binary mode or a :py:class:`io.BytesIO`.
+    :param chunk_size: The maximum number of bytes to read for each chunk of the body.
+    :param content_type: The value of the Content-Type header to send with the body.
+    """
+
+    __slots__ = ("stream", "start")
+
+    @property
+    def size(self) -> int:
+        position = self.stream.tell()
+        try:
+            return self.stream.seek(0, os.SEEK_END) - self.start
+        finally:
+            self.stream.seek(position)
+
+    def __init__(self, stream: BinaryIO, chunk_size: int = 2 ** 16, content_type: str = "application/octet-stream"):
+        super().__init__(chunk_size=chunk_size, content_type=content_type)
+
+        if isinstance(stream, io.TextIOBase):
+            raise InputError(f"Stream must be opened in binary mode: {stream}")
+        if not stream.seekable():
+            raise InputError(f"Stream must be seekable to send it again for each attempt: {stream}")
+
+        #: The seekable binary stream to stream
+        self.stream = stream
+        #: The position of the stream from which the body starts
+        self.start = stream.tell()
+
+    async def iterate(self) -> AsyncIterator[bytes]:
+        loop = asyncio.get_running_loop()
+        self.stream.seek(self.start)
+        while chunk := await loop.run_in_executor(None, self.stream.read, self.chunk_size):
+            yield chunk
+
+
+class FactoryBody(RequestBody):
+    """
+    A request body which calls the given ``factory`` for each attempt of a request to get the content to stream.
+
+    The factory may return the content as bytes, or as a new iterable or async iterable of chunks of bytes
+    e.g. a new generator which produces the content of the body as it is sent.
+    Bytes are sent in chunks of at most ``chunk_size`` bytes without copying, chunks from iterables are sent as is.
+
+    :param factory: Returns the content of the body from its start each time it is called.
+    :param size: The number of bytes the factory produces if known.
+        When not given, the body is sent with chunked transfer encoding unless the factory returns bytes.
+    :param chunk_size: The maximum number of bytes to send for each chunk of content returned as bytes.
+    :param content_type: The value of the Content-Type header to send with the body.
+    """
+
+    __slots__ = ("factory", "_size")
+
+    @property
+    def size(self) -> int | None:
+        return self._size
+
+    def __init__(
+            self,
+            factory: Callable[[], BodyContent],
+            size: int | None = None,
+            chunk_size: int = 2 ** 16,
+            content_type: str = "application/octet-stream",
+    ):
+        super().__init__(chunk_size=chunk_size, content_type=content_type)
+        if size is not None and size < 0:
+            raise InputError(f"Size must be at least 0: {size}")
+
+        #: Returns the content of the body from its start each time it is called
+        self.factory = factory
+        self._size = size
+
+    def open(self) -> RequestBodyPayload:
+        content, size = self._get_content()
+        return RequestBodyPayload(get_async_iterator(content), size=size, content_type=self.content_type)
+
+    def iterate(self) -> AsyncIterator[bytes]:
+        content, _ = self._get_content()
+        return get_async_iterator(content)
+
+    def _get_content(self) -> tuple[Iterable[bytes] | AsyncIterable[bytes], int | None]:
+        """Call the factory, splitting content returned as bytes into chunks. Returns the content and its size."""
+        content = self.factory()
+        if not isinstance(content, bytes | bytearray | memoryview):
+            return content, self.size
+
+        content = memoryview(content).cast("B")
+        chunks = (content[start:start + self.chunk_size] for start in range(0, len(content), self.chunk_size))
+        return chunks, len(content)
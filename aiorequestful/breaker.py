@@ -0,0 +1,196 @@
+"""
+Implements a circuit breaker to stop sending requests to an HTTP service which is failing.
+
+When too many consecutive requests to a host (or route) fail, the circuit for that host is opened
+and all further requests fail immediately without being sent.
+After a recovery time, a limited number of requests are allowed through to probe whether the service has recovered.
+"""
+import logging
+import time
+from collections.abc import Hashable
+from dataclasses import dataclass
+from enum import StrEnum
+
+import aiohttp
+from yarl import URL
+
+from aiorequestful.exception import CircuitOpenError, InputError
+from aiorequestful.types import Number, URLInput
+
+
+class CircuitState(StrEnum):
+    """The state of a circuit in a :py:class:`CircuitBreaker`."""
+    #: Requests are sent as normal.
+    CLOSED = "closed"
+    #: Requests fail immediately without being sent.
+    OPEN = "open"
+    #: A limited number of requests are sent to probe whether the service has recovered.
+    HALF_OPEN = "half-open"
+
+
+@dataclass
+class _Circuit:
+    """The state of the circuit for one host or route."""
+    state: CircuitState = CircuitState.CLOSED
+    failures: int = 0
+    opened_at: float = 0
+    probes: int = 0
+    #: Incremented each time the circuit opens or closes to identify requests sent before the change.
+    generation: int = 0
+
+
+@dataclass(frozen=True)
+class CircuitToken:
+    """A request allowed by :py:meth:`CircuitBreaker.acquire` to give back to :py:meth:`CircuitBreaker.release`."""
+    #: The key of the circuit the request belongs to.
+    key: Hashable
+    #: The generation of the circuit when the request was allowed.
+    generation: int = 0
+    #: Whether the request was allowed as a probe while the circuit was half-open.
+    probe: bool = False
+
+
+class CircuitBreaker:
+    """
+    Tracks failures of requests for each host (or route) and fails requests immediately
+    when the circuit for that host is open.
+
+    A request is considered failed when it raises a connection error or timeout, or returns a 5xx response.
+
+    :param failure_threshold: The number of consecutive failed requests after which the circuit is opened.
+    :param recovery_time: The time in seconds to keep the circuit open before allowing requests to probe the service.
+    :param half_open_requests: The maximum number of concurrent requests allowed to probe the service
+        when the circuit is half-open.
+    :param per_route: When True, track failures for each route (i.e. host and path) instead of each host.
+    """
+
+    __slots__ = ("logger", "failure_threshold", "recovery_time", "half_open_requests", "per_route", "_circuits")
+
+    def __init__(
+            self,
+            failure_threshold: int = 5,
+            recovery_time: Number = 30,
+            half_open_requests: int = 1,
+            per_route: bool = False,
+    ):
+        if failure_threshold < 1 or half_open_requests < 1:
+            raise InputError(
+                "Failure threshold and half-open requests must be at least 1: "
+                f"{failure_threshold=}, {half_open_requests=}"
+            )
+
+        #: The :py:class:`logging.Logger` for this  object
+        self.logger: logging.Logger = logging.getLogger(__name__)
+
+        #: The number of consecutive failed requests after which the circuit is opened
+        self.failure_threshold = failure_threshold
+        #: The time in seconds to keep the circuit open before allowing requests to probe the service
+        self.recovery_time = recovery_time
+        #: The maximum number of concurrent requests allowed to probe the service when the circuit is half-open
+        self.half_open_requests = half_open_requests
+        #: Whether to track failures for each route instead of each host
+        self.per_route = per_route
+
+        self._circuits: dict[Hashable, _Circuit] = {}
+
+    def get_key(self, url: URLInput) -> Hashable:
+        """Get the key of the circuit that the given ``url`` belongs to."""
+        url = URL(url)
+        return (url.host, url.path) if self.per_route else url.host
+
+    def get_state(self, url: URLInput) -> CircuitState:
+        """Get the current state of the circuit for the given ``url``."""
+        circuit = self._circuits.get(self.get_key(url))
+        if circuit is None:
+            return CircuitState.CLOSED
+        if circuit.state == CircuitState.OPEN and time.monotonic() - circuit.opened_at >= self.recovery_time:
+            return CircuitState.HALF_OPEN
+        return circuit.state
+
+    @staticmethod
+    def is_failure(response: aiohttp.ClientResponse | BaseException | None) -> bool:
+        """Check whether the given ``response`` represents a failure of the HTTP service."""
+        if isinstance(response, aiohttp.ClientResponse):
+            return response.status >= 500
+        return isinstance(response, aiohttp.ClientError | TimeoutError)
+
+    def acquire(self, url: URLInput) -> CircuitToken:
+        """
+        Check that a request may be sent to the given ``url``, reserving a probe request if the circuit is half-open.
+        Every call must be followed by a call to :py:meth:`release` with the returned token
+        once the request has completed.
+
+        :return: The token identifying the request to :py:meth:`release`.
+        :raise CircuitOpenError: If the circuit is open or all probe requests are already in flight.
+        """
+        key = self.get_key(url)
+        circuit = self._circuits.get(key)
+        if circuit is None:
+            return CircuitToken(key=key)
+        if circuit.state == CircuitState.CLOSED:
+            return CircuitToken(key=key, generation=circuit.generation)
+
+        if circuit.state == CircuitState.OPEN:
+            remaining = self.recovery_time - (time.monotonic() - circuit.opened_at)
+            if remaining > 0:
+                raise CircuitOpenError(f"Circuit is open for {key}. Retry again in {remaining:.2f} seconds")
+
+            self.logger.debug(f"Circuit is half-open for {key}: probing service...")
+            circuit.state = CircuitState.HALF_OPEN
+
+        if circuit.probes >= self.half_open_requests:
+            raise CircuitOpenError(f"Circuit is half-open for {key} and all probe requests are in flight")
+        circuit.probes += 1
+        return CircuitToken(key=key, generation=circuit.generation, probe=True)
+
+    def release(self, token: CircuitToken, failed: bool | None) -> None:
+        """
+        Record the result of a request which was allowed by :py:meth:`acquire`.
+
+        The results of requests allowed before the circuit last opened or closed are ignored
+        as they no longer reflect the state of the HTTP service.
+
+        :param token: The token returned by :py:meth:`acquire` for the request.
+        :param failed: Whether the request failed. When None, the result is unknown e.g. the request was cancelled
+            and the request does not affect the state of the circuit.
+        """
+        circuit = self._circuits.get(token.key)
+        if circuit is None:
+            if not failed:
+                return
+            circuit = self._circuits[token.key] = _Circuit()
+
+        if token.generation != circuit.generation:  # request was allowed before the circuit last changed
+            return
+        if token.probe:
+            circuit.probes -= 1
+
+        if failed is None:
+            return
+        elif not failed:
+            if circuit.state != CircuitState.CLOSED:
+                self.logger.debug(f"Circuit is closed for {token.key}: service has recovered")
+                circuit.generation += 1
+            # keep the circuit to ignore the results of requests allowed before it closed
+            circuit.state = CircuitState.CLOSED
+            circuit.failures = 0
+            return
+
+        circuit.failures += 1
+        if circuit.state == CircuitState.HALF_OPEN or circuit.failures >= self.failure_threshold:
+            self._open(key=token.key, circuit=circuit)
+
+    def _open(self, key: Hashable, circuit: _Circuit) -> None:
+        self.logger.warning(
+            f"\33[93mCircuit is open for {key} after {circuit.failures} failed requests. "
+            f"Requests will fail for the next {self.recovery_time:.2f} seconds\33[0m"
+        )
+
+        circuit.state = CircuitState.OPEN
+        circuit.opened_at = time.monotonic()
+        circuit.probes = 0
+        circuit.generation += 1
+
+    def reset(self) -> None:
+        """Close all circuits."""
+        self._circuits.clear()
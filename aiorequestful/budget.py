@@ -0,0 +1,90 @@
+"""
+Implementations of budgets which limit the number of extra requests sent by a :py:class:`.RequestHandler`.
+
+Extra requests, such as retries or hedged requests, are limited to a ratio of the requests sent recently
+to ensure extra requests cannot amplify the load on an HTTP service during periods of failure.
+"""
+import time
+from collections import deque
+
+from aiorequestful.exception import InputError
+from aiorequestful.types import Number
+
+
+class RequestBudget:
+    """
+    Limits the number of extra requests to a ``ratio`` of the requests sent within a sliding time ``window``
+    plus a ``minimum`` number of extra requests which are always allowed within that ``window``.
+
+    May be shared by many :py:class:`.RequestHandler` objects to apply one budget across all of them.
+
+    :param ratio: The maximum number of extra requests allowed for each request sent.
+    :param minimum: The number of extra requests always allowed within the ``window``
+        regardless of the number of requests sent.
+    :param window: The length of the sliding time window in seconds.
+    """
+
+    __slots__ = ("ratio", "minimum", "window", "_requests", "_withdrawals")
+
+    @property
+    def requests(self) -> int:
+        """The number of requests recorded within the current window."""
+        self._expire()
+        return len(self._requests)
+
+    @property
+    def withdrawals(self) -> int:
+        """The number of extra requests withdrawn within the current window."""
+        self._expire()
+        return len(self._withdrawals)
+
+    @property
+    def remaining(self) -> int:
+        """The number of extra requests that may currently be withdrawn."""
+        self._expire()
+        return max(int(self.minimum + self.ratio * len(self._requests)) - len(self._withdrawals), 0)
+
+    def __init__(self, ratio: float = 0.2, minimum: int = 10, window: Number = 10):
+        if ratio < 0 or minimum < 0:
+            raise InputError(f"Ratio and minimum must not be negative: {ratio=}, {minimum=}")
+        if window <= 0:
+            raise InputError(f"Window must be greater than 0: {window}")
+
+        #: The maximum number of extra requests allowed for each request sent
+        self.ratio = ratio
+        #: The number of extra requests always allowed within the window
+        self.minimum = minimum
+        #: The length of the sliding time window in seconds
+        self.window = window
+
+        self._requests: deque[float] = deque()
+        self._withdrawals: deque[float] = deque()
+
+    def _expire(self) -> None:
+        """Remove all records which are older than the window."""
+        expired = time.monotonic() - self.window
+        for records in (self._requests, self._withdrawals):
+            while records and records[0] <= expired:
+                records.popleft()
+
+    def record(self) -> None:
+        """Record a request as sent, increasing the budget for extra requests."""
+        self._expire()
+        self._requests.append(time.monotonic())
+
+    def withdraw(self) -> bool:
+        """
+        Withdraw one extra request from the budget if the budget allows.
+
+        :return: True if the extra request was withdrawn and may be sent, False if the budget is exhausted.
+        """
+        if self.remaining < 1:
+            return False
+
+        self._withdrawals.append(time.monotonic())
+        return True
+
+    def reset(self) -> None:
+        """Clear all records of requests and extra requests."""
+        self._requests.clear()
+        self._withdrawals.clear()
@@ -9,14 +9,15 @@ from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Any, Self
 
-from aiohttp import RequestInfo, ClientRequest, ClientResponse
+from aiohttp import RequestInfo, ClientRequest, ClientResponse, hdrs
 from dateutil.relativedelta import relativedelta
+from multidict import CIMultiDict
 
 from aiorequestful._utils import get_iterator, classproperty
 from aiorequestful.cache.exception import CacheError
 from aiorequestful.response.exception import PayloadHandlerError
 from aiorequestful.response.payload import PayloadHandler, StringPayloadHandler
-from aiorequestful.types import UnitCollection, URLInput
+from aiorequestful.types import UnitCollection, URLInput, Headers, ImmutableHeaders
 
 type CacheRequestType = RequestInfo | ClientRequest | ClientResponse
 type RepositoryRequestType[K] = K | CacheRequestType
@@ -24,6 +25,36 @@ type RepositoryRequestType[K] = K | CacheRequestType
 DEFAULT_EXPIRE: timedelta = timedelta(weeks=1)
 
 
+@dataclass(frozen=True)
+class ResponseValidators:
+    """
+    The validators of a cached response, used to check whether the response has changed once it has expired.
+    See https://developer.mozilla.org/en-US/docs/Web/HTTP/Guides/Conditional_requests for more info.
+    """
+    #: The value of the ETag header of the response
+    etag: str | None = None
+    #: The value of the Last-Modified header of the response
+    last_modified: str | None = None
+
+    @property
+    def headers(self) -> Headers:
+        """The headers to send with a conditional request to revalidate the response."""
+        headers = {}
+        if self.etag:
+            headers[hdrs.IF_NONE_MATCH] = self.etag
+        if self.last_modified:
+            headers[hdrs.IF_MODIFIED_SINCE] = self.last_modified
+        return headers
+
+    @classmethod
+    def from_headers(cls, headers: ImmutableHeaders) -> Self | None:
+        """Get the validators from the given response ``headers``, returning None if the response has none."""
+        headers = CIMultiDict(headers)
+        validators = cls(etag=headers.get(hdrs.ETAG), last_modified=headers.get(hdrs.LAST_MODIFIED))
+        if validators.etag or validators.last_modified:
+            return validators
+
+
 @dataclass
 class ResponseRepositorySettings[V](metaclass=ABCMeta):
     """Settings for a response type from a given endpoint to be used to configure a repository in the cache backend."""
@@ -187,6 +218,32 @@ class ResponseRepository[K: tuple, V: Any](AsyncIterable[tuple[K, V]], metaclass
         """
         raise NotImplementedError
 
+    async def get_response_with_validators(
+            self, request: RepositoryRequestType[K]
+    ) -> tuple[V, ResponseValidators] | None:
+        """
+        Get the response relating to the given ``request`` from this repository, including expired responses,
+        along with its validators. Use to revalidate an expired response with the HTTP service.
+
+        Repositories which do not store validators return None, and so never revalidate their responses.
+
+        :return: The result and its validators if found and the response has validators.
+        """
+        return
+
+    async def refresh_response(
+            self, request: RepositoryRequestType[K], validators: ResponseValidators | None = None
+    ) -> bool:
+        """
+        Reset the expiry time of the response relating to the given ``request`` after it has been revalidated,
+        replacing its validators with the given ``validators`` if given.
+
+        Repositories which do not store validators do not refresh their responses and return False.
+
+        :return: True if refreshed in the repository and False if ``request`` was not found in the repository.
+        """
+        return False
+
     async def get_responses(self, requests: Collection[RepositoryRequestType[K]]) -> list[V]:
         """
         Get the responses relating to the given ``requests`` from this repository if they exist.
@@ -197,7 +254,11 @@ class ResponseRepository[K: tuple, V: Any](AsyncIterable[tuple[K, V]], metaclass
         return list(filter(lambda result: result is not None, await tasks))
 
     async def save_response(self, response: Collection[K, V] | ClientResponse) -> None:
-        """Save the given ``response`` to this repository if a key can be extracted from it. Safely fail if not"""
+        """
+        Save the given ``response`` to this repository if a key can be extracted from it. Safely fail if not.
+        The validators of a :py:class:`ClientResponse` are saved along with its payload.
+        """
+        validators = None
         if isinstance(response, Collection):
             key, value = response
         else:
@@ -206,13 +267,23 @@ class ResponseRepository[K: tuple, V: Any](AsyncIterable[tuple[K, V]], metaclass
                 return
 
             value: V = await self.deserialize(response)
+            validators = ResponseValidators.from_headers(response.headers)
 
-        await self._set_item_from_key_value_pair(key, await self.serialize(value))
+        await self._set_item_with_validators(key, await self.serialize(value), validators=validators)
 
     @abstractmethod
     async def _set_item_from_key_value_pair(self, __key: K, __value: Any) -> None:
         raise NotImplementedError
 
+    async def _set_item_with_validators(
+            self, __key: K, __value: Any, validators: ResponseValidators | None = None
+    ) -> None:
+        """
+        Set the given ``__value`` for the given ``__key`` along with its ``validators``.
+        Repositories which do not store validators set the value only.
+        """
+        await self._set_item_from_key_value_pair(__key, __value)
+
     async def save_responses(self, responses: Mapping[K, V] | Collection[ClientResponse]) -> None:
         """
         Save the given ``responses`` to this repository if a key can be extracted from them.
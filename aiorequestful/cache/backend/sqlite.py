@@ -17,7 +17,7 @@ from dateutil.relativedelta import relativedelta
 from aiorequestful import PROGRAM_NAME
 from aiorequestful._utils import required_modules_installed, classproperty
 from aiorequestful.cache.backend.base import DEFAULT_EXPIRE, ResponseCache, ResponseRepository, RepositoryRequestType
-from aiorequestful.cache.backend.base import ResponseRepositorySettings
+from aiorequestful.cache.backend.base import ResponseRepositorySettings, ResponseValidators
 from aiorequestful.cache.exception import CacheError
 from aiorequestful.types import URLInput
 
@@ -39,6 +39,10 @@ class SQLiteTable[K: tuple[Any, ...], V: str](ResponseRepository[K, V]):
     cached_column = "cached_at"
     #: The column under which the response expiry time is stored in the table
     expiry_column = "expires_at"
+    #: The column under which the value of the response's ETag header is stored in the table
+    etag_column = "etag"
+    #: The column under which the value of the response's Last-Modified header is stored in the table
+    last_modified_column = "last_modified"
 
     # noinspection PyMethodParameters
     @classproperty
@@ -56,6 +60,8 @@ class SQLiteTable[K: tuple[Any, ...], V: str](ResponseRepository[K, V]):
             f'{ddl_sep}"{self.cached_column}" TIMESTAMP NOT NULL',
             f'{ddl_sep}"{self.expiry_column}" TIMESTAMP NOT NULL',
             f'{ddl_sep}"{self.payload_column}" TEXT',
+            f'{ddl_sep}"{self.etag_column}" TEXT',
+            f'{ddl_sep}"{self.last_modified_column}" TEXT',
             f'{ddl_sep}PRIMARY KEY ("{'", "'.join(self._primary_key_columns)}")',
             ');',
             f'CREATE INDEX IF NOT EXISTS idx_{self.expiry_column} '
@@ -64,10 +70,21 @@ class SQLiteTable[K: tuple[Any, ...], V: str](ResponseRepository[K, V]):
 
         self.logger.debug(f"Creating {self.settings.name!r} table with the following DDL:\n{ddl}")
         await self.connection.executescript(ddl)
+        await self._add_validator_columns()
         await self.commit()
 
         return self
 
+    async def _add_validator_columns(self) -> None:
+        """Add the columns for response validators to tables created before these columns were introduced."""
+        async with self.connection.execute(f"SELECT name FROM pragma_table_info('{self.settings.name}');") as cur:
+            columns = {row[0] async for row in cur}
+
+        for column in (self.etag_column, self.last_modified_column):
+            if column not in columns:
+                self.logger.debug(f"Adding {column!r} column to {self.settings.name!r} table")
+                await self.connection.execute(f'ALTER TABLE "{self.settings.name}" ADD COLUMN "{column}" TEXT')
+
     def __init__(
             self,
             connection: aiosqlite.Connection,
@@ -190,13 +207,65 @@ class SQLiteTable[K: tuple[Any, ...], V: str](ResponseRepository[K, V]):
             return
         return await self.deserialize(row[0])
 
+    async def get_response_with_validators(
+            self, request: RepositoryRequestType[K]
+    ) -> tuple[V, ResponseValidators] | None:
+        key = self.get_key_from_request(request)
+        if not key:
+            return
+
+        query = "\n".join((
+            f'SELECT "{self.payload_column}", "{self.etag_column}", "{self.last_modified_column}" ',
+            f'FROM "{self.settings.name}"',
+            f'WHERE "{self.payload_column}" IS NOT NULL',
+            f'\tAND ("{self.etag_column}" IS NOT NULL OR "{self.last_modified_column}" IS NOT NULL)',
+            f'\tAND {'\n\tAND '.join(f'"{key}" = ?' for key in self._primary_key_columns)}',
+        ))
+
+        async with self.connection.execute(query, key) as cur:
+            row = await cur.fetchone()
+
+        if not row:
+            return
+        return await self.deserialize(row[0]), ResponseValidators(etag=row[1], last_modified=row[2])
+
+    async def refresh_response(
+            self, request: RepositoryRequestType[K], validators: ResponseValidators | None = None
+    ) -> bool:
+        key = self.get_key_from_request(request)
+        if not key:
+            return False
+
+        columns = [self.cached_column, self.expiry_column]
+        params = [datetime.now().isoformat(), self.expire.isoformat()]
+        if validators is not None:
+            columns.extend((self.etag_column, self.last_modified_column))
+            params.extend((validators.etag, validators.last_modified))
+
+        query = "\n".join((
+            f'UPDATE "{self.settings.name}"',
+            f'SET {", ".join(f'"{column}" = ?' for column in columns)}',
+            f'WHERE {'\n\tAND '.join(f'"{key}" = ?' for key in self._primary_key_columns)}',
+        ))
+
+        async with self.connection.execute(query, (*params, *key)) as cur:
+            count = cur.rowcount
+        return count > 0
+
     async def _set_item_from_key_value_pair(self, __key: K, __value: V) -> None:
+        await self._set_item_with_validators(__key, __value)
+
+    async def _set_item_with_validators(
+            self, __key: K, __value: V, validators: ResponseValidators | None = None
+    ) -> None:
         columns = (
             *self._primary_key_columns,
             self.name_column,
             self.cached_column,
             self.expiry_column,
-            self.payload_column
+            self.payload_column,
+            self.etag_column,
+            self.last_modified_column,
         )
         query = "\n".join((
             f'INSERT OR REPLACE INTO "{self.settings.name}" (',
@@ -210,6 +279,8 @@ class SQLiteTable[K: tuple[Any, ...], V: str](ResponseRepository[K, V]):
             datetime.now().isoformat(),
             self.expire.isoformat(),
             __value,
+            validators.etag if validators is not None else None,
+            validators.last_modified if validators is not None else None,
         )
 
         await self.connection.execute(query, params)
@@ -41,3 +41,4 @@ class CachedResponse(ClientResponse):
             payload = payload.encode()
         self.content.feed_data(payload)
         self.content.feed_eof()
+        self._body = payload  # the payload is already in memory so may be read without copying from the stream
@@ -3,14 +3,15 @@ Implements a ClientSession which is also capable of caching response payload dat
 """
 import contextlib
 import logging
+from collections.abc import Callable, Awaitable
 from http.client import InvalidURL
-from typing import Self, Unpack
+from typing import Self, Unpack, Any
 
-from aiohttp import ClientSession, ClientRequest
+from aiohttp import ClientSession, ClientRequest, ClientResponse, hdrs
 from aiohttp.payload import JsonPayload
 
 from aiorequestful._utils import format_url_log
-from aiorequestful.cache.backend.base import ResponseCache, ResponseRepository
+from aiorequestful.cache.backend.base import ResponseCache, ResponseRepository, ResponseValidators
 from aiorequestful.cache.response import CachedResponse
 from aiorequestful.types import RequestKwargs
 
@@ -45,7 +46,12 @@ class CachedSession(ClientSession):
         await self.cache.__aexit__(exc_type, exc_val, exc_tb)
 
     @contextlib.asynccontextmanager
-    async def request(self, persist: bool = True, **kwargs: Unpack[RequestKwargs]):
+    async def request(
+            self,
+            persist: bool = True,
+            before_send: Callable[[], Awaitable[Any]] | None = None,
+            **kwargs: Unpack[RequestKwargs]
+    ):
         """
         Perform HTTP request.
 
@@ -53,8 +59,14 @@ class CachedSession(ClientSession):
         See aiohttp reference for more info on available kwargs:
         https://docs.aiohttp.org/en/stable/client_reference.html#aiohttp.ClientSession.request
 
+        When an expired response with validators is found in the cache, a conditional request is sent
+        to revalidate it. Should the HTTP service respond that the response has not been modified,
+        the expiry time of the response is reset and the cached response is returned.
+
         :param persist: Whether to persist responses returned from sending network requests i.e. non-cached responses.
-        :return: Either the :py:class:`CachedResponse` if a response was found in the cache,
+            Also controls whether the expiry time of revalidated responses is reset.
+        :param before_send: Awaited before sending a network request i.e. only when no cached response is found.
+        :return: Either the :py:class:`CachedResponse` if a response was found in the cache or was revalidated,
             or the :py:class:`ClientResponse` if the request was sent.
         """
         url = kwargs["url"]
@@ -67,7 +79,7 @@ class CachedSession(ClientSession):
         if (json_data := kwargs.pop("json", None)) is not None:
             kwargs["data"] = JsonPayload(json_data, dumps=self._json_serialize)
 
-        drop_kwargs = ("allow_redirects",)
+        drop_kwargs = ("allow_redirects", "timeout")
 
         req = ClientRequest(
             loop=self._loop,
@@ -81,8 +93,20 @@ class CachedSession(ClientSession):
         response = await self._get_cached_response(req, repository=repository)
         self._log_cache_hit(request=req, response=response)
         if response is None:
+            stale = await self._get_stale_response(req, repository=repository)
+            if stale is not None:  # ask the service to only send the response if it has changed
+                kwargs["headers"] |= stale[1].headers
+
+            if before_send is not None:
+                await before_send()
             response = await super().request(**kwargs)
 
+            if stale is not None and response.status == 304:
+                response.release()
+                response = await self._revalidate(
+                    req, repository=repository, stale=stale, response=response, persist=persist
+                )
+
         yield response
 
         if persist and repository is not None and response.ok and not isinstance(response, CachedResponse):
@@ -104,6 +128,44 @@ class CachedSession(ClientSession):
 
         return CachedResponse(request=request, payload=payload)
 
+    @staticmethod
+    async def _get_stale_response(
+            request: ClientRequest, repository: ResponseRepository | None
+    ) -> tuple[Any, ResponseValidators] | None:
+        """
+        Get an expired response and its validators for the given ``request`` to revalidate with a conditional request.
+        Returns None when the request is already conditional or no response with validators is found.
+        """
+        if repository is None or request.method != hdrs.METH_GET:
+            return
+        if hdrs.IF_NONE_MATCH in request.headers or hdrs.IF_MODIFIED_SINCE in request.headers:
+            return  # the caller handles conditional responses
+
+        return await repository.get_response_with_validators(request)
+
+    async def _revalidate(
+            self,
+            request: ClientRequest,
+            repository: ResponseRepository,
+            stale: tuple[Any, ResponseValidators],
+            response: ClientResponse,
+            persist: bool,
+    ) -> CachedResponse:
+        """
+        Get the response for an expired cached response which was not modified according to the given 304 ``response``,
+        resetting its expiry time when ``persist`` is True.
+        """
+        payload, validators = stale
+        if persist:
+            validators = ResponseValidators.from_headers(response.headers) or validators
+            await repository.refresh_response(request, validators=validators)
+
+        if not isinstance(payload, str | bytes):
+            payload = await repository.serialize(payload)
+
+        self.logger.debug(format_url_log(method="CACHE", url=request.url, messages="CACHE REVALIDATED"))
+        return CachedResponse(request=request, payload=payload)
+
     def _log_cache_hit(self, request: ClientRequest, response: CachedResponse | None) -> None:
         message = "CACHE HIT" if isinstance(response, CachedResponse) else "HTTP REQUEST"
         self.logger.debug(format_url_log(method="CACHE", url=request.url, messages=message))
@@ -21,3 +21,15 @@ class HTTPError(AIORequestfulError):
 
 class RequestError(HTTPError):
     """Exception raised for errors relating to HTTP requests."""
+
+
+class CircuitOpenError(RequestError):
+    """Exception raised when a request is not sent as the circuit for its host is open."""
+
+
+class DeadlineExceededError(RequestError):
+    """Exception raised when a request cannot be completed within its deadline."""
+
+
+class RateLimiterError(RequestError):
+    """Exception raised when a request cannot acquire its rate limit."""
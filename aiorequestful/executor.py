@@ -0,0 +1,329 @@
+"""
+Implements an executor to distribute requests across many processes, each with its own :py:class:`.RequestHandler`.
+
+A single event loop may be bound by the CPU time spent handling the payloads of responses long before
+it is bound by the network. The executor scales handling across many processes while coordinating
+the rate and concurrency of requests across all processes such that global limits of the HTTP service are respected.
+"""
+import asyncio
+import itertools
+import logging
+import multiprocessing
+import os
+import pickle
+import queue
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from multiprocessing.context import BaseContext
+from multiprocessing.process import BaseProcess
+from typing import Any, Self, Unpack
+
+from aiorequestful.exception import RequestError, InputError
+from aiorequestful.limiter import RateLimiter
+from aiorequestful.request import RequestHandler
+from aiorequestful.types import RequestKwargs, URLInput
+
+type HandlerFactory = Callable[[], RequestHandler]
+
+
+def _get_picklable_exception(ex: Exception) -> Exception:
+    """Get an exception which may be sent between processes in place of the given ``ex``."""
+    for exception in (ex, lambda: type(ex)(str(ex)), lambda: RequestError(f"{type(ex).__name__}: {ex}")):
+        try:
+            exception = exception() if callable(exception) else exception
+            return pickle.loads(pickle.dumps(exception))
+        except Exception:
+            continue
+
+
+async def _send(handler: RequestHandler, key: int, kwargs: RequestKwargs, results: multiprocessing.Queue) -> None:
+    """Send a request on the given ``handler``, putting its payload or exception on the ``results`` queue."""
+    try:
+        payload = await handler.request(**kwargs)
+    except Exception as ex:
+        results.put((key, False, _get_picklable_exception(ex)))
+        return
+
+    try:
+        results.put((key, True, pickle.dumps(payload)))
+    except Exception as ex:
+        results.put((key, False, RequestError(f"Could not send payload back to the executor: {ex}")))
+
+
+async def _serve(
+        factory: HandlerFactory,
+        rate_limiter: RateLimiter | None,
+        requests: multiprocessing.Queue,
+        results: multiprocessing.Queue,
+) -> None:
+    """Send all requests from the ``requests`` queue concurrently until a None message is received."""
+    handler = factory()
+    if rate_limiter is not None:
+        handler.rate_limiter = rate_limiter
+
+    loop = asyncio.get_running_loop()
+    tasks: set[asyncio.Task] = set()
+
+    async with handler:
+        while (message := await loop.run_in_executor(None, requests.get)) is not None:
+            key, kwargs = message
+            task = asyncio.create_task(_send(handler, key=key, kwargs=pickle.loads(kwargs), results=results))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+
+        await asyncio.gather(*tasks)
+
+
+def _run_worker(
+        factory: HandlerFactory,
+        rate_limiter: RateLimiter | None,
+        requests: multiprocessing.Queue,
+        results: multiprocessing.Queue,
+) -> None:
+    """The entry point for each worker process."""
+    asyncio.run(_serve(factory=factory, rate_limiter=rate_limiter, requests=requests, results=results))
+
+
+@dataclass
+class _Worker:
+    """The state of one worker process."""
+    process: BaseProcess
+    requests: multiprocessing.Queue
+    pending: set[int] = field(default_factory=set)
+
+
+class ProcessRequestExecutor:
+    """
+    Distributes requests across many worker processes, each sending requests with its own :py:class:`.RequestHandler`.
+
+    Each worker process builds its :py:class:`.RequestHandler` by calling the given ``factory``
+    and sends the requests it is given concurrently.
+    The payload of each response is handled in the worker process and returned to the caller.
+    Requests are given to the worker process with the fewest requests in flight.
+
+    The rate and concurrency of requests are coordinated across all worker processes.
+    The ``limit`` bounds the number of requests in flight across all worker processes,
+    and the ``rate_limiter`` is assigned to the handler of every worker process.
+    Use a :py:class:`.SharedGCRARateLimiter` to share one rate limit between all worker processes.
+
+    :param factory: Returns a new :py:class:`.RequestHandler` to use in each worker process.
+        Must be picklable e.g. a module level function or a :py:func:`functools.partial`
+        of :py:meth:`.RequestHandler.create` with picklable arguments.
+    :param processes: The number of worker processes to start. Defaults to the number of CPUs.
+    :param limit: The maximum number of requests in flight across all worker processes.
+    :param rate_limiter: The rate limiter to assign to the handler of every worker process.
+        Must be shared between processes to limit the combined rate of all worker processes
+        e.g. a :py:class:`.SharedGCRARateLimiter` created with the same ``context``.
+    :param context: The multiprocessing context, or the name of the start method, to start worker processes with.
+    """
+
+    __slots__ = (
+        "logger",
+        "factory",
+        "processes",
+        "limit",
+        "rate_limiter",
+        "context",
+        "_workers",
+        "_results",
+        "_reader",
+        "_futures",
+        "_slots",
+        "_keys",
+    )
+
+    @property
+    def closed(self) -> bool:
+        """Whether the worker processes are stopped."""
+        return self._reader is None
+
+    @property
+    def in_flight(self) -> int:
+        """The current number of requests in flight across all worker processes."""
+        return len(self._futures)
+
+    def __init__(
+            self,
+            factory: HandlerFactory,
+            processes: int | None = None,
+            limit: int = 100,
+            rate_limiter: RateLimiter | None = None,
+            context: BaseContext | str | None = "spawn",
+    ):
+        processes = processes if processes is not None else os.cpu_count() or 1
+        if processes < 1:
+            raise InputError(f"Processes must be at least 1: {processes}")
+        if limit < 1:
+            raise InputError(f"Limit must be at least 1: {limit}")
+
+        #: The :py:class:`logging.Logger` for this  object
+        self.logger: logging.Logger = logging.getLogger(__name__)
+
+        #: Returns a new :py:class:`.RequestHandler` to use in each worker process
+        self.factory = factory
+        #: The number of worker processes to start
+        self.processes = processes
+        #: The maximum number of requests in flight across all worker processes
+        self.limit = limit
+        #: The rate limiter to assign to the handler of every worker process
+        self.rate_limiter = rate_limiter
+        #: The multiprocessing context to start worker processes with
+        self.context = context if isinstance(context, BaseContext) else multiprocessing.get_context(context)
+
+        self._workers: list[_Worker] = []
+        self._results: multiprocessing.Queue | None = None
+        self._reader: asyncio.Task | None = None
+        self._futures: dict[int, asyncio.Future] = {}
+        self._slots: asyncio.Semaphore | None = None
+        self._keys = itertools.count()
+
+    async def __aenter__(self) -> Self:
+        if not self.closed:
+            return self
+
+        try:
+            pickle.dumps(self.factory)
+        except Exception as ex:
+            raise InputError(f"The factory must be picklable to start worker processes: {ex}")
+
+        self._results = self.context.Queue()
+        self._slots = asyncio.Semaphore(self.limit)
+        for _ in range(self.processes):
+            requests = self.context.Queue()
+            process = self.context.Process(
+                target=_run_worker, args=(self.factory, self.rate_limiter, requests, self._results), daemon=True
+            )
+            process.start()
+            self._workers.append(_Worker(process=process, requests=requests))
+
+        self._reader = asyncio.create_task(self._read_results())
+        self.logger.debug(f"Started {self.processes} worker processes")
+        return self
+
+    async def __aexit__(self, __exc_type, __exc_value, __traceback) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Stop all worker processes once all requests in flight have completed."""
+        if self.closed:
+            return
+
+        for worker in self._workers:
+            if worker.process.is_alive():
+                worker.requests.put(None)
+
+        loop = asyncio.get_running_loop()
+        for worker in self._workers:
+            await loop.run_in_executor(None, worker.process.join)
+
+        self._results.put(None)
+        await self._reader
+        self._fail_pending(self._futures, RequestError("The executor was closed before the request completed"))
+
+        for worker in self._workers:
+            worker.requests.close()
+        self._results.close()
+
+        self._workers.clear()
+        self._reader = None
+
+    async def request(self, **kwargs: Unpack[RequestKwargs]) -> Any:
+        """
+        Send a request on the handler of one of the worker processes.
+        See :py:meth:`.RequestHandler.request` for more info on the available kwargs.
+
+        :return: The payload of the response as returned by the handler of the worker process.
+        :raise InputError: If the kwargs cannot be pickled to send to a worker process.
+        :raise RequestError: If the executor is closed, or any request which fails.
+        :raise ResponseError: For any request which returns an invalid response.
+        """
+        if self.closed:
+            raise RequestError("Executor is closed. Enter this object's context to start the worker processes.")
+
+        # pickle here as the queue pickles in a separate thread where any failure would never reach the caller
+        try:
+            data = pickle.dumps(kwargs)
+        except Exception as ex:
+            raise InputError(f"The request kwargs must be picklable to send to a worker process: {ex}")
+
+        await self._slots.acquire()
+        workers = [worker for worker in self._workers if worker.process.is_alive()]
+        if not workers:
+            self._slots.release()
+            raise RequestError("All worker processes have exited")
+
+        worker = min(workers, key=lambda w: len(w.pending))
+        key = next(self._keys)
+
+        future = asyncio.get_running_loop().create_future()
+        future.add_done_callback(lambda _: self._slots.release())  # request is in flight until its result returns
+        self._futures[key] = future
+        worker.pending.add(key)
+        worker.requests.put((key, data))
+
+        # the request continues in the worker process when cancelled so never cancel the future itself
+        return await asyncio.shield(future)
+
+    async def request_many(self, requests: Iterable[RequestKwargs], return_exceptions: bool = False) -> list[Any]:
+        """
+        Send many requests concurrently across all worker processes as per :py:meth:`request`.
+
+        :param requests: The kwargs for each request to send.
+        :param return_exceptions: When True, return any exceptions raised by a request in place of its payload.
+            When False, raise the first exception encountered.
+        :return: The payloads for each request in the order of the given ``requests``.
+        """
+        return list(await asyncio.gather(
+            *(self.request(**request) for request in requests), return_exceptions=return_exceptions
+        ))
+
+    async def get(self, url: URLInput, **kwargs) -> Any:
+        """Sends a GET request."""
+        kwargs.pop("method", None)
+        return await self.request(method="get", url=url, **kwargs)
+
+    async def _read_results(self) -> None:
+        """Set the result of each request from the results of the worker processes until a None message is received."""
+        loop = asyncio.get_running_loop()
+
+        while True:
+            self._check_workers()  # check on every message as results from other workers may never stop arriving
+            try:
+                message = await loop.run_in_executor(None, self._results.get, True, 0.1)
+            except queue.Empty:
+                continue
+
+            if message is None:
+                break
+
+            key, success, value = message
+            for worker in self._workers:
+                worker.pending.discard(key)
+
+            future = self._futures.pop(key, None)
+            if future is None or future.done():
+                continue
+            if success:
+                future.set_result(pickle.loads(value))
+            else:
+                future.set_exception(value)
+
+    def _check_workers(self) -> None:
+        """Fail all pending requests of any worker processes which have exited."""
+        for worker in self._workers:
+            if worker.pending and not worker.process.is_alive():
+                futures = {key: self._futures.pop(key) for key in worker.pending if key in self._futures}
+                worker.pending.clear()
+
+                ex = RequestError(f"Worker process exited unexpectedly with exit code {worker.process.exitcode}")
+                self._fail_pending(futures, ex)
+
+    @staticmethod
+    def _fail_pending(futures: dict[int, asyncio.Future], ex: Exception) -> None:
+        for future in futures.values():
+            if not future.done():
+                future.set_exception(ex)
+        futures.clear()
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(processes={self.processes}, limit={self.limit}, closed={self.closed})"
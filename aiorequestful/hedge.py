@@ -0,0 +1,94 @@
+"""
+Configuration for hedging requests on the :py:class:`.RequestHandler`.
+
+A hedged request is a duplicate of a request which is sent when no response has been received
+for the original request within a given time.
+The first successful response is used and the other request is cancelled,
+reducing the latency of requests which would otherwise be delayed by slow responses from the HTTP service.
+"""
+import math
+from collections import defaultdict, deque
+from collections.abc import Hashable
+from http import HTTPMethod
+
+from yarl import URL
+
+from aiorequestful.budget import RequestBudget
+from aiorequestful.exception import InputError
+from aiorequestful.types import Number, URLInput
+
+#: The methods which may be safely sent more than once without changing the result on the HTTP service.
+IDEMPOTENT_METHODS = frozenset({
+    HTTPMethod.GET, HTTPMethod.HEAD, HTTPMethod.OPTIONS, HTTPMethod.TRACE, HTTPMethod.PUT, HTTPMethod.DELETE
+})
+
+
+class Hedger:
+    """
+    Decides when to send a hedged request for idempotent requests.
+
+    The delay before sending a hedged request is taken from the observed ``quantile`` latency of
+    recent responses for the request's route (i.e. host and path) when enough responses have been observed,
+    or the fixed ``delay`` otherwise.
+
+    :param delay: The time in seconds to wait for a response before sending a hedged request.
+        When a ``quantile`` is also given, only used until enough responses have been observed for a route.
+    :param quantile: The quantile of observed latencies for a route to use as the delay e.g. 0.95 for p95.
+    :param budget: The budget which limits the number of hedged requests that may be sent.
+        Defaults to allowing hedged requests for at most 5% of requests.
+    :param samples: The maximum number of recent latencies to keep for each route.
+    :param min_samples: The minimum number of latencies to observe for a route before using the ``quantile``.
+    """
+
+    __slots__ = ("delay", "quantile", "budget", "min_samples", "_latencies")
+
+    def __init__(
+            self,
+            delay: Number | None = None,
+            quantile: float | None = None,
+            budget: RequestBudget | None = None,
+            samples: int = 100,
+            min_samples: int = 10,
+    ):
+        if delay is None and quantile is None:
+            raise InputError("Either a delay or quantile must be given")
+        if quantile is not None and not 0 < quantile < 1:
+            raise InputError(f"Quantile must be between 0 and 1: {quantile}")
+
+        #: The fixed time in seconds to wait for a response before sending a hedged request
+        self.delay = delay
+        #: The quantile of observed latencies for a route to use as the delay
+        self.quantile = quantile
+        #: The budget which limits the number of hedged requests that may be sent
+        self.budget = budget if budget is not None else RequestBudget(ratio=0.05, minimum=1)
+        #: The minimum number of latencies to observe for a route before using the ``quantile``
+        self.min_samples = min_samples
+
+        self._latencies: defaultdict[Hashable, deque[float]] = defaultdict(lambda: deque(maxlen=samples))
+
+    @staticmethod
+    def get_route(url: URLInput) -> Hashable:
+        """Get the route that the given ``url`` belongs to."""
+        url = URL(url)
+        return url.host, url.path
+
+    def can_hedge(self, method: HTTPMethod) -> bool:
+        """Check whether requests of the given ``method`` may be hedged."""
+        return method in IDEMPOTENT_METHODS
+
+    def get_delay(self, url: URLInput) -> float | None:
+        """
+        Get the time in seconds to wait for a response from the given ``url`` before sending a hedged request.
+
+        :return: The delay, or None if no delay can be determined yet.
+        """
+        latencies = self._latencies.get(self.get_route(url))
+        if self.quantile is None or latencies is None or len(latencies) < self.min_samples:
+            return self.delay
+
+        latencies = sorted(latencies)
+        return latencies[min(math.ceil(self.quantile * len(latencies)), len(latencies)) - 1]
+
+    def record(self, url: URLInput, latency: float) -> None:
+        """Record the ``latency`` in seconds of a successful response from the given ``url``."""
+        self._latencies[self.get_route(url)].append(latency)
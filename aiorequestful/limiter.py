@@ -0,0 +1,555 @@
+"""
+Implementations of limiters to pace and bound requests sent by a :py:class:`.RequestHandler`.
+
+Limiters are shared by all concurrent requests on a :py:class:`.RequestHandler`
+and are acquired before each request is sent such that the combined rate and concurrency of all requests
+does not exceed the configured limits.
+"""
+import asyncio
+import logging
+import multiprocessing
+import sqlite3
+import threading
+import time
+import zlib
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Callable, Hashable, Collection
+from enum import StrEnum
+from http import HTTPMethod
+from multiprocessing.context import BaseContext
+from pathlib import Path
+
+import aiohttp
+from yarl import URL
+
+from aiorequestful.exception import InputError, RateLimiterError
+from aiorequestful.types import Number, URLInput
+
+type RequestCost = Number | Callable[[HTTPMethod, URL], Number]
+
+
+class RateLimitScope(StrEnum):
+    """The scope at which a rate limit applies i.e. which requests share the same rate limit."""
+    #: All requests share the same rate limit.
+    GLOBAL = "global"
+    #: Requests to the same host share the same rate limit.
+    HOST = "host"
+    #: Requests to the same host and path share the same rate limit.
+    ROUTE = "route"
+
+
+class RateLimiter(ABC):
+    """
+    Base interface for all rate limiters.
+
+    :param scope: The scope at which the rate limit applies.
+    :param cost: The cost of each request against the rate limit.
+        May also be a function which returns the cost for a given request's method and URL.
+    """
+
+    __slots__ = ("scope", "_cost")
+
+    def __init__(self, scope: RateLimitScope | str = RateLimitScope.GLOBAL, cost: RequestCost = 1):
+        #: The scope at which the rate limit applies
+        self.scope = RateLimitScope(scope)
+        self._cost = cost
+
+    def get_key(self, method: HTTPMethod, url: URLInput) -> Hashable:
+        """Get the key of the bucket that the given request's ``method`` and ``url`` should acquire from."""
+        match self.scope:
+            case RateLimitScope.HOST:
+                return URL(url).host
+            case RateLimitScope.ROUTE:
+                url = URL(url)
+                return url.host, url.path
+            case _:
+                return None
+
+    def get_cost(self, method: HTTPMethod, url: URLInput) -> Number:
+        """Get the cost of the given request's ``method`` and ``url`` against the rate limit."""
+        if callable(self._cost):
+            return self._cost(method, URL(url))
+        return self._cost
+
+    async def acquire(self, method: HTTPMethod, url: URLInput) -> None:
+        """Wait until the request with the given ``method`` and ``url`` is allowed to be sent."""
+        key = self.get_key(method=method, url=url)
+        cost = self.get_cost(method=method, url=url)
+
+        delay = self._reserve(key=key, cost=cost)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def pause(self, method: HTTPMethod, url: URLInput, delay: Number) -> None:
+        """
+        Pause all requests in the bucket of the given request's ``method`` and ``url`` for ``delay`` seconds
+        e.g. when the HTTP service responds with a rate limit status and a time to wait before retrying.
+        """
+        self._pause(key=self.get_key(method=method, url=url), delay=delay)
+
+    @abstractmethod
+    def _reserve(self, key: Hashable, cost: Number) -> float:
+        """
+        Reserve a slot for a request with the given ``cost`` in the bucket for the given ``key``.
+
+        :return: The time in seconds to wait until the request is allowed to be sent.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def _pause(self, key: Hashable, delay: Number) -> None:
+        """Pause all requests in the bucket for the given ``key`` for ``delay`` seconds."""
+        raise NotImplementedError
+
+
+class GCRARateLimiter(RateLimiter):
+    """
+    Limits requests to a given ``rate`` per ``period`` using the Generic Cell Rate Algorithm (GCRA).
+
+    GCRA is equivalent to a token bucket with a capacity of ``burst`` tokens,
+    refilled at a rate of ``rate`` tokens per ``period``.
+    Slots are reserved in the order in which requests are made such that waiting requests are sent
+    in the order in which they were made.
+
+    :param rate: The number of requests allowed in each ``period``.
+    :param period: The length of the period in seconds.
+    :param burst: The maximum number of requests that may be sent at once after a period of inactivity.
+    :param scope: The scope at which the rate limit applies.
+    :param cost: The cost of each request against the rate limit.
+        May also be a function which returns the cost for a given request's method and URL.
+    """
+
+    __slots__ = ("rate", "period", "burst", "_tat")
+
+    @property
+    def interval(self) -> float:
+        """The time in seconds between requests of cost 1 at the steady rate."""
+        return self.period / self.rate
+
+    def __init__(
+            self,
+            rate: Number,
+            period: Number = 1,
+            burst: int = 1,
+            scope: RateLimitScope | str = RateLimitScope.GLOBAL,
+            cost: RequestCost = 1,
+    ):
+        super().__init__(scope=scope, cost=cost)
+        if rate <= 0 or period <= 0:
+            raise InputError(f"Rate and period must be greater than 0: {rate=}, {period=}")
+        if burst < 1:
+            raise InputError(f"Burst must be at least 1: {burst}")
+
+        #: The number of requests allowed in each ``period``
+        self.rate = rate
+        #: The length of the period in seconds
+        self.period = period
+        #: The maximum number of requests that may be sent at once after a period of inactivity
+        self.burst = burst
+
+        # the theoretical arrival time of the next request for each bucket
+        self._tat: dict[Hashable, float] = {}
+
+    def _reserve(self, key: Hashable, cost: Number) -> float:
+        now = time.monotonic()
+        if len(self._tat) > 1000:  # drop buckets which are already full
+            self._tat = {k: tat for k, tat in self._tat.items() if tat > now}
+
+        tat = max(self._tat.get(key, now), now) + self.interval * cost
+        self._tat[key] = tat
+
+        return tat - self.interval * self.burst - now
+
+    def _get_paused_tat(self, tat: float, now: float, delay: Number) -> float:
+        """Get the theoretical arrival time which allows no requests until ``delay`` seconds after ``now``."""
+        return max(tat, now + delay + self.interval * self.burst)
+
+    def _pause(self, key: Hashable, delay: Number) -> None:
+        now = time.monotonic()
+        self._tat[key] = self._get_paused_tat(self._tat.get(key, now), now=now, delay=delay)
+
+
+class SharedGCRARateLimiter(GCRARateLimiter):
+    """
+    Limits requests to a given ``rate`` per ``period`` using the Generic Cell Rate Algorithm (GCRA)
+    as per :py:class:`GCRARateLimiter`, sharing the rate limit between many processes on the same machine.
+
+    The state of each bucket is kept in shared memory such that the combined rate of all requests sent
+    by all processes which share this limiter does not exceed the configured rate.
+    Share this limiter with other processes by passing it to each process when it is started
+    e.g. through the :py:class:`.ProcessRequestExecutor`.
+
+    Buckets are mapped onto a fixed number of ``slots`` in shared memory.
+    Where two buckets map to the same slot, they share the same rate limit
+    and so the rate limit is never exceeded, but may be reached sooner than expected.
+
+    :param rate: The number of requests allowed in each ``period``.
+    :param period: The length of the period in seconds.
+    :param burst: The maximum number of requests that may be sent at once after a period of inactivity.
+    :param scope: The scope at which the rate limit applies.
+    :param cost: The cost of each request against the rate limit.
+        May also be a function which returns the cost for a given request's method and URL.
+        Must be picklable to be shared with other processes e.g. a module level function.
+    :param slots: The number of slots in shared memory for the buckets of a host or route scoped rate limit.
+    :param context: The multiprocessing context, or the name of the start method, to create the shared memory with.
+        Must be the same context as used to start the processes which share this limiter.
+    """
+
+    __slots__ = ("_shared",)
+
+    def __init__(
+            self,
+            rate: Number,
+            period: Number = 1,
+            burst: int = 1,
+            scope: RateLimitScope | str = RateLimitScope.GLOBAL,
+            cost: RequestCost = 1,
+            slots: int = 256,
+            context: BaseContext | str | None = "spawn",
+    ):
+        super().__init__(rate=rate, period=period, burst=burst, scope=scope, cost=cost)
+        if slots < 1:
+            raise InputError(f"Slots must be at least 1: {slots}")
+
+        context = context if isinstance(context, BaseContext) else multiprocessing.get_context(context)
+        # the theoretical arrival time of the next request for each slot
+        # the monotonic clock is system-wide and so is comparable between processes
+        self._shared = context.Array("d", 1 if self.scope == RateLimitScope.GLOBAL else slots)
+
+    def _get_slot(self, key: Hashable) -> int:
+        """Get the slot in shared memory for the bucket of the given ``key``, consistent between processes."""
+        if len(self._shared) == 1:
+            return 0
+        return zlib.crc32(repr(key).encode()) % len(self._shared)
+
+    def _reserve(self, key: Hashable, cost: Number) -> float:
+        slot = self._get_slot(key)
+
+        with self._shared.get_lock():
+            now = time.monotonic()
+            tat = max(self._shared[slot], now) + self.interval * cost
+            self._shared[slot] = tat
+
+        return tat - self.interval * self.burst - now
+
+    def _pause(self, key: Hashable, delay: Number) -> None:
+        slot = self._get_slot(key)
+
+        with self._shared.get_lock():
+            now = time.monotonic()
+            self._shared[slot] = self._get_paused_tat(self._shared[slot], now=now, delay=delay)
+
+
+class SQLiteGCRARateLimiter(GCRARateLimiter):
+    """
+    Limits requests to a given ``rate`` per ``period`` using the Generic Cell Rate Algorithm (GCRA)
+    as per :py:class:`GCRARateLimiter`, sharing the rate limit between all limiters using the same SQLite database.
+
+    The state of each bucket is kept in a SQLite database and updated atomically in a transaction
+    such that many independent processes on the same host may share one rate limit.
+    Pauses, such as those from rate limit responses of the HTTP service, are also shared
+    such that all processes back off together.
+    Limiters which share a rate limit must use the same ``name`` and should use the same configuration.
+
+    The database is accessed in a separate thread so that waiting on a lock held by another process
+    does not block the event loop.
+    Pauses are written in the background and apply to all requests which acquire from this limiter after the pause.
+    A pause which cannot be written within the ``timeout`` is logged and dropped such that it never fails a request.
+    Requests which cannot reserve from the database raise a :py:class:`.RateLimiterError`.
+    Times are taken from the system clock to be comparable between processes.
+
+    :param path: The path to the SQLite database file. The file is created if it does not exist.
+    :param rate: The number of requests allowed in each ``period``.
+    :param period: The length of the period in seconds.
+    :param burst: The maximum number of requests that may be sent at once after a period of inactivity.
+    :param scope: The scope at which the rate limit applies.
+    :param cost: The cost of each request against the rate limit.
+        May also be a function which returns the cost for a given request's method and URL.
+    :param name: The name of the rate limit in the database.
+    :param timeout: The maximum time in seconds to wait for a lock on the database held by another process.
+    """
+
+    __slots__ = ("logger", "path", "name", "timeout", "_connection", "_lock", "_pauses")
+
+    #: The name of the table which stores the state of each bucket
+    table_name = "rate_limit"
+
+    def __init__(
+            self,
+            path: str | Path,
+            rate: Number,
+            period: Number = 1,
+            burst: int = 1,
+            scope: RateLimitScope | str = RateLimitScope.GLOBAL,
+            cost: RequestCost = 1,
+            name: str = "default",
+            timeout: Number = 5,
+    ):
+        super().__init__(rate=rate, period=period, burst=burst, scope=scope, cost=cost)
+
+        #: The :py:class:`logging.Logger` for this object
+        self.logger: logging.Logger = logging.getLogger(__name__)
+
+        #: The path to the SQLite database file
+        self.path = Path(path)
+        #: The name of the rate limit in the database
+        self.name = name
+        #: The maximum time in seconds to wait for a lock on the database held by another process
+        self.timeout = timeout
+
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self._pauses: set[asyncio.Task] = set()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Get the connection to the database, connecting and creating the table if needed."""
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # transactions are managed explicitly to hold a write lock while reading and updating a bucket
+            connection = sqlite3.connect(
+                self.path, timeout=self.timeout, isolation_level=None, check_same_thread=False
+            )
+            try:
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.execute("PRAGMA synchronous=NORMAL")  # state is short-lived so durability is not needed
+                connection.execute(
+                    f"CREATE TABLE IF NOT EXISTS {self.table_name} ("
+                    "name TEXT NOT NULL, key TEXT NOT NULL, tat REAL NOT NULL, PRIMARY KEY (name, key)"
+                    ")"
+                )
+            except BaseException:  # connect again on the next update
+                connection.close()
+                raise
+            self._connection = connection
+
+        return self._connection
+
+    def close(self) -> None:
+        """Close the connection to the database."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _update(self, key: Hashable, update: Callable[[float, float], float]) -> tuple[float, float]:
+        """
+        Atomically update the theoretical arrival time of the bucket for the given ``key``.
+
+        :param update: Returns the new theoretical arrival time from the current time and theoretical arrival time.
+        :return: The current time and the new theoretical arrival time.
+        """
+        with self._lock:
+            connection = self._connect()
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                row = connection.execute(
+                    f"SELECT tat FROM {self.table_name} WHERE name = ? AND key = ?", (self.name, repr(key))
+                ).fetchone()
+
+                now = time.time()
+                tat = update(now, row[0] if row is not None else now)
+                connection.execute(
+                    f"INSERT INTO {self.table_name} (name, key, tat) VALUES (?, ?, ?) "
+                    "ON CONFLICT (name, key) DO UPDATE SET tat = excluded.tat",
+                    (self.name, repr(key), tat)
+                )
+                connection.execute("COMMIT")
+            except BaseException:
+                if connection.in_transaction:  # SQLite may have already rolled back the transaction on error
+                    connection.execute("ROLLBACK")
+                raise
+
+        return now, tat
+
+    async def acquire(self, method: HTTPMethod, url: URLInput) -> None:
+        key = self.get_key(method=method, url=url)
+        cost = self.get_cost(method=method, url=url)
+
+        if self._pauses:  # apply any pending pauses before reserving
+            await asyncio.wait(self._pauses)
+
+        try:
+            delay = await asyncio.to_thread(self._reserve, key=key, cost=cost)
+        except (sqlite3.Error, OSError) as ex:
+            raise RateLimiterError(f"Failed to acquire rate limit {self.name!r}: {ex}") from ex
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def _reserve(self, key: Hashable, cost: Number) -> float:
+        now, tat = self._update(key, lambda now_, tat_: max(tat_, now_) + self.interval * cost)
+        return tat - self.interval * self.burst - now
+
+    def _pause(self, key: Hashable, delay: Number) -> None:
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:  # no event loop to block, write the pause immediately
+            self._write_pause(key=key, delay=delay)
+            return
+
+        task = asyncio.create_task(asyncio.to_thread(self._write_pause, key=key, delay=delay))
+        self._pauses.add(task)
+        task.add_done_callback(self._pause_done)
+
+    def _pause_done(self, task: asyncio.Task) -> None:
+        """Remove a finished pause, logging any unexpected failure such that it never fails a later request."""
+        self._pauses.discard(task)
+        if not task.cancelled() and (ex := task.exception()) is not None:
+            self.logger.warning(f"Failed to pause rate limit {self.name!r}: {ex!r}")
+
+    def _write_pause(self, key: Hashable, delay: Number) -> None:
+        """Write a pause to the database, logging and dropping the pause when the database cannot be written."""
+        try:
+            self._update(key, lambda now_, tat_: self._get_paused_tat(tat_, now=now_, delay=delay))
+        except (sqlite3.Error, OSError) as ex:
+            self.logger.warning(f"Failed to pause rate limit {self.name!r} for {delay} seconds: {ex}")
+
+
+class AIMDConcurrencyLimiter:
+    """
+    Limits the number of requests in flight, adapting the limit using
+    Additive Increase/Multiplicative Decrease (AIMD) from the observed latency and status of responses.
+
+    The limit is increased by ``increase`` for every ``limit`` successful responses while the limit is being used,
+    and multiplied by ``decrease`` when a response signals the service is overloaded.
+    A response signals the service is overloaded when its status is one of the ``overload_statuses``
+    or its latency is greater than ``latency_tolerance`` times the lowest recently observed latency.
+    The limit is decreased at most once for all requests in flight at the time of the decrease.
+
+    :param initial: The initial limit.
+    :param minimum: The minimum limit.
+    :param maximum: The maximum limit.
+    :param increase: The amount to increase the limit by for every ``limit`` successful responses.
+    :param decrease: The factor to multiply the limit by when the service is overloaded.
+    :param latency_tolerance: The multiple of the lowest recently observed latency above which a response's
+        latency signals the service is overloaded. Latency is ignored when None.
+    :param overload_statuses: The response statuses which signal the service is overloaded.
+    :param samples: The number of recent latencies to keep to find the lowest recently observed latency.
+    """
+
+    __slots__ = (
+        "logger",
+        "minimum",
+        "maximum",
+        "increase",
+        "decrease",
+        "latency_tolerance",
+        "overload_statuses",
+        "_limit",
+        "_in_flight",
+        "_waiters",
+        "_latencies",
+        "_decreased_at",
+    )
+
+    @property
+    def limit(self) -> int:
+        """The current maximum number of requests allowed in flight."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """The current number of requests in flight."""
+        return self._in_flight
+
+    def __init__(
+            self,
+            initial: int = 10,
+            minimum: int = 1,
+            maximum: int = 200,
+            increase: Number = 1,
+            decrease: float = 0.5,
+            latency_tolerance: float | None = 2.0,
+            overload_statuses: Collection[int] = (429, 503),
+            samples: int = 100,
+    ):
+        if not 1 <= minimum <= initial <= maximum:
+            raise InputError(
+                f"Limits must satisfy 1 <= minimum <= initial <= maximum: {minimum=}, {initial=}, {maximum=}"
+            )
+        if not 0 < decrease < 1:
+            raise InputError(f"Decrease must be between 0 and 1: {decrease}")
+
+        #: The :py:class:`logging.Logger` for this  object
+        self.logger: logging.Logger = logging.getLogger(__name__)
+
+        #: The minimum limit
+        self.minimum = minimum
+        #: The maximum limit
+        self.maximum = maximum
+        #: The amount to increase the limit by for every ``limit`` successful responses
+        self.increase = increase
+        #: The factor to multiply the limit by when the service is overloaded
+        self.decrease = decrease
+        #: The multiple of the lowest recently observed latency above which the service is overloaded
+        self.latency_tolerance = latency_tolerance
+        #: The response statuses which signal the service is overloaded
+        self.overload_statuses = frozenset(overload_statuses)
+
+        self._limit: float = initial
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future] = deque()
+        self._latencies: deque[float] = deque(maxlen=samples)
+        self._decreased_at = 0.0
+
+    def is_overloaded(self, response: aiohttp.ClientResponse | BaseException | None) -> bool:
+        """Check whether the given ``response`` signals the service is overloaded."""
+        return isinstance(response, aiohttp.ClientResponse) and response.status in self.overload_statuses
+
+    async def acquire(self) -> float:
+        """
+        Wait until a request is allowed to be sent within the current limit.
+        Every call must be followed by a call to :py:meth:`release` once the request has completed.
+
+        :return: The time at which the request was allowed to be sent.
+        """
+        if self._in_flight >= self.limit or self._waiters:
+            future = asyncio.get_running_loop().create_future()
+            self._waiters.append(future)
+            try:
+                await future
+            except asyncio.CancelledError:
+                if future.done() and not future.cancelled():  # slot was given to this waiter, pass it on
+                    self._in_flight -= 1
+                    self._wake()
+                raise
+            finally:
+                if future in self._waiters:
+                    self._waiters.remove(future)
+        else:
+            self._in_flight += 1
+
+        return time.monotonic()
+
+    def release(self, start: float, latency: float | None = None, overloaded: bool = False) -> None:
+        """
+        Release a request acquired at the given ``start`` time, adapting the limit from its result.
+
+        :param start: The time returned by :py:meth:`acquire` for this request.
+        :param latency: The latency of the response in seconds.
+            Should be None when the response did not come from the service e.g. a cached response.
+        :param overloaded: Whether the response signalled the service is overloaded.
+        """
+        if latency is not None and self.latency_tolerance is not None:
+            if self._latencies and latency > min(self._latencies) * self.latency_tolerance:
+                overloaded = True
+            self._latencies.append(latency)
+
+        if overloaded:
+            if start >= self._decreased_at:  # only decrease once for all requests in flight at the last decrease
+                self._limit = max(self._limit * self.decrease, self.minimum)
+                self._decreased_at = time.monotonic()
+                self.logger.debug(f"Service is overloaded: decreased concurrency limit to {self.limit}")
+        elif latency is not None and self._in_flight * 2 >= self._limit:  # only increase when the limit is used
+            self._limit = min(self._limit + self.increase / self._limit, self.maximum)
+
+        self._in_flight -= 1
+        self._wake()
+
+    def _wake(self) -> None:
+        """Allow waiting requests to be sent up to the current limit."""
+        while self._waiters and self._in_flight < self.limit:
+            future = self._waiters.popleft()
+            if not future.done():
+                self._in_flight += 1
+                future.set_result(None)
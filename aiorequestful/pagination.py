@@ -0,0 +1,262 @@
+"""
+Strategies for paginating through collections of items on HTTP services with the :py:class:`.RequestHandler`.
+
+Each strategy builds the request for the next page of a collection from the request and response of the
+current page. Where the total number of items can be found from the first page, the strategy may also build the
+requests for all remaining pages up front such that these pages can be requested concurrently.
+"""
+from abc import ABC, abstractmethod
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+import aiohttp
+from yarl import URL
+
+from aiorequestful.exception import InputError
+from aiorequestful.types import RequestKwargs
+
+
+class Paginator(ABC):
+    """
+    Base interface for all pagination strategies.
+
+    :param items_key: The key of the items of each page in the payload.
+        Use dots to separate the keys of nested objects e.g. ``data.items``.
+        When None, the payload itself is the sequence of items.
+    """
+
+    __slots__ = ("items_key",)
+
+    def __init__(self, items_key: str | None = "items"):
+        #: The key of the items of each page in the payload
+        self.items_key = items_key
+
+    @staticmethod
+    def get_value(payload: Any, key: str | None) -> Any:
+        """
+        Get the value for the given ``key`` from the given ``payload``.
+        Use dots to separate the keys of nested objects.
+
+        :return: The value or None if the key is not found.
+        """
+        if key is None:
+            return payload
+
+        for part in key.split("."):
+            if not isinstance(payload, Mapping) or part not in payload:
+                return
+            payload = payload[part]
+
+        return payload
+
+    def get_items(self, payload: Any) -> Sequence[Any]:
+        """Get the items of the page from the given ``payload``."""
+        items = self.get_value(payload, self.items_key)
+        if items is None:
+            return []
+        if not isinstance(items, Sequence) or isinstance(items, str | bytes):
+            raise InputError(f"Items of page are not a sequence: {type(items).__name__}")
+        return items
+
+    def get_first(self, request: RequestKwargs) -> RequestKwargs:
+        """Get the request for the first page from the given ``request``."""
+        return request
+
+    @abstractmethod
+    def get_next(
+            self, request: RequestKwargs, response: aiohttp.ClientResponse, payload: Any
+    ) -> RequestKwargs | None:
+        """
+        Get the request for the next page from the ``request``, ``response`` and ``payload`` of the current page.
+
+        :return: The request for the next page or None if there are no more pages.
+        """
+        raise NotImplementedError
+
+    def get_remaining(
+            self, request: RequestKwargs, response: aiohttp.ClientResponse, payload: Any
+    ) -> list[RequestKwargs] | None:
+        """
+        Get the requests for all remaining pages from the ``request``, ``response`` and ``payload``
+        of the first page when the total number of items is known.
+
+        :return: The requests for all remaining pages in order or None if the total number of items is not known.
+        """
+        return
+
+
+class OffsetPaginator(Paginator):
+    """
+    Paginates through a collection by setting the offset and limit query parameters of each request.
+
+    When the total number of items is given in the payload of the first page,
+    all remaining pages are requested concurrently.
+
+    :param limit: The number of items to request for each page.
+    :param offset_param: The name of the query parameter for the offset.
+    :param limit_param: The name of the query parameter for the limit.
+    :param total_key: The key of the total number of items in the payload.
+        Use dots to separate the keys of nested objects. When None, pages are always requested one at a time.
+    :param start: The offset of the first page.
+    :param items_key: The key of the items of each page in the payload.
+        Use dots to separate the keys of nested objects e.g. ``data.items``.
+        When None, the payload itself is the sequence of items.
+    """
+
+    __slots__ = ("limit", "offset_param", "limit_param", "total_key", "start")
+
+    def __init__(
+            self,
+            limit: int = 50,
+            offset_param: str = "offset",
+            limit_param: str = "limit",
+            total_key: str | None = "total",
+            start: int = 0,
+            items_key: str | None = "items",
+    ):
+        super().__init__(items_key=items_key)
+        if limit < 1:
+            raise InputError(f"Limit must be at least 1: {limit}")
+
+        #: The number of items to request for each page
+        self.limit = limit
+        #: The name of the query parameter for the offset
+        self.offset_param = offset_param
+        #: The name of the query parameter for the limit
+        self.limit_param = limit_param
+        #: The key of the total number of items in the payload
+        self.total_key = total_key
+        #: The offset of the first page
+        self.start = start
+
+    def _get_request(self, request: RequestKwargs, offset: int) -> RequestKwargs:
+        params = dict(request.get("params") or {}) | {self.offset_param: offset, self.limit_param: self.limit}
+        return request | {"params": params}
+
+    def _get_offset(self, request: RequestKwargs) -> int:
+        return int(request["params"][self.offset_param])
+
+    def _get_total(self, payload: Any) -> int | None:
+        total = self.get_value(payload, self.total_key) if self.total_key is not None else None
+        return int(total) if total is not None else None
+
+    def get_first(self, request: RequestKwargs) -> RequestKwargs:
+        return self._get_request(request, offset=self.start)
+
+    def get_next(
+            self, request: RequestKwargs, response: aiohttp.ClientResponse, payload: Any
+    ) -> RequestKwargs | None:
+        if len(self.get_items(payload)) < self.limit:
+            return
+
+        offset = self._get_offset(request) + self.limit
+        total = self._get_total(payload)
+        if total is not None and offset >= total:
+            return
+
+        return self._get_request(request, offset=offset)
+
+    def get_remaining(
+            self, request: RequestKwargs, response: aiohttp.ClientResponse, payload: Any
+    ) -> list[RequestKwargs] | None:
+        total = self._get_total(payload)
+        if total is None:
+            return
+
+        offsets = range(self._get_offset(request) + self.limit, total, self.limit)
+        return [self._get_request(request, offset=offset) for offset in offsets]
+
+
+class CursorPaginator(Paginator):
+    """
+    Paginates through a collection by setting the cursor query parameter of each request
+    to the cursor given in the payload of the previous page.
+
+    :param cursor_key: The key of the cursor for the next page in the payload.
+        Use dots to separate the keys of nested objects.
+    :param cursor_param: The name of the query parameter for the cursor.
+    :param items_key: The key of the items of each page in the payload.
+        Use dots to separate the keys of nested objects e.g. ``data.items``.
+        When None, the payload itself is the sequence of items.
+    """
+
+    __slots__ = ("cursor_key", "cursor_param")
+
+    def __init__(self, cursor_key: str = "next_cursor", cursor_param: str = "cursor", items_key: str | None = "items"):
+        super().__init__(items_key=items_key)
+
+        #: The key of the cursor for the next page in the payload
+        self.cursor_key = cursor_key
+        #: The name of the query parameter for the cursor
+        self.cursor_param = cursor_param
+
+    def get_next(
+            self, request: RequestKwargs, response: aiohttp.ClientResponse, payload: Any
+    ) -> RequestKwargs | None:
+        cursor = self.get_value(payload, self.cursor_key)
+        if cursor is None or cursor == "":
+            return
+
+        params = dict(request.get("params") or {}) | {self.cursor_param: cursor}
+        return request | {"params": params}
+
+
+class NextURLPaginator(Paginator):
+    """
+    Paginates through a collection by requesting the URL of the next page given in the payload of each page.
+
+    :param next_key: The key of the URL of the next page in the payload.
+        Use dots to separate the keys of nested objects. Relative URLs are resolved against the URL of the request.
+    :param items_key: The key of the items of each page in the payload.
+        Use dots to separate the keys of nested objects e.g. ``data.items``.
+        When None, the payload itself is the sequence of items.
+    """
+
+    __slots__ = ("next_key",)
+
+    def __init__(self, next_key: str = "next", items_key: str | None = "items"):
+        super().__init__(items_key=items_key)
+
+        #: The key of the URL of the next page in the payload
+        self.next_key = next_key
+
+    def get_next(
+            self, request: RequestKwargs, response: aiohttp.ClientResponse, payload: Any
+    ) -> RequestKwargs | None:
+        url = self.get_value(payload, self.next_key)
+        if not url:
+            return
+
+        request = {key: value for key, value in request.items() if key != "params"}  # params are given in the URL
+        return request | {"url": URL(str(response.url)).join(URL(url))}
+
+
+class LinkHeaderPaginator(Paginator):
+    """
+    Paginates through a collection by requesting the URL of the next page given in the ``Link`` header of each page.
+
+    Responses returned from the cache do not store headers and so pagination stops at the first cached page.
+
+    :param rel: The relation type of the link to the next page.
+    :param items_key: The key of the items of each page in the payload.
+        Use dots to separate the keys of nested objects e.g. ``data.items``.
+        When None, the payload itself is the sequence of items.
+    """
+
+    __slots__ = ("rel",)
+
+    def __init__(self, rel: str = "next", items_key: str | None = None):
+        super().__init__(items_key=items_key)
+
+        #: The relation type of the link to the next page
+        self.rel = rel
+
+    def get_next(
+            self, request: RequestKwargs, response: aiohttp.ClientResponse, payload: Any
+    ) -> RequestKwargs | None:
+        link = response.links.get(self.rel)
+        if not link:
+            return
+
+        request = {key: value for key, value in request.items() if key != "params"}  # params are given in the URL
+        return request | {"url": URL(str(response.url)).join(link["url"])}
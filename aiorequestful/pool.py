@@ -0,0 +1,367 @@
+"""
+Configuration and monitoring of the pool of connections used by a :py:class:`.RequestHandler`.
+
+The connection pool bounds the number of open connections and keeps idle connections alive for reuse.
+When the pool is the bottleneck, requests spend time waiting for a free connection before being sent.
+The live statistics of the pool show whether requests are bound by the pool or by the network.
+
+Connections may also be opened to known hosts up front such that the first requests to these hosts
+do not wait on DNS resolution and the TCP and TLS handshakes.
+"""
+import asyncio
+import logging
+import time
+from collections.abc import Iterable
+from http import HTTPMethod
+from types import SimpleNamespace
+from typing import Any, Self
+
+import aiohttp
+from yarl import URL
+
+from aiorequestful._utils import format_url_log
+from aiorequestful.exception import InputError
+from aiorequestful.types import Number, URLInput
+
+
+class ConnectionPoolStats:
+    """
+    A snapshot of the live statistics of a :py:class:`ConnectionPool`.
+
+    :param limit: The maximum number of connections allowed in use at once. 0 when unlimited.
+    :param limit_per_host: The maximum number of connections to the same host allowed in use at once.
+        0 when unlimited.
+    :param in_use: The number of connections currently in use.
+    :param idle: The number of open connections currently kept alive for reuse.
+    :param waiting: The number of requests currently waiting for a free connection.
+    :param created: The number of new connections opened.
+    :param reused: The number of idle connections reused.
+    :param queued: The number of requests which waited for a free connection.
+    :param wait_time: The total time in seconds requests spent waiting for a free connection.
+    :param max_wait_time: The longest time in seconds a request spent waiting for a free connection.
+    """
+
+    __slots__ = (
+        "limit",
+        "limit_per_host",
+        "in_use",
+        "idle",
+        "waiting",
+        "created",
+        "reused",
+        "queued",
+        "wait_time",
+        "max_wait_time",
+    )
+
+    @property
+    def acquired(self) -> int:
+        """The number of connections acquired for requests."""
+        return self.created + self.reused
+
+    @property
+    def mean_wait_time(self) -> float:
+        """The mean time in seconds each acquired connection spent waiting for a free connection."""
+        return self.wait_time / self.acquired if self.acquired else 0.0
+
+    def __init__(
+            self,
+            limit: int = 0,
+            limit_per_host: int = 0,
+            in_use: int = 0,
+            idle: int = 0,
+            waiting: int = 0,
+            created: int = 0,
+            reused: int = 0,
+            queued: int = 0,
+            wait_time: float = 0.0,
+            max_wait_time: float = 0.0,
+    ):
+        #: The maximum number of connections allowed in use at once. 0 when unlimited
+        self.limit = limit
+        #: The maximum number of connections to the same host allowed in use at once. 0 when unlimited
+        self.limit_per_host = limit_per_host
+        #: The number of connections currently in use
+        self.in_use = in_use
+        #: The number of open connections currently kept alive for reuse
+        self.idle = idle
+        #: The number of requests currently waiting for a free connection
+        self.waiting = waiting
+        #: The number of new connections opened
+        self.created = created
+        #: The number of idle connections reused
+        self.reused = reused
+        #: The number of requests which waited for a free connection
+        self.queued = queued
+        #: The total time in seconds requests spent waiting for a free connection
+        self.wait_time = wait_time
+        #: The longest time in seconds a request spent waiting for a free connection
+        self.max_wait_time = max_wait_time
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}("
+            f"in_use={self.in_use}, idle={self.idle}, waiting={self.waiting}, limit={self.limit}, "
+            f"acquired={self.acquired}, reused={self.reused}, queued={self.queued}, "
+            f"mean_wait_time={self.mean_wait_time:.4f}, max_wait_time={self.max_wait_time:.4f})"
+        )
+
+
+class ConnectionPool:
+    """
+    Configures the connector of the session of a :py:class:`.RequestHandler` and monitors its pool of connections.
+
+    Pass to :py:meth:`.RequestHandler.create` to create each new session with a connector from this configuration.
+    Live statistics are then available from :py:attr:`stats` for the connector of the latest session.
+
+    :param limit: The maximum number of connections allowed in use at once. 0 for unlimited.
+    :param limit_per_host: The maximum number of connections to the same host allowed in use at once.
+        0 for unlimited.
+    :param keepalive_timeout: The time in seconds to keep idle connections alive for reuse.
+        Ignored when ``force_close`` is True.
+    :param ttl_dns_cache: The time in seconds to cache resolved DNS entries. None to cache forever.
+    :param use_dns_cache: Whether to cache resolved DNS entries.
+    :param force_close: Whether to close each connection after its request instead of keeping it alive for reuse.
+    :param enable_cleanup_closed: Whether to forcibly clean up closed SSL transports.
+        Only needed on Python versions affected by leaked SSL transports and otherwise ignored by aiohttp.
+    :param connector_kwargs: Any other kwargs to pass to :py:class:`aiohttp.TCPConnector`.
+    """
+
+    __slots__ = (
+        "limit",
+        "limit_per_host",
+        "keepalive_timeout",
+        "ttl_dns_cache",
+        "use_dns_cache",
+        "force_close",
+        "enable_cleanup_closed",
+        "connector_kwargs",
+        "_connector",
+        "_stats",
+    )
+
+    @classmethod
+    def bulk_crawl(cls, **kwargs) -> Self:
+        """
+        Create a configuration for sending many requests to many hosts.
+        Allows many connections at once while bounding the connections to each host,
+        and caches DNS entries for longer to avoid resolving the same hosts repeatedly.
+
+        :param kwargs: Overrides for any of the configuration.
+        """
+        config = dict(limit=500, limit_per_host=20, keepalive_timeout=30, ttl_dns_cache=300)
+        return cls(**config | kwargs)
+
+    @classmethod
+    def low_latency(cls, **kwargs) -> Self:
+        """
+        Create a configuration for sending requests to few hosts as quickly as possible.
+        Keeps idle connections alive for longer and caches DNS entries for longer
+        such that requests rarely wait on a new connection or a DNS lookup.
+
+        :param kwargs: Overrides for any of the configuration.
+        """
+        config = dict(limit=100, limit_per_host=0, keepalive_timeout=120, ttl_dns_cache=600)
+        return cls(**config | kwargs)
+
+    @property
+    def stats(self) -> ConnectionPoolStats:
+        """A snapshot of the live statistics of the connector of the latest session."""
+        stats = self._stats
+        snapshot = ConnectionPoolStats(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            created=stats.created,
+            reused=stats.reused,
+            queued=stats.queued,
+            wait_time=stats.wait_time,
+            max_wait_time=stats.max_wait_time,
+        )
+
+        connector = self._connector
+        if connector is not None and not connector.closed:
+            # noinspection PyProtectedMember
+            snapshot.in_use = len(connector._acquired)
+            # noinspection PyProtectedMember
+            snapshot.idle = sum(map(len, connector._conns.values()))
+            # noinspection PyProtectedMember
+            snapshot.waiting = sum(map(len, connector._waiters.values()))
+
+        return snapshot
+
+    def __init__(
+            self,
+            limit: int = 100,
+            limit_per_host: int = 0,
+            keepalive_timeout: Number = 15,
+            ttl_dns_cache: int | None = 10,
+            use_dns_cache: bool = True,
+            force_close: bool = False,
+            enable_cleanup_closed: bool = False,
+            **connector_kwargs: Any,
+    ):
+        if limit < 0 or limit_per_host < 0:
+            raise InputError(f"Limits must be at least 0: {limit=}, {limit_per_host=}")
+        if keepalive_timeout < 0:
+            raise InputError(f"Keepalive timeout must be at least 0: {keepalive_timeout}")
+
+        #: The maximum number of connections allowed in use at once. 0 for unlimited
+        self.limit = limit
+        #: The maximum number of connections to the same host allowed in use at once. 0 for unlimited
+        self.limit_per_host = limit_per_host
+        #: The time in seconds to keep idle connections alive for reuse
+        self.keepalive_timeout = keepalive_timeout
+        #: The time in seconds to cache resolved DNS entries. None to cache forever
+        self.ttl_dns_cache = ttl_dns_cache
+        #: Whether to cache resolved DNS entries
+        self.use_dns_cache = use_dns_cache
+        #: Whether to close each connection after its request instead of keeping it alive for reuse
+        self.force_close = force_close
+        #: Whether to forcibly clean up closed SSL transports
+        self.enable_cleanup_closed = enable_cleanup_closed
+        #: Any other kwargs to pass to :py:class:`aiohttp.TCPConnector`
+        self.connector_kwargs = connector_kwargs
+
+        self._connector: aiohttp.TCPConnector | None = None
+        self._stats = ConnectionPoolStats()
+
+    def create_connector(self) -> aiohttp.TCPConnector:
+        """
+        Create a new connector from this configuration.
+        Live statistics are reset and then taken from this connector.
+        Must be called from within a running event loop.
+        """
+        kwargs = dict(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            ttl_dns_cache=self.ttl_dns_cache,
+            use_dns_cache=self.use_dns_cache,
+            force_close=self.force_close,
+            enable_cleanup_closed=self.enable_cleanup_closed,
+        )
+        if not self.force_close:  # aiohttp rejects a keepalive timeout when connections are not kept alive
+            kwargs["keepalive_timeout"] = self.keepalive_timeout
+
+        self._connector = aiohttp.TCPConnector(**kwargs | self.connector_kwargs)
+        self._stats = ConnectionPoolStats()
+        return self._connector
+
+    def create_trace_config(self) -> aiohttp.TraceConfig:
+        """Create a trace config to pass to the session which records the statistics of acquired connections."""
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_connection_queued_start.append(self._on_queued_start)
+        trace_config.on_connection_queued_end.append(self._on_queued_end)
+        trace_config.on_connection_create_end.append(self._on_create_end)
+        trace_config.on_connection_reuseconn.append(self._on_reuse)
+        return trace_config
+
+    def get_session_kwargs(self) -> dict[str, Any]:
+        """
+        Get the kwargs to pass to a new session to use a new connector from this configuration
+        and record the statistics of its connections.
+        """
+        return dict(connector=self.create_connector(), trace_configs=[self.create_trace_config()])
+
+    async def _on_queued_start(self, _: aiohttp.ClientSession, context: SimpleNamespace, __: Any) -> None:
+        context.pool_queued_at = time.monotonic()
+
+    async def _on_queued_end(self, _: aiohttp.ClientSession, context: SimpleNamespace, __: Any) -> None:
+        wait_time = time.monotonic() - context.pool_queued_at
+        self._stats.queued += 1
+        self._stats.wait_time += wait_time
+        self._stats.max_wait_time = max(self._stats.max_wait_time, wait_time)
+
+    async def _on_create_end(self, *_) -> None:
+        self._stats.created += 1
+
+    async def _on_reuse(self, *_) -> None:
+        self._stats.reused += 1
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}("
+            f"limit={self.limit}, limit_per_host={self.limit_per_host}, keepalive_timeout={self.keepalive_timeout}, "
+            f"ttl_dns_cache={self.ttl_dns_cache}, force_close={self.force_close})"
+        )
+
+
+class ConnectionWarmer:
+    """
+    Opens connections to known hosts up front, keeping them idle in the pool of the session for reuse
+    by the first requests to these hosts.
+
+    Assign to a :py:class:`.RequestHandler` to warm up connections each time a new session is started,
+    concurrently with authorisation.
+    Warming up is best effort: connections which cannot be opened are logged and skipped.
+
+    :param urls: URLs of the hosts to open connections to. Only the scheme, host, and port of each URL are used.
+    :param connections: The number of connections to open to each host.
+        Bounded by the total and per-host limits of the connector.
+    :param timeout: The maximum time in seconds to spend opening each connection.
+    """
+
+    __slots__ = ("logger", "urls", "connections", "timeout")
+
+    def __init__(self, urls: Iterable[URLInput], connections: int = 1, timeout: Number = 10):
+        if connections < 1:
+            raise InputError(f"Connections must be at least 1: {connections}")
+        if timeout <= 0:
+            raise InputError(f"Timeout must be greater than 0: {timeout}")
+
+        #: The :py:class:`logging.Logger` for this  object
+        self.logger: logging.Logger = logging.getLogger(__name__)
+
+        #: URLs of the origins (i.e. scheme, host, and port) to open connections to
+        self.urls: list[URL] = list(dict.fromkeys(URL(url).origin() for url in urls))
+        #: The number of connections to open to each host
+        self.connections = connections
+        #: The maximum time in seconds to spend opening each connection
+        self.timeout = timeout
+
+    async def warm_up(self, session: aiohttp.ClientSession) -> int:
+        """
+        Open connections to each host on the connector of the given ``session`` and release them to its pool.
+
+        :return: The number of connections opened.
+        """
+        connector = session.connector
+        if connector is None or connector.closed or connector.force_close:  # connections would not be kept alive
+            return 0
+
+        remaining = connector.limit or None
+        counts: dict[URL, int] = {}
+        for url in self.urls:
+            count = min(self.connections, connector.limit_per_host or self.connections, remaining or self.connections)
+            if count <= 0:
+                break
+
+            counts[url] = count
+            if remaining is not None:
+                remaining -= count
+
+        # hold all connections open until all are opened so that each host gets new rather than reused connections
+        connections = await asyncio.gather(
+            *(self._connect(session, url) for url, count in counts.items() for _ in range(count))
+        )
+        for connection in connections:
+            if connection is not None:
+                connection.release()
+
+        opened = sum(connection is not None for connection in connections)
+        self.logger.debug(f"Warmed up {opened} connections to {len(counts)} hosts")
+        return opened
+
+    async def _connect(self, session: aiohttp.ClientSession, url: URL) -> aiohttp.connector.Connection | None:
+        """Open a connection to the host of the given ``url`` as would be opened for a request to this URL."""
+        request = aiohttp.ClientRequest(
+            HTTPMethod.GET.name, url, loop=asyncio.get_running_loop(), session=session, ssl=True
+        )
+        timeout = aiohttp.ClientTimeout(total=self.timeout, connect=self.timeout)
+
+        try:
+            return await session.connector.connect(request, traces=[], timeout=timeout)
+        except (aiohttp.ClientError, OSError, asyncio.TimeoutError) as ex:
+            self.logger.debug(f"Could not warm up connection: {format_url_log(HTTPMethod.GET, url, repr(ex))}")
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(urls={[str(url) for url in self.urls]}, connections={self.connections})"
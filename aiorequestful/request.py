@@ -6,34 +6,80 @@ including using authorisation and caching as necessary.
 """
 from __future__ import annotations
 
+import asyncio
 import contextlib
+import functools
+import hashlib
 import inspect
 import json
 import logging
-from collections.abc import Mapping, Callable, Sequence
+import time
+from collections import defaultdict, deque
+from collections.abc import Mapping, Callable, Sequence, Iterable, AsyncIterable, AsyncGenerator, Hashable, Awaitable
 from copy import deepcopy
+from dataclasses import dataclass, field
 from http import HTTPMethod
+from pathlib import Path
 from typing import Any, Self, Unpack
 from urllib.parse import unquote
 
 import aiohttp
 from yarl import URL
 
-from aiorequestful._utils import format_url_log
+from aiorequestful._utils import format_url_log, get_async_iterator
 from aiorequestful.auth import Authoriser
+from aiorequestful.body import RequestBody, RequestBodyPayload
+from aiorequestful.breaker import CircuitBreaker
+from aiorequestful.budget import RequestBudget
 from aiorequestful.cache.backend import ResponseCache
+from aiorequestful.cache.response import CachedResponse
 from aiorequestful.cache.session import CachedSession
-from aiorequestful.exception import RequestError
-from aiorequestful.response.exception import ResponseError
-from aiorequestful.response.payload import StringPayloadHandler, PayloadHandler
+from aiorequestful.exception import RequestError, InputError, DeadlineExceededError
+from aiorequestful.hedge import Hedger
+from aiorequestful.limiter import RateLimiter, AIMDConcurrencyLimiter
+from aiorequestful.pagination import Paginator
+from aiorequestful.pool import ConnectionPool, ConnectionWarmer
+from aiorequestful.response.exception import ResponseError, PayloadHandlerError
+from aiorequestful.response.payload import StringPayloadHandler, PayloadHandler, StreamingJSONPayloadHandler, \
+    FilePayloadHandler
 from aiorequestful.response.status import StatusHandler, ClientErrorStatusHandler, UnauthorisedStatusHandler, \
     RateLimitStatusHandler
+from aiorequestful.scheduler import RequestScheduler
 from aiorequestful.timer import Timer
-from aiorequestful.types import URLInput, Headers, RequestKwargs
+from aiorequestful.types import URLInput, Headers, RequestKwargs, Number
 
 _DEFAULT_RESPONSE_HANDLERS = [
     UnauthorisedStatusHandler(), RateLimitStatusHandler(), ClientErrorStatusHandler()
 ]
+# methods that do not change state on the service so the responses of identical requests may be shared
+_SAFE_METHODS = frozenset({HTTPMethod.GET, HTTPMethod.HEAD, HTTPMethod.OPTIONS})
+
+# sentinel to identify when a response's payload has not been extracted
+_NO_PAYLOAD = object()
+
+
+@dataclass
+class _AttemptTiming:
+    """The time at which one attempt of a request was sent to the network once any rate limit was acquired."""
+    sent_at: float | None = None
+    sent: asyncio.Event = field(default_factory=asyncio.Event)
+
+    @property
+    def elapsed(self) -> float | None:
+        """The time in seconds since the attempt was sent, or None if it was never sent."""
+        if self.sent_at is not None:
+            return time.monotonic() - self.sent_at
+
+    def mark_sent(self) -> None:
+        """Record the attempt as sent, keeping the time of the first send only."""
+        if self.sent_at is None:
+            self.sent_at = time.monotonic()
+            self.sent.set()
+
+
+#: The default maximum number of concurrent requests to run when sending many requests
+#: and the session's connector does not define a limit.
+DEFAULT_CONCURRENCY_LIMIT = 100
 
 
 class RequestHandler[A: Authoriser, P: Any]:
@@ -54,6 +100,31 @@ class RequestHandler[A: Authoriser, P: Any]:
     :param retry_timer: The timer that controls how long to wait in between each successive failed request.
         It is best practice to configure this such that a maximum time can be achieved
         within a reasonable time to cause a timeout and raise an exception.
+    :param rate_limiter: The rate limiter to acquire from before sending every request.
+        This is shared by all concurrent requests on this handler and so limits the combined rate of all requests.
+        Responses returned from the cache do not acquire from the rate limiter.
+    :param single_flight: When True, identical concurrent GET, HEAD, and OPTIONS requests share one in-flight request
+        and its payload. Requests are identical when their method, URL, params, headers, and body are the same.
+    :param hedger: Configures when to send a hedged (i.e. duplicate) request for idempotent requests
+        which have not received a response within a given time.
+    :param circuit_breaker: Fails requests immediately without sending them when too many consecutive requests
+        to the same host have failed, until the host has had time to recover.
+    :param concurrency_limiter: Limits the number of requests in flight on this handler,
+        adapting the limit from the observed latency and status of responses.
+    :param retry_budget: Limits the number of retries across all requests on this handler to a ratio of
+        recent requests. Requests fail immediately instead of retrying when the budget is exhausted.
+        May be shared by many handlers to apply one budget across all of them.
+    :param deadline: The default maximum time in seconds to spend on each request including all retries and waits.
+        Each attempt of a request is given the time remaining until the deadline as its total timeout,
+        and retries which cannot start before the deadline are not attempted.
+    :param scheduler: Shares the capacity of this handler between lanes of requests e.g. interactive and bulk lanes,
+        dispatching waiting requests from each lane using weighted fair queueing.
+    :param connection_warmer: Opens connections to known hosts each time a new session is started,
+        concurrently with authorisation, such that the first requests to these hosts do not wait on new connections.
+    :param persistent: When True, the session and its authorisation are kept open after the last context exits
+        such that the pool of connections and credentials are reused by the next entry.
+        The session is then only closed by calling :py:meth:`close`.
+        Idle connections are still closed by the connector after its keepalive timeout.
     """
 
     __slots__ = (
@@ -66,6 +137,19 @@ class RequestHandler[A: Authoriser, P: Any]:
         "wait_timer",
         "_retry_timer",
         "_retry_logged",
+        "rate_limiter",
+        "single_flight",
+        "_in_flight",
+        "hedger",
+        "circuit_breaker",
+        "concurrency_limiter",
+        "retry_budget",
+        "deadline",
+        "scheduler",
+        "connection_warmer",
+        "persistent",
+        "_entered",
+        "_enter_lock",
     )
 
     @property
@@ -128,14 +212,36 @@ class RequestHandler[A: Authoriser, P: Any]:
             response_handlers: Sequence[StatusHandler] = None,
             wait_timer: Timer = None,
             retry_timer: Timer = None,
+            rate_limiter: RateLimiter = None,
+            single_flight: bool = False,
+            hedger: Hedger = None,
+            circuit_breaker: CircuitBreaker = None,
+            concurrency_limiter: AIMDConcurrencyLimiter = None,
+            retry_budget: RequestBudget = None,
+            deadline: Number | None = None,
+            scheduler: RequestScheduler = None,
+            connection_warmer: ConnectionWarmer = None,
+            persistent: bool = False,
+            pool: ConnectionPool = None,
             **session_kwargs
     ) -> RequestHandler[A, P]:
-        """Create a new :py:class:`RequestHandler` with an appropriate session ``connector`` given the input kwargs"""
+        """
+        Create a new :py:class:`RequestHandler` with an appropriate session ``connector`` given the input kwargs
+
+        :param pool: Configures the connector of each new session and monitors its pool of connections.
+            Takes precedence over any ``connector`` given in the ``session_kwargs``.
+        """
         def connector() -> aiohttp.ClientSession:
             """Create an appropriate session ``connector`` given the input kwargs"""
+            kwargs = dict(session_kwargs)
+            if pool is not None:
+                pool_kwargs = pool.get_session_kwargs()
+                kwargs["connector"] = pool_kwargs["connector"]
+                kwargs["trace_configs"] = [*(kwargs.get("trace_configs") or ()), *pool_kwargs["trace_configs"]]
+
             if cache is not None:
-                return CachedSession(cache=cache, **session_kwargs)
-            return aiohttp.ClientSession(**session_kwargs)
+                return CachedSession(cache=cache, **kwargs)
+            return aiohttp.ClientSession(**kwargs)
 
         return cls(
             connector=connector,
@@ -144,6 +250,16 @@ class RequestHandler[A: Authoriser, P: Any]:
             response_handlers=response_handlers,
             wait_timer=wait_timer,
             retry_timer=retry_timer,
+            rate_limiter=rate_limiter,
+            single_flight=single_flight,
+            hedger=hedger,
+            circuit_breaker=circuit_breaker,
+            concurrency_limiter=concurrency_limiter,
+            retry_budget=retry_budget,
+            deadline=deadline,
+            scheduler=scheduler,
+            connection_warmer=connection_warmer,
+            persistent=persistent,
         )
 
     def __init__(
@@ -154,6 +270,16 @@ class RequestHandler[A: Authoriser, P: Any]:
             response_handlers: Sequence[StatusHandler] = None,
             wait_timer: Timer = None,
             retry_timer: Timer = None,
+            rate_limiter: RateLimiter = None,
+            single_flight: bool = False,
+            hedger: Hedger = None,
+            circuit_breaker: CircuitBreaker = None,
+            concurrency_limiter: AIMDConcurrencyLimiter = None,
+            retry_budget: RequestBudget = None,
+            deadline: Number | None = None,
+            scheduler: RequestScheduler = None,
+            connection_warmer: ConnectionWarmer = None,
+            persistent: bool = False,
     ):
         #: The :py:class:`logging.Logger` for this  object
         self.logger: logging.Logger = logging.getLogger(__name__)
@@ -173,30 +299,88 @@ class RequestHandler[A: Authoriser, P: Any]:
         #: The time to wait after every request, regardless of whether it was successful
         self.wait_timer = wait_timer
         self._retry_timer = retry_timer
+        #: The rate limiter to acquire from before sending every request
+        self.rate_limiter = rate_limiter
+        #: Whether identical concurrent requests share one in-flight request and its payload
+        self.single_flight = single_flight
+        self._in_flight: dict[Hashable, list[asyncio.Task[tuple[aiohttp.ClientResponse, P]] | int]] = {}
+        #: Configures when to send a hedged request for idempotent requests
+        self.hedger = hedger
+        #: Fails requests immediately when too many consecutive requests to the same host have failed
+        self.circuit_breaker = circuit_breaker
+        #: Limits the number of requests in flight, adapting the limit from the responses received
+        self.concurrency_limiter = concurrency_limiter
+        #: Limits the number of retries across all requests on this handler to a ratio of recent requests
+        self.retry_budget = retry_budget
+        #: The default maximum time in seconds to spend on each request including all retries and waits
+        self.deadline = deadline
+        #: Shares the capacity of this handler between lanes of requests
+        self.scheduler = scheduler
+        #: Opens connections to known hosts each time a new session is started
+        self.connection_warmer = connection_warmer
+        #: Whether the session is kept open after the last context exits
+        self.persistent = persistent
+
+        # the number of contexts currently entered which share the session
+        self._entered = 0
+        self._enter_lock = asyncio.Lock()
 
         self._retry_logged = False
 
     async def __aenter__(self) -> Self:
         self._retry_logged = False
 
-        if self.closed:
-            self._session = self._connector()
+        # the session is shared by all entered contexts and kept open between entries when persistent
+        async with self._enter_lock:
+            if self.closed:
+                self._session = self._connector()
 
-        # force setting payload handler on all cache repositories
-        self.payload_handler = self.payload_handler
+                # force setting payload handler on all cache repositories
+                self.payload_handler = self.payload_handler
 
-        await self.session.__aenter__()
-        await self.authorise()
+                await self.session.__aenter__()
+                try:
+                    await self._authorise_and_warm_up()
+                except BaseException as ex:  # never share a session which could not be authorised
+                    await self._close_session(type(ex), ex, ex.__traceback__)
+                    raise
 
+            self._entered += 1
         return self
 
     async def __aexit__(self, __exc_type, __exc_value, __traceback) -> None:
-        if self._session is not None:
-            await self._session.__aexit__(__exc_type, __exc_value, __traceback)
-            self._session = None
+        self._entered = max(self._entered - 1, 0)
+        if self._entered == 0 and not self.persistent:
+            async with self._enter_lock:
+                if self._entered == 0:  # a context may have been entered while waiting for the lock
+                    await self._close_session(__exc_type, __exc_value, __traceback)
 
         self._retry_logged = False
 
+    async def _close_session(self, __exc_type=None, __exc_value=None, __traceback=None) -> None:
+        """Exit and remove the current session if one exists."""
+        session = self._session
+        if session is not None:
+            await session.__aexit__(__exc_type, __exc_value, __traceback)
+            if self._session is session:  # never remove a new session started while closing
+                self._session = None
+
+    async def _authorise_and_warm_up(self) -> None:
+        """Authorise while warming up connections concurrently when a connection warmer is assigned."""
+        if self.connection_warmer is None:
+            await self.authorise()
+            return
+
+        warm_up = asyncio.create_task(self.connection_warmer.warm_up(self.session))
+        try:
+            await self.authorise()
+        except BaseException:
+            warm_up.cancel()
+            await asyncio.gather(warm_up, return_exceptions=True)
+            raise
+
+        await warm_up
+
     async def authorise(self) -> Headers:
         """
         Authenticate and authorise, testing/refreshing/re-authorising as needed.
@@ -215,8 +399,12 @@ class RequestHandler[A: Authoriser, P: Any]:
         return headers
 
     async def close(self) -> None:
-        """Close the current session. No more requests will be possible once this has been called."""
-        await self.session.close()
+        """
+        Close the current session, including a persistent session.
+        No more requests will be possible once this has been called until a context is entered again.
+        """
+        self._entered = 0
+        await self._close_session()
 
     def log(
             self, method: str, url: URLInput, message: str | list = None, level: int = logging.DEBUG, **kwargs
@@ -238,18 +426,36 @@ class RequestHandler[A: Authoriser, P: Any]:
 
         self.logger.log(level=level, msg=format_url_log(method=method, url=url, messages=log))
 
-    async def request(self, **kwargs: Unpack[RequestKwargs]) -> P:
+    async def request(
+            self, deadline: Number | None = None, lane: str | None = None, **kwargs: Unpack[RequestKwargs]
+    ) -> P:
         """
         Generic method for handling HTTP requests handling errors, authorisation, backoff, caching etc. as configured.
 
         See aiohttp reference for more info on available kwargs:
         https://docs.aiohttp.org/en/stable/client_reference.html#aiohttp.ClientSession.request
 
+        Give a :py:class:`.RequestBody` as the ``data`` kwarg to stream a body which is sent again from its start
+        when the request is retried. Bodies given as iterators or file objects are consumed by the first attempt.
+
+        :param deadline: The maximum time in seconds to spend on this request including all retries and waits.
+            Defaults to the ``deadline`` of this handler.
+        :param lane: The name of the lane of the :py:attr:`scheduler` to send this request in.
+            Defaults to the default lane of the :py:attr:`scheduler`. Ignored when no scheduler is configured.
         :return: The JSON formatted response or, if JSON formatting not possible, the text response.
         :raise RequestError: For any request which fails.
+        :raise CircuitOpenError: When the circuit breaker is open for the request's host.
+        :raise DeadlineExceededError: When the request cannot be completed within its deadline.
         :raise ResponseError: For any request which returns an invalid response.
         :raise StatusHandlerError: For any request which returns a response with a status that could not be handled.
         """
+        _, payload = await self._request_with_response(deadline=deadline, lane=lane, **kwargs)
+        return payload
+
+    async def _request_with_response(
+            self, deadline: Number | None = None, lane: str | None = None, **kwargs: Unpack[RequestKwargs]
+    ) -> tuple[aiohttp.ClientResponse, P]:
+        """Send a request as per :py:meth:`request`, returning the final response along with its payload."""
         if self.closed:
             raise RequestError(
                 "Could not send a request as the session is closed. "
@@ -257,26 +463,622 @@ class RequestHandler[A: Authoriser, P: Any]:
             )
 
         kwargs["method"] = HTTPMethod(kwargs["method"].upper())
+
+        if lane is not None:
+            kwargs["lane"] = lane
+
+        deadline = deadline if deadline is not None else self.deadline
+        if deadline is None:
+            return await self._request_deduplicated(**kwargs)
+
+        loop = asyncio.get_running_loop()
+        expires_at = loop.time() + deadline
+        try:
+            async with asyncio.timeout_at(expires_at):
+                return await self._request_deduplicated(expires_at=expires_at, **kwargs)
+        except TimeoutError as ex:
+            if loop.time() < expires_at:
+                raise
+            raise DeadlineExceededError(
+                f"Request did not complete within its deadline of {deadline:.2f} seconds"
+            ) from ex
+
+    async def _request_deduplicated(self, **kwargs) -> tuple[aiohttp.ClientResponse, P]:
+        """Send a request, sharing identical in-flight requests if configured."""
+        key = self._get_single_flight_key(kwargs) if self.single_flight else None
+        if key is None:
+            return await self._request_with_retry(**kwargs)
+        return await self._request_single_flight(key, **kwargs)
+
+    @staticmethod
+    def _get_single_flight_key(kwargs: Mapping[str, Any]) -> Hashable | None:
+        """
+        Get the key which identifies identical requests from the given request ``kwargs``
+        from the normalised method, URL, params, headers, and a hash of the body.
+
+        All headers given for the request are included as any header may change the response
+        e.g. Accept, Authorization, or Range. Header names are compared case-insensitively.
+        Headers set on the session are the same for all requests and so are not included.
+
+        :return: The key or None if the request cannot be safely shared.
+        """
+        method: HTTPMethod = kwargs["method"]
+        if method not in _SAFE_METHODS or kwargs.get("payload_handler") is not None:
+            return
+
+        url = URL(kwargs["url"]).with_fragment(None)
+        if kwargs.get("params"):
+            url = url.update_query(kwargs["params"])
+        url = url.with_query(sorted(url.query.items()))
+        headers = tuple(sorted((str(k).lower(), str(v)) for k, v in (kwargs.get("headers") or {}).items()))
+
+        if kwargs.get("json") is not None:
+            body = json.dumps(kwargs["json"], sort_keys=True).encode()
+        else:
+            body = kwargs.get("data")
+            if isinstance(body, str):
+                body = body.encode()
+            elif body is not None and not isinstance(body, bytes | bytearray):
+                return  # body cannot be hashed without consuming it
+
+        return method, str(url), headers, hashlib.sha256(body).hexdigest() if body else None
+
+    async def _request_single_flight(
+            self, key: Hashable, **kwargs: Unpack[RequestKwargs]
+    ) -> tuple[aiohttp.ClientResponse, P]:
+        """
+        Send a request sharing the result of any identical in-flight request identified by the given ``key``.
+        Only the first caller is returned the original payload, all other callers are returned a copy.
+        The shared request is cancelled only when all callers waiting for it have been cancelled.
+        """
+        leader = key not in self._in_flight
+        if leader:
+            task = asyncio.create_task(self._request_with_retry(**kwargs))
+            self._in_flight[key] = [task, 0]
+            task.add_done_callback(functools.partial(self._end_single_flight, key))
+
+        flight = self._in_flight[key]
+        task: asyncio.Task[tuple[aiohttp.ClientResponse, P]] = flight[0]
+        flight[1] += 1
+
+        try:
+            response, payload = await asyncio.shield(task)
+        finally:
+            flight[1] -= 1
+            if flight[1] == 0 and not task.done():
+                task.cancel()
+                self._end_single_flight(key, task)
+
+        return response, (payload if leader else deepcopy(payload))
+
+    def _end_single_flight(self, key: Hashable, task: asyncio.Task) -> None:
+        """Stop sharing the given ``task`` with new requests for the given ``key``."""
+        if key in self._in_flight and self._in_flight[key][0] is task:
+            del self._in_flight[key]
+
+    async def _request_with_retry(
+            self,
+            expires_at: float | None = None,
+            lane: str | None = None,
+            payload_handler: Callable[[aiohttp.ClientResponse], Awaitable[P]] | None = None,
+            **kwargs: Unpack[RequestKwargs]
+    ) -> tuple[aiohttp.ClientResponse, P]:
+        """
+        Send a request, handling the response and retrying as configured until a payload is returned.
+
+        :param expires_at: The time, as given by the event loop's clock, by which the request must be completed.
+        :param lane: The name of the lane of the :py:attr:`scheduler` to send each attempt of the request in.
+        :param payload_handler: Extracts the payload of the response in place of the :py:attr:`payload_handler`.
+            Requests with a given ``payload_handler`` are never hedged.
+        """
         method = kwargs["method"]
         url = kwargs["url"]
+        timeout = kwargs.get("timeout")
         retry_timer = self.retry_timer
+        if self.retry_budget is not None:
+            self.retry_budget.record()
+
+        hedge = (
+            self.hedger is not None
+            and self.hedger.can_hedge(method)
+            and payload_handler is None
+            and not isinstance(kwargs.get("data"), RequestBody)
+        )
+        payload_handler = payload_handler or self.payload_handler
 
         while True:
-            async with self._request(**kwargs) as response:
-                if response is None or isinstance(response, Exception):
-                    pass
-                elif await self._handle_response(response, retry_timer=retry_timer):
-                    continue
-                elif response.ok:
-                    payload: P = await self.payload_handler(response)
-                    break
+            if expires_at is not None:
+                kwargs["timeout"] = self._get_timeout(timeout, expires_at=expires_at)
 
-                if isinstance(response, aiohttp.ClientResponse):
-                    await self._log_response(response=response, method=method, url=url)
-                await self._retry(response=response, method=method, url=url, timer=retry_timer)
+            response, payload = await self._attempt(hedge=hedge, lane=lane, payload_handler=payload_handler, **kwargs)
+            if self.wait_timer is not None:
+                await self.wait_timer
+
+            if response is None or isinstance(response, Exception):
+                pass
+            elif await self._handle_response(response, retry_timer=retry_timer, expires_at=expires_at):
+                continue
+            elif response.ok:
+                if payload is _NO_PAYLOAD:
+                    payload = await payload_handler(response)
+                break
+
+            if isinstance(response, aiohttp.ClientResponse):
+                await self._log_response(response=response, method=method, url=url)
+            await self._retry(response=response, method=method, url=url, timer=retry_timer, expires_at=expires_at)
 
         self._retry_logged = False
-        return payload
+        return response, payload
+
+    def _get_timeout(self, timeout: aiohttp.ClientTimeout | None, expires_at: float) -> aiohttp.ClientTimeout:
+        """
+        Get the timeout for one attempt of a request from the given ``timeout`` or the session's timeout,
+        reducing its total timeout to the time remaining until ``expires_at``.
+        """
+        if not isinstance(timeout, aiohttp.ClientTimeout):
+            timeout = self.session.timeout
+
+        remaining = expires_at - asyncio.get_running_loop().time()
+        if timeout.total is not None and timeout.total <= remaining:
+            return timeout
+
+        return aiohttp.ClientTimeout(
+            total=max(remaining, 0.001),
+            connect=timeout.connect,
+            sock_read=timeout.sock_read,
+            sock_connect=timeout.sock_connect,
+            ceil_threshold=timeout.ceil_threshold,
+        )
+
+    async def request_many(
+            self,
+            requests: Iterable[RequestKwargs],
+            limit: int | None = None,
+            limit_per_host: int | None = None,
+            return_exceptions: bool = False,
+    ) -> list[P | Exception]:
+        """
+        Send many requests concurrently, handling each request as per :py:meth:`request`.
+
+        Only ``limit`` requests are ever in flight at once and the given ``requests`` are consumed lazily
+        as each request completes, so large collections of requests may be given safely.
+
+        :param requests: The kwargs for each request to send. See :py:meth:`request` for more info.
+        :param limit: The maximum number of requests to send concurrently.
+            Defaults to the connection limit of the session's connector.
+        :param limit_per_host: The maximum number of requests to send concurrently to any one host.
+        :param return_exceptions: When True, collect any exceptions raised by a request
+            and return them in place of the payload for that request.
+            When False, raise the first exception encountered and cancel all other pending requests.
+        :return: The payloads for each request in the order of the given ``requests``.
+        :raise RequestError: For any request which fails.
+        :raise ResponseError: For any request which returns an invalid response.
+        :raise StatusHandlerError: For any request which returns a response with a status that could not be handled.
+        """
+        if self.closed:
+            raise RequestError(
+                "Could not send requests as the session is closed. "
+                "Enter the RequestHandler's context to start a new session."
+            )
+
+        requests = enumerate(requests)
+        results: dict[int, P | Exception] = {}
+        host_limits = self._get_host_limits(limit_per_host)
+
+        async def _worker() -> None:
+            for idx, kwargs in requests:
+                try:
+                    results[idx] = await self._request_with_host_limit(host_limits, **kwargs)
+                except Exception as ex:
+                    if not return_exceptions:
+                        raise
+                    results[idx] = ex
+
+        try:
+            async with asyncio.TaskGroup() as group:
+                for _ in range(self._get_concurrency_limit(limit)):
+                    group.create_task(_worker())
+        except ExceptionGroup as ex:
+            raise ex.exceptions[0]
+
+        return [results[idx] for idx in sorted(results)]
+
+    async def stream(
+            self,
+            requests: Iterable[RequestKwargs] | AsyncIterable[RequestKwargs],
+            limit: int | None = None,
+            limit_per_host: int | None = None,
+    ) -> AsyncGenerator[tuple[RequestKwargs, P | Exception], None]:
+        """
+        Send many requests concurrently, yielding the result of each request as soon as it completes.
+
+        The given ``requests`` are consumed lazily and only ``limit`` requests are ever in flight at once,
+        so memory usage does not grow with the number of given ``requests``.
+        Any requests still in flight are cancelled if iteration is stopped early.
+
+        :param requests: The kwargs for each request to send. See :py:meth:`request` for more info.
+        :param limit: The maximum number of requests to send concurrently.
+            Defaults to the connection limit of the session's connector.
+        :param limit_per_host: The maximum number of requests to send concurrently to any one host.
+        :return: Async iterator of the request kwargs and either the payload
+            or the exception raised for that request in the order in which they completed.
+        """
+        if self.closed:
+            raise RequestError(
+                "Could not send requests as the session is closed. "
+                "Enter the RequestHandler's context to start a new session."
+            )
+
+        requests = get_async_iterator(requests)
+        limit = self._get_concurrency_limit(limit)
+        host_limits = self._get_host_limits(limit_per_host)
+
+        pending: dict[asyncio.Task[P], RequestKwargs] = {}
+        exhausted = False
+
+        try:
+            while True:
+                while not exhausted and len(pending) < limit:
+                    try:
+                        kwargs = await anext(requests)
+                    except StopAsyncIteration:
+                        exhausted = True
+                        break
+
+                    task = asyncio.create_task(self._request_with_host_limit(host_limits, **kwargs))
+                    pending[task] = kwargs
+
+                if not pending:
+                    break
+
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield pending.pop(task), task.exception() or task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def paginate(
+            self, paginator: Paginator, limit: int | None = None, **kwargs: Unpack[RequestKwargs]
+    ) -> AsyncGenerator[Any, None]:
+        """
+        Request every page of a paginated collection, yielding each item of the collection in order.
+
+        When the ``paginator`` can build the requests for all remaining pages from the first page,
+        these pages are requested concurrently, with only ``limit`` pages ever in flight at once.
+        Otherwise, each page is requested only once the previous page has been received.
+        Each page is requested as per :py:meth:`request` and so is subject to all configured limits.
+        Any pages still in flight are cancelled if iteration is stopped early.
+
+        :param paginator: The strategy used to build the request for each page from the previous page.
+        :param limit: The maximum number of pages to request concurrently.
+            Defaults to the connection limit of the session's connector.
+        :param kwargs: The kwargs for the request of the first page. See :py:meth:`request` for more info.
+            The ``method`` defaults to GET when not given.
+        :return: Async iterator of the items of every page in order.
+        :raise RequestError: For any request which fails.
+        :raise ResponseError: For any request which returns an invalid response.
+        :raise StatusHandlerError: For any request which returns a response with a status that could not be handled.
+        """
+        kwargs.setdefault("method", HTTPMethod.GET)
+        request = paginator.get_first(kwargs)
+        response, payload = await self._request_with_response(**request)
+        for item in paginator.get_items(payload):
+            yield item
+
+        remaining = paginator.get_remaining(request=request, response=response, payload=payload)
+        if remaining is not None:
+            async for payload in self._request_in_order(remaining, limit=limit):
+                for item in paginator.get_items(payload):
+                    yield item
+            return
+
+        while (request := paginator.get_next(request=request, response=response, payload=payload)) is not None:
+            response, payload = await self._request_with_response(**request)
+            for item in paginator.get_items(payload):
+                yield item
+
+    async def stream_payload(
+            self,
+            payload_handler: StreamingJSONPayloadHandler,
+            deadline: Number | None = None,
+            lane: str | None = None,
+            **kwargs: Unpack[RequestKwargs]
+    ) -> AsyncGenerator[Any, None]:
+        """
+        Send a request, yielding each value of its payload as soon as it has been read from the response.
+
+        The payload is read incrementally by the given ``payload_handler`` while values are being yielded,
+        so memory usage is proportional to a single value rather than the whole payload.
+        The request is sent as per :py:meth:`request` and so is subject to all configured limits,
+        and is retried as configured only until the first value has been yielded.
+        The request is never hedged or shared with identical requests, and its response is never saved to the cache.
+        The connection is released back to the pool once iteration completes or is stopped early.
+
+        :param payload_handler: Extracts the values from the payload of the response.
+        :param deadline: The maximum time in seconds to spend on this request including reading the whole payload.
+            Defaults to the ``deadline`` of this handler.
+        :param lane: The name of the lane of the :py:attr:`scheduler` to send this request in.
+        :param kwargs: The kwargs for the request. See :py:meth:`request` for more info.
+        :return: Async iterator of the values of the payload in order.
+        :raise RequestError: For any request which fails.
+        :raise PayloadHandlerError: When the payload is invalid, or the response fails after values have been yielded.
+        :raise ResponseError: For any request which returns an invalid response.
+        """
+        values: asyncio.Queue = asyncio.Queue(maxsize=1)
+
+        async def _stream(response: aiohttp.ClientResponse) -> None:
+            streamed = False
+            try:
+                async for value in payload_handler.iterate(response):
+                    streamed = True
+                    await values.put(value)
+            except aiohttp.ClientError as ex:
+                if not streamed:
+                    raise  # nothing has been yielded so the request may be safely retried
+                raise PayloadHandlerError(f"Response failed after values were returned: {ex}") from ex
+
+        kwargs["persist"] = False  # the payload is consumed while streaming so cannot be saved to the cache
+        task = asyncio.create_task(
+            self._request_with_response(deadline=deadline, lane=lane, payload_handler=_stream, **kwargs)
+        )
+
+        getter = None
+        try:
+            while True:
+                getter = asyncio.ensure_future(values.get())
+                await asyncio.wait((getter, task), return_when=asyncio.FIRST_COMPLETED)
+                if not getter.done():
+                    break
+                yield getter.result()
+
+            while not values.empty():
+                yield values.get_nowait()
+            task.result()
+        finally:
+            for future in (getter, task):
+                if future is not None:
+                    future.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    async def download(
+            self,
+            payload_handler: FilePayloadHandler,
+            deadline: Number | None = None,
+            lane: str | None = None,
+            **kwargs: Unpack[RequestKwargs]
+    ) -> Path:
+        """
+        Send a request, writing the payload of its response to a file in chunks as it is read.
+
+        The request is sent as per :py:meth:`request` and so is subject to all configured limits and retries.
+        When reading the payload fails part way through, the request is retried from the last byte written
+        to the file with a ``Range`` header, so progress is never lost between attempts.
+        The request is never hedged or shared with identical requests, and its response is never saved to the cache.
+
+        :param payload_handler: Writes the payload to its file and computes its digest if configured.
+        :param deadline: The maximum time in seconds to spend on this request including writing the whole payload.
+            Defaults to the ``deadline`` of this handler.
+        :param lane: The name of the lane of the :py:attr:`scheduler` to send this request in.
+        :param kwargs: The kwargs for the request. See :py:meth:`request` for more info.
+            The ``method`` defaults to GET when not given.
+        :return: The path of the file the payload was written to.
+        :raise RequestError: For any request which fails.
+        :raise ResponseError: For any request which returns an invalid response.
+        :raise PayloadHandlerError: When a retried request returns a partial payload
+            which does not continue from the last byte written.
+        """
+        kwargs.setdefault("method", HTTPMethod.GET)
+        kwargs["persist"] = False  # the payload is written to a file so cannot be saved to the cache
+
+        payload_handler.reset()
+        _, path = await self._request_with_response(
+            deadline=deadline, lane=lane, payload_handler=payload_handler, **kwargs
+        )
+        return path
+
+    async def _request_in_order(
+            self, requests: Iterable[RequestKwargs], limit: int | None = None
+    ) -> AsyncGenerator[P, None]:
+        """
+        Send the given ``requests`` concurrently with only ``limit`` requests in flight at once,
+        yielding the payload of each request in the order of the given ``requests``.
+        """
+        requests = iter(requests)
+        limit = self._get_concurrency_limit(limit)
+        pending: deque[asyncio.Task[P]] = deque()
+
+        try:
+            while True:
+                while len(pending) < limit and (kwargs := next(requests, None)) is not None:
+                    pending.append(asyncio.create_task(self.request(**kwargs)))
+                if not pending:
+                    break
+
+                yield await pending.popleft()
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    def _get_concurrency_limit(self, limit: int | None) -> int:
+        """Get the maximum number of concurrent requests to send, defaulting to the connector's limit."""
+        if limit is not None:
+            if limit < 1:
+                raise InputError(f"Concurrency limit must be greater than 0: {limit}")
+            return limit
+
+        connector = self.session.connector
+        return connector.limit if connector is not None and connector.limit else DEFAULT_CONCURRENCY_LIMIT
+
+    @staticmethod
+    def _get_host_limits(limit_per_host: int | None) -> defaultdict[str, asyncio.Semaphore] | None:
+        """Get a map of host to the :py:class:`asyncio.Semaphore` to use to limit requests to that host."""
+        if limit_per_host is None:
+            return
+        if limit_per_host < 1:
+            raise InputError(f"Concurrency limit per host must be greater than 0: {limit_per_host}")
+
+        return defaultdict(lambda: asyncio.Semaphore(limit_per_host))
+
+    async def _request_with_host_limit(
+            self, host_limits: Mapping[str, asyncio.Semaphore] | None, **kwargs: Unpack[RequestKwargs]
+    ) -> P:
+        """Send a request, waiting for a free slot for the request's host before sending if limits are given."""
+        if host_limits is None:
+            return await self.request(**kwargs)
+
+        async with host_limits[URL(kwargs["url"]).host or ""]:
+            return await self.request(**kwargs)
+
+    async def _attempt(
+            self, hedge: bool = False, lane: str | None = None, **kwargs
+    ) -> tuple[aiohttp.ClientResponse | Exception, P | object]:
+        """Send one attempt of a request once it is dispatched from its lane by the scheduler if configured."""
+        if self.scheduler is None:
+            return await self._attempt_with_concurrency_limit(hedge=hedge, **kwargs)
+
+        await self.scheduler.acquire(lane)
+        try:
+            return await self._attempt_with_concurrency_limit(hedge=hedge, **kwargs)
+        finally:
+            self.scheduler.release(lane)
+
+    async def _attempt_with_concurrency_limit(
+            self, hedge: bool = False, **kwargs
+    ) -> tuple[aiohttp.ClientResponse | Exception, P | object]:
+        """Send one attempt of a request within the concurrency limit if configured."""
+        if self.concurrency_limiter is None:
+            return await self._attempt_with_circuit_breaker(hedge=hedge, **kwargs)
+
+        start = await self.concurrency_limiter.acquire()
+        timing = _AttemptTiming()  # exclude time waiting for the rate limiter from the latency
+        response = latency = None
+        try:
+            response, payload = await self._attempt_with_circuit_breaker(hedge=hedge, timing=timing, **kwargs)
+            if isinstance(response, aiohttp.ClientResponse) and not isinstance(response, CachedResponse):
+                latency = timing.elapsed
+        finally:
+            self.concurrency_limiter.release(
+                start, latency=latency, overloaded=self.concurrency_limiter.is_overloaded(response)
+            )
+
+        return response, payload
+
+    async def _attempt_with_circuit_breaker(
+            self, hedge: bool = False, **kwargs
+    ) -> tuple[aiohttp.ClientResponse | Exception, P | object]:
+        """Send one attempt of a request, hedging if configured, guarded by the circuit breaker if configured."""
+        send = self._send_hedged if hedge else self._send
+        if self.circuit_breaker is None:
+            return await send(**kwargs)
+
+        token = self.circuit_breaker.acquire(kwargs["url"])
+
+        failed = None
+        try:
+            response, payload = await send(**kwargs)
+            failed = self.circuit_breaker.is_failure(response)
+        except TimeoutError:
+            failed = True
+            raise
+        finally:
+            self.circuit_breaker.release(token, failed=failed)
+
+        return response, payload
+
+    async def _send(
+            self, payload_handler: Callable[[aiohttp.ClientResponse], Awaitable[P]] | None = None, **kwargs
+    ) -> tuple[aiohttp.ClientResponse | Exception, P | object]:
+        """
+        Send a request and read its response in full, releasing the connection back to the pool before returning.
+
+        The response payload is only extracted here for successful responses which have no status handler,
+        as this is the only case in which the payload is always required.
+
+        :param payload_handler: Extracts the payload of the response in place of the :py:attr:`payload_handler`.
+        :return: The response or exception, and the payload or a sentinel when the payload was not extracted.
+        """
+        if isinstance(payload_handler, FilePayloadHandler):  # only request the bytes not yet written
+            kwargs["headers"] = payload_handler.get_headers(kwargs.get("headers"))
+
+        payload = _NO_PAYLOAD
+        async with self._request(**kwargs) as response:
+            if not isinstance(response, aiohttp.ClientResponse):
+                return response, payload
+
+            try:
+                if response.ok and response.status not in self.response_handlers:
+                    payload = await (payload_handler or self.payload_handler)(response)
+                else:
+                    await response.read()
+            except aiohttp.ClientError as ex:
+                self.logger.debug(str(ex))
+                return ex, payload
+
+        return response, payload
+
+    async def _send_hedged(
+            self, timing: _AttemptTiming | None = None, **kwargs
+    ) -> tuple[aiohttp.ClientResponse | Exception, P | object]:
+        """
+        Send a request, sending one hedged request when no response is received within the hedger's delay
+        and the hedger's budget allows. Returns the first successful response and cancels the other request.
+        When no request is successful, returns the response of the last request to complete.
+
+        The hedger's delay starts once the request is sent after acquiring any rate limit,
+        so requests only waiting on the rate limiter are never hedged.
+
+        :param timing: Records the time the first request is sent.
+        """
+        self.hedger.budget.record()
+        timing = timing or _AttemptTiming()
+        tasks = {asyncio.create_task(self._send_timed(timing=timing, **kwargs))}
+        sent = asyncio.create_task(timing.sent.wait())
+
+        try:
+            # the request may complete without being sent to the network e.g. when the response is cached
+            await asyncio.wait(tasks | {sent}, return_when=asyncio.FIRST_COMPLETED)
+
+            delay = self.hedger.get_delay(kwargs["url"])
+            done, _ = await asyncio.wait(tasks, timeout=delay) if sent.done() else (tasks, None)
+            if not done and self.hedger.budget.withdraw():
+                self.log(
+                    method=kwargs["method"].name,
+                    url=kwargs["url"],
+                    message=f"No response after {delay:.2f} seconds: sending hedged request..."
+                )
+                tasks.add(asyncio.create_task(self._send_timed(timing=_AttemptTiming(), **kwargs)))
+
+            while True:
+                done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                results = [task.result() for task in done]
+                for response, payload in results:
+                    if isinstance(response, aiohttp.ClientResponse) and response.ok:
+                        return response, payload
+                if not tasks:
+                    return results[0]
+        finally:
+            sent.cancel()
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(sent, *tasks, return_exceptions=True)
+
+    async def _send_timed(
+            self, timing: _AttemptTiming, **kwargs
+    ) -> tuple[aiohttp.ClientResponse | Exception, P | object]:
+        """
+        Send a request as per :py:meth:`_send`, recording the latency of successful network responses
+        from the time the request is sent as recorded by the given ``timing``.
+        """
+        response, payload = await self._send(timing=timing, **kwargs)
+
+        latency = timing.elapsed
+        if isinstance(response, aiohttp.ClientResponse) and response.ok and not isinstance(response, CachedResponse):
+            if latency is not None:
+                self.hedger.record(kwargs["url"], latency)
+        return response, payload
 
     @contextlib.asynccontextmanager
     async def _request(
@@ -284,9 +1086,14 @@ class RequestHandler[A: Authoriser, P: Any]:
             method: HTTPMethod,
             url: URLInput,
             log_message: str | list[str] = None,
+            timing: _AttemptTiming | None = None,
             **kwargs
     ) -> aiohttp.ClientResponse | Exception:
-        """Handle logging a request, send the request, and return the response"""
+        """
+        Handle logging a request, send the request, and return the response
+
+        :param timing: Records the time the request is sent once any rate limit has been acquired.
+        """
         if isinstance(log_message, str):
             log_message = [log_message]
         elif log_message is None:
@@ -296,20 +1103,44 @@ class RequestHandler[A: Authoriser, P: Any]:
             log_message.append("Cached Request")
         self.log(method=method.name, url=url, message=log_message, **kwargs)
 
+        await self._acquire_rate_limit(method=method, url=url, kwargs=kwargs, timing=timing)
+
         self._clean_requests_kwargs(kwargs)
         if "headers" in kwargs:
             kwargs["headers"].update(self.session.headers)
+        if isinstance(kwargs.get("data"), RequestBody):  # send the body from its start on every attempt
+            kwargs["data"] = kwargs["data"].open()
 
         try:
             async with self.session.request(method=method.name, url=url, **kwargs) as response:
                 yield response
-                if self.wait_timer is not None:
-                    await self.wait_timer
         except aiohttp.ClientError as ex:
             self.logger.debug(str(ex))
             yield ex
-            if self.wait_timer is not None:
-                await self.wait_timer
+        finally:
+            if isinstance(kwargs.get("data"), RequestBodyPayload):
+                await kwargs["data"].close()
+
+    async def _acquire_rate_limit(
+            self, method: HTTPMethod, url: URLInput, kwargs: dict[str, Any], timing: _AttemptTiming | None = None
+    ) -> None:
+        """
+        Acquire from the rate limiter, deferring acquisition until a network request is needed when caching.
+        Marks the given ``timing`` as sent once acquired.
+        """
+        if self.rate_limiter is None and timing is None:
+            return
+
+        async def acquire() -> None:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire(method=method, url=url)
+            if timing is not None:
+                timing.mark_sent()
+
+        if isinstance(self.session, CachedSession):  # only acquire when the response is not cached
+            kwargs["before_send"] = acquire
+        else:
+            await acquire()
 
     def _clean_requests_kwargs(self, kwargs: dict[str, Any]) -> None:
         """Clean ``kwargs`` by removing any kwarg not in the signature of the :py:meth:`aiohttp.request` method."""
@@ -335,10 +1166,16 @@ class RequestHandler[A: Authoriser, P: Any]:
             ]
         )
 
-    async def _handle_response(self, response: aiohttp.ClientResponse, retry_timer: Timer | None = None) -> bool:
+    async def _handle_response(
+            self, response: aiohttp.ClientResponse, retry_timer: Timer | None = None, expires_at: float | None = None
+    ) -> bool:
         if response.status not in self.response_handlers:
             return False
 
+        time_remaining = None
+        if expires_at is not None:
+            time_remaining = expires_at - asyncio.get_running_loop().time()
+
         response_handler: StatusHandler = self.response_handlers[response.status]
         return await response_handler(
             response=response,
@@ -347,6 +1184,8 @@ class RequestHandler[A: Authoriser, P: Any]:
             payload_handler=self.payload_handler,
             wait_timer=self.wait_timer,
             retry_timer=retry_timer,
+            time_remaining=time_remaining,
+            rate_limiter=self.rate_limiter,
         )
 
     async def _retry(
@@ -354,10 +1193,13 @@ class RequestHandler[A: Authoriser, P: Any]:
             response: aiohttp.ClientResponse | Exception | None,
             method: HTTPMethod,
             url: URLInput,
-            timer: Timer | None
+            timer: Timer | None,
+            expires_at: float | None = None,
     ) -> None:
         try:
-            await self._handle_retry_timer(method=method, url=url, timer=timer)
+            await self._handle_retry_timer(method=method, url=url, timer=timer, expires_at=expires_at)
+        except DeadlineExceededError:
+            raise
         except RequestError as ex:
             if response is None:
                 raise ex
@@ -365,9 +1207,15 @@ class RequestHandler[A: Authoriser, P: Any]:
                 raise response
             raise ResponseError(message=await response.text(errors="ignore"), response=response)
 
-    async def _handle_retry_timer(self, method: HTTPMethod, url: URLInput, timer: Timer | None) -> None:
+    async def _handle_retry_timer(
+            self, method: HTTPMethod, url: URLInput, timer: Timer | None, expires_at: float | None = None
+    ) -> None:
         if timer is None or not timer.can_increase:
             raise RequestError("Max retries exceeded")
+        if expires_at is not None and asyncio.get_running_loop().time() + float(timer) >= expires_at:
+            raise DeadlineExceededError("Request cannot be retried within its deadline")
+        if self.retry_budget is not None and not self.retry_budget.withdraw():
+            raise RequestError("Retry budget exhausted")
 
         if not self._retry_logged:
             self.logger.warning(
@@ -420,6 +1268,27 @@ class RequestHandler[A: Authoriser, P: Any]:
         kwargs.pop("method", None)
         return await self.request(method="patch", url=url, **kwargs)
 
+    async def get_many(
+            self,
+            urls: Iterable[URLInput],
+            limit: int | None = None,
+            limit_per_host: int | None = None,
+            return_exceptions: bool = False,
+            **kwargs
+    ) -> list[P | Exception]:
+        """
+        Sends many GET requests concurrently, applying the given ``kwargs`` to every request.
+        See :py:meth:`request_many` for more info.
+        """
+        kwargs.pop("method", None)
+        kwargs.pop("url", None)
+        return await self.request_many(
+            ({"method": HTTPMethod.GET, "url": url} | kwargs for url in urls),
+            limit=limit,
+            limit_per_host=limit_per_host,
+            return_exceptions=return_exceptions,
+        )
+
     def __copy__(self):
         """Do not copy handler"""
         return self
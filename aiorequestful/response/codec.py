@@ -0,0 +1,148 @@
+"""
+Codecs to encode Python objects to JSON data and decode JSON data to Python objects.
+
+Use :py:func:`get_json_codec` to get the fastest codec available from the JSON libraries installed.
+"""
+import json
+from abc import ABC, abstractmethod
+from typing import Any
+
+from aiorequestful._utils import required_modules_installed
+from aiorequestful.response.exception import PayloadHandlerError
+from aiorequestful.types import JSON
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+type JSONInput = str | bytes | bytearray | memoryview
+
+
+class JSONCodec(ABC):
+    """Encodes Python objects to JSON data and decodes JSON data to Python objects."""
+
+    __slots__ = ()
+
+    @abstractmethod
+    def loads(self, data: JSONInput) -> JSON:
+        """
+        Decode the given JSON ``data`` directly from either its text or its UTF-8 encoded bytes.
+
+        :raise PayloadHandlerError: When the data is not valid JSON data.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def dumps(self, value: Any, indent: int | None = None) -> str:
+        """
+        Encode the given ``value`` to JSON text, indenting nested values by ``indent`` spaces when given.
+
+        :raise PayloadHandlerError: When the value cannot be encoded to JSON data.
+        """
+        raise NotImplementedError
+
+    def validate(self, value: Any) -> None:
+        """
+        Check the given ``value`` can be encoded to JSON data.
+        The value is encoded once without decoding the result back to Python objects.
+
+        :raise PayloadHandlerError: When the value cannot be encoded to JSON data.
+        """
+        self.dumps(value)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}()"
+
+
+class StdlibJSONCodec(JSONCodec):
+    """Encodes and decodes JSON data with the standard library :py:mod:`json` module."""
+
+    __slots__ = ()
+
+    def loads(self, data: JSONInput) -> JSON:
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+
+        try:
+            return json.loads(data)
+        except (json.JSONDecodeError, UnicodeDecodeError, TypeError) as ex:
+            raise PayloadHandlerError(f"Invalid JSON data: {ex}")
+
+    def dumps(self, value: Any, indent: int | None = None) -> str:
+        try:
+            return json.dumps(value, indent=indent)
+        except (TypeError, ValueError) as ex:
+            raise PayloadHandlerError(f"Value cannot be encoded to JSON data: {ex}")
+
+
+class OrjsonJSONCodec(JSONCodec):
+    """
+    Encodes and decodes JSON data with the ``orjson`` library.
+
+    Output is compact and, as ``orjson`` only supports an indent of 2,
+    values are encoded with the standard library when any other ``indent`` is given.
+    """
+
+    __slots__ = ()
+
+    def __init__(self):
+        required_modules_installed([orjson], self)
+
+    def loads(self, data: JSONInput) -> JSON:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError as ex:
+            raise PayloadHandlerError(f"Invalid JSON data: {ex}")
+
+    def dumps(self, value: Any, indent: int | None = None) -> str:
+        if indent not in (None, 2):
+            return StdlibJSONCodec().dumps(value, indent=indent)
+
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+
+        try:
+            return orjson.dumps(value, option=option).decode()
+        except orjson.JSONEncodeError as ex:
+            raise PayloadHandlerError(f"Value cannot be encoded to JSON data: {ex}")
+
+
+class MsgspecJSONCodec(JSONCodec):
+    """Encodes and decodes JSON data with the ``msgspec`` library. Output is compact when no ``indent`` is given."""
+
+    __slots__ = ()
+
+    def __init__(self):
+        required_modules_installed([msgspec], self)
+
+    def loads(self, data: JSONInput) -> JSON:
+        try:
+            return msgspec.json.decode(data)
+        except msgspec.DecodeError as ex:
+            raise PayloadHandlerError(f"Invalid JSON data: {ex}")
+
+    def dumps(self, value: Any, indent: int | None = None) -> str:
+        try:
+            data = msgspec.json.encode(value)
+        except (msgspec.EncodeError, TypeError, OverflowError, RecursionError) as ex:
+            raise PayloadHandlerError(f"Value cannot be encoded to JSON data: {ex}")
+
+        if indent is not None:
+            data = msgspec.json.format(data, indent=indent)
+        return data.decode()
+
+
+def get_json_codec() -> JSONCodec:
+    """Get the fastest :py:class:`JSONCodec` available, preferring ``orjson``, then ``msgspec``, then stdlib."""
+    if orjson is not None:
+        return OrjsonJSONCodec()
+    if msgspec is not None:
+        return MsgspecJSONCodec()
+    return StdlibJSONCodec()
@@ -1,15 +1,28 @@
 """
 Resources to handle manipulation of payload data returned by responses into Python objects.
 """
+import codecs
+import hashlib
 import json
+import re
 from abc import ABC, abstractmethod
-from collections.abc import Awaitable
-from typing import Any
+from collections.abc import Awaitable, AsyncIterator, Iterator, Mapping
+from dataclasses import dataclass
+from http import HTTPStatus
+from pathlib import Path
+from typing import Any, BinaryIO
 
-from aiohttp import ClientResponse
+from aiohttp import ClientResponse, hdrs
 
+from aiorequestful._utils import required_modules_installed
+from aiorequestful.response.codec import JSONCodec, get_json_codec
 from aiorequestful.response.exception import PayloadHandlerError
-from aiorequestful.types import JSON
+from aiorequestful.types import JSON, JSON_VALUE
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
 
 
 class PayloadHandler[T: Any](ABC):
@@ -86,30 +99,602 @@ class BytesPayloadHandler(PayloadHandler[bytes]):
 
 
 class JSONPayloadHandler(PayloadHandler[JSON]):
+    """
+    Handles JSON payloads, decoding directly from the bytes of the response.
+
+    :param indent: The number of spaces to indent nested values by when serializing.
+    :param codec: The codec to encode and decode JSON data with.
+        Defaults to the fastest codec available as given by :py:func:`.get_json_codec`.
+    """
 
-    __slots__ = ("indent",)
+    __slots__ = ("indent", "codec")
 
-    def __init__(self, indent: int = None):
+    def __init__(self, indent: int = None, codec: JSONCodec | None = None):
         self.indent = indent
+        #: The codec to encode and decode JSON data with
+        self.codec = codec if codec is not None else get_json_codec()
 
     async def serialize(self, payload: str | bytes | bytearray | JSON) -> str:
         if isinstance(payload, str | bytes | bytearray):
-            try:
-                payload = json.loads(payload)
-            except (json.decoder.JSONDecodeError, TypeError):
-                raise PayloadHandlerError(f"Unrecognised input type: {payload}")
-        return json.dumps(payload, indent=self.indent)
+            payload = self.codec.loads(payload)
+        return self.codec.dumps(payload, indent=self.indent)
 
     async def deserialize(self, response: str | bytes | bytearray | ClientResponse | JSON) -> JSON:
         match response:
-            case dict():
-                try:  # check the given payload can be converted to/from JSON format
-                    return json.loads(json.dumps(response))
-                except (json.decoder.JSONDecodeError, TypeError):
-                    raise PayloadHandlerError("Given payload is not a valid JSON object")
+            case dict():  # check the given payload can be converted to JSON format
+                self.codec.validate(response)
+                return response
             case str() | bytes() | bytearray():
-                return json.loads(response)
+                return self.codec.loads(response)
             case ClientResponse():
-                return await response.json(content_type=None)
+                data = await response.read()
+                return self.codec.loads(data) if data.strip() else None
             case _:
                 raise PayloadHandlerError(f"Unrecognised input type: {response}")
+
+
+class SchemaPayloadHandler[T: Any](PayloadHandler[T]):
+    """
+    Handles JSON payloads by decoding them directly into instances of a declared ``schema`` with ``msgspec``.
+
+    The ``schema`` may be any type supported by ``msgspec`` including dataclasses, ``TypedDict``,
+    ``NamedTuple``, ``msgspec.Struct`` and any containers of these types e.g. ``list[Item]``.
+    Values are validated against the ``schema`` as they are decoded and any unknown fields are skipped.
+    Dataclasses declared with ``slots=True`` and ``msgspec.Struct`` types hold far less memory than
+    the equivalent nested dicts, so are best suited to large collections of records.
+
+    Payloads are serialized back to JSON data, so the responses saved to a :py:class:`.ResponseRepository`
+    are decoded into the same types when returned from the cache.
+
+    :param schema: The type to decode payloads into.
+    :param indent: The number of spaces to indent nested values by when serializing.
+    """
+
+    __slots__ = ("schema", "indent", "_decoder", "_encoder")
+
+    def __init__(self, schema: type[T] | Any, indent: int = None):
+        required_modules_installed([msgspec], self)
+
+        #: The type to decode payloads into
+        self.schema = schema
+        self.indent = indent
+
+        self._decoder = msgspec.json.Decoder(schema)
+        self._encoder = msgspec.json.Encoder()
+
+    async def serialize(self, payload: str | bytes | bytearray | T) -> str:
+        if isinstance(payload, str | bytes | bytearray):
+            payload = self._decode(payload)
+
+        try:
+            data = self._encoder.encode(payload)
+        except (msgspec.EncodeError, TypeError, OverflowError) as ex:
+            raise PayloadHandlerError(f"Payload cannot be encoded to JSON data: {ex}")
+
+        if self.indent is not None:
+            data = msgspec.json.format(data, indent=self.indent)
+        return data.decode()
+
+    async def deserialize(self, response: str | bytes | bytearray | ClientResponse | JSON | T) -> T:
+        match response:
+            case str() | bytes() | bytearray():
+                return self._decode(response)
+            case ClientResponse():
+                return self._decode(await response.read())
+            case None:
+                raise PayloadHandlerError(f"Unrecognised input type: {response}")
+            case _:  # decoded JSON data or instances of the schema
+                try:
+                    return msgspec.convert(response, self.schema, from_attributes=True)
+                except msgspec.ValidationError as ex:
+                    raise PayloadHandlerError(f"Payload does not match the schema: {ex}")
+
+    def _decode(self, data: str | bytes | bytearray) -> T:
+        try:
+            return self._decoder.decode(data)
+        except msgspec.ValidationError as ex:
+            raise PayloadHandlerError(f"Payload does not match the schema: {ex}")
+        except msgspec.DecodeError as ex:
+            raise PayloadHandlerError(f"Invalid JSON data: {ex}")
+
+    def __reduce__(self):
+        # the decoder and encoder cannot be pickled so are rebuilt from the schema
+        return self.__class__, (self.schema, self.indent)
+
+
+_JSON_WHITESPACE = re.compile(r"\s*")
+_JSON_STRING_CONTENT = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*')
+_JSON_STRING = re.compile(r'"' + _JSON_STRING_CONTENT.pattern + r'"')
+_JSON_SCALAR = re.compile(r"[^\s,:\[\]{}\"]+")
+# tokens of a container being skipped: brackets, or runs of whole strings and characters which cannot change depth
+_JSON_SKIP = re.compile(r'(?:[^"{}\[\]]+|' + _JSON_STRING.pattern + r')+|[{}\[\]]')
+# a comma leaving an empty element or trailing the last element, or the same sequence within a string
+# searched for separately as a search for a pattern starting with a single character is much faster
+_JSON_MISPLACED_COMMAS = (re.compile(r",\s*+[,\]}]"), re.compile(r"\[\s*+,"), re.compile(r"{\s*+,"))
+# tokens of a container being skipped without any misplaced commas
+_JSON_SKIP_STRICT = re.compile(r'(?:[^"\[{,]+|' + _JSON_STRING.pattern + r'|[\[{](?!\s*,)|,(?!\s*[,\]}]))*')
+
+
+@dataclass
+class _JSONFrame:
+    """An object or array on the path to the values being extracted by a :py:class:`_JSONStreamParser`."""
+    is_object: bool
+    key: str | int | None = None
+
+
+class _JSONStreamParser:
+    """
+    Incrementally parses a JSON document fed in chunks, returning the values found at the given ``path``.
+
+    Only the containers along the ``path`` are tracked. All other values are skipped without being decoded,
+    and each value found at the ``path`` is decoded only once it has been fed in full.
+    The data buffered is therefore never much more than a single chunk or a single value at the ``path``.
+
+    :param path: The keys of objects or indices of arrays leading to the values to extract.
+        Use ``*`` to match every key of an object or every index of an array.
+    """
+
+    __slots__ = (
+        "path",
+        "_decoder",
+        "_text_decoder",
+        "_buffer",
+        "_stack",
+        "_state",
+        "_skip_depth",
+        "_skip_last",
+        "_skip_string",
+        "_wait_until",
+    )
+
+    def __init__(self, path: list[str]):
+        self.path = path
+
+        self._decoder = json.JSONDecoder()
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._stack: list[_JSONFrame] = []
+        self._state = "value"
+        self._skip_depth = 0
+        self._skip_last = ""
+        self._skip_string = False
+        self._wait_until = 0
+
+    def feed(self, data: bytes) -> list[JSON]:
+        """Feed the next chunk of the document, returning the values at the path completed by this chunk."""
+        self._buffer += self._text_decoder.decode(data)
+        if len(self._buffer) < self._wait_until:
+            return []
+        return self._parse(final=False)
+
+    def close(self) -> list[JSON]:
+        """
+        Signal the end of the document, returning any remaining values at the path.
+
+        :raise PayloadHandlerError: When the document is incomplete.
+        """
+        self._buffer += self._text_decoder.decode(b"", final=True)
+        values = self._parse(final=True)
+        if self._state != "end" or self._buffer.strip():
+            raise PayloadHandlerError("Incomplete JSON document")
+        return values
+
+    def _parse(self, final: bool) -> list[JSON]:
+        values = []
+        buffer = self._buffer
+        pos = 0
+        self._wait_until = 0
+
+        while True:
+            if self._skip_depth or self._skip_string:
+                pos = self._skip(buffer, pos)
+                if self._skip_depth or self._skip_string:
+                    break
+                self._state = "next" if self._stack else "end"
+
+            pos = _JSON_WHITESPACE.match(buffer, pos).end()
+            if pos >= len(buffer):
+                break
+
+            char = buffer[pos]
+            match self._state:
+                case "array" if char == "]":
+                    pos = self._close(pos)  # empty array
+                case "value" | "array":
+                    end = self._parse_value(buffer, pos, final=final, values=values)
+                    if end is None:
+                        break
+                    pos = end
+                case "object" if char == "}":
+                    pos = self._close(pos)  # empty object
+                case "key" | "object" if char == '"':
+                    if (token := _JSON_STRING.match(buffer, pos)) is None:
+                        # wait for more data, backing off to avoid scanning a large key from the start on every chunk
+                        self._wait_until = 2 * (len(buffer) - pos)
+                        break
+                    self._stack[-1].key = json.loads(token.group())
+                    self._state = "colon"
+                    pos = token.end()
+                case "colon" if char == ":":
+                    self._state = "value"
+                    pos += 1
+                case "next" if char == ",":
+                    frame = self._stack[-1]
+                    if frame.is_object:
+                        self._state = "key"
+                    else:
+                        frame.key += 1
+                        self._state = "value"
+                    pos += 1
+                case "next" if char in "}]":
+                    pos = self._close(pos)
+                case _:
+                    raise PayloadHandlerError(f"Invalid JSON document: unexpected character {char!r}")
+
+        self._buffer = buffer[pos:]
+        return values
+
+    def _parse_value(self, buffer: str, pos: int, final: bool, values: list[JSON]) -> int | None:
+        """
+        Parse the value starting at ``pos``, adding it to ``values`` when it is at the path.
+
+        :return: The position after the value or, when more data is needed, None.
+        """
+        char = buffer[pos]
+        depth = len(self._stack)
+        matched = depth == 0 or self._match(self.path[depth - 1], self._stack[-1].key)
+
+        if matched and depth == len(self.path):
+            return self._decode_value(buffer, pos, final=final, values=values)
+
+        if char in "{[":
+            if matched:
+                self._stack.append(_JSONFrame(is_object=char == "{", key=None if char == "{" else 0))
+                self._state = "object" if char == "{" else "array"
+            else:
+                self._skip_depth = 1
+                self._skip_last = char
+            return pos + 1
+
+        if char == '"':  # skipped as it is fed such that a large string is never buffered in full
+            self._skip_string = True
+            end = pos + 1
+        elif (end := self._decode_scalar(buffer, pos, final=final)[1]) is None:
+            return
+
+        self._state = "next" if self._stack else "end"
+        return end
+
+    def _decode_value(self, buffer: str, pos: int, final: bool, values: list[JSON]) -> int | None:
+        """
+        Decode the value at the path starting at ``pos``, adding it to ``values``.
+
+        :return: The position after the value or, when more data is needed, None.
+        """
+        if buffer[pos] not in '"{[':
+            value, end = self._decode_scalar(buffer, pos, final=final)
+            if end is None:
+                return
+        else:
+            try:
+                value, end = self._decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if final:
+                    raise PayloadHandlerError("Invalid JSON document")
+                # wait for more data, backing off to avoid decoding a large value from the start on every chunk
+                self._wait_until = 2 * (len(buffer) - pos)
+                return
+
+        values.append(value)
+        self._state = "next" if self._stack else "end"
+        return end
+
+    @staticmethod
+    def _decode_scalar(buffer: str, pos: int, final: bool) -> tuple[JSON_VALUE, int | None]:
+        """
+        Decode the number, boolean, or null starting at ``pos``.
+        A scalar is only decoded once the character following it has been fed, as it may continue in the next chunk.
+
+        :return: The value and the position after the value or, when more data is needed, None.
+        :raise PayloadHandlerError: When the scalar is not a valid JSON value.
+        """
+        token = _JSON_SCALAR.match(buffer, pos)
+        if token is None:
+            raise PayloadHandlerError(f"Invalid JSON document: unexpected character {buffer[pos]!r}")
+        if token.end() == len(buffer) and not final:
+            return None, None
+
+        try:
+            return json.loads(token.group()), token.end()
+        except json.JSONDecodeError:
+            raise PayloadHandlerError(f"Invalid JSON document: invalid value {token.group()!r}")
+
+    def _skip(self, buffer: str, pos: int) -> int:
+        """
+        Skip over the rest of a string or the contents of a container which is not on the path,
+        returning the position reached.
+
+        :raise PayloadHandlerError: When a skipped container has an empty element or a trailing comma.
+        """
+        while self._skip_string or self._skip_depth:
+            if self._skip_string:
+                pos = _JSON_STRING_CONTENT.match(buffer, pos).end()
+                if pos >= len(buffer) or buffer[pos] != '"':
+                    break
+                self._skip_string = False
+                self._skip_last = ""
+                pos += 1
+                continue
+
+            start = pos
+            while self._skip_depth and (token := _JSON_SKIP.match(buffer, pos)) is not None:
+                if (char := buffer[pos]) in "{[":
+                    self._skip_depth += 1
+                elif char in "}]":
+                    self._skip_depth -= 1
+                pos = token.end()
+            self._check_skipped(buffer, start, pos)
+
+            if not self._skip_depth or pos >= len(buffer):
+                break
+            self._skip_string = True  # a string which continues in the next chunk
+            pos += 1
+
+        return pos
+
+    def _check_skipped(self, buffer: str, start: int, end: int) -> None:
+        """
+        Check the tokens of a container skipped from ``start`` to ``end`` have no empty elements or trailing commas,
+        including with the last significant character skipped before them.
+        Only the contents of a skipped container are checked, its values are never decoded.
+
+        :raise PayloadHandlerError: When the skipped tokens have an empty element or a trailing comma.
+        """
+        skipped = self._skip_last + buffer[start:end]
+        if any(pattern.search(skipped) for pattern in _JSON_MISPLACED_COMMAS):  # may be within a string
+            if _JSON_SKIP_STRICT.match(skipped).end() < len(skipped):
+                raise PayloadHandlerError("Invalid JSON document: empty element or trailing comma")
+
+        last = end - 1
+        while last >= start and buffer[last].isspace():
+            last -= 1
+        if last >= start:  # only an opening bracket or a comma constrains the tokens which follow
+            self._skip_last = buffer[last] if buffer[last] in "[{," else ""
+
+    def _close(self, pos: int) -> int:
+        self._stack.pop()
+        self._state = "next" if self._stack else "end"
+        return pos + 1
+
+    @staticmethod
+    def _match(segment: str, key: str | int) -> bool:
+        return segment == "*" or segment == str(key)
+
+
+class StreamingJSONPayloadHandler(PayloadHandler[list[JSON]]):
+    """
+    Handles JSON payloads incrementally, extracting only the values found at the given ``path``.
+
+    Use :py:meth:`iterate` to yield each value as soon as it has been read from the response,
+    keeping memory usage proportional to a single value rather than the whole payload.
+    Use :py:meth:`.RequestHandler.stream_payload` to send a request and iterate through its payload in this way.
+    When called as a regular payload handler, returns a list of all the values found at the path.
+
+    :param path: The dot-separated keys of objects or indices of arrays leading to the values to extract
+        e.g. ``items.*`` for every item of the ``items`` array of the root object.
+        Use ``*`` to match every key of an object or every index of an array,
+        and an empty string to extract the whole document as a single value.
+    :param chunk_size: The maximum size in bytes of each chunk to read from the response.
+    :param codec: The codec to encode JSON data with when serializing.
+        Defaults to the fastest codec available as given by :py:func:`.get_json_codec`.
+    """
+
+    __slots__ = ("path", "chunk_size", "codec")
+
+    def __init__(self, path: str = "*", chunk_size: int = 2 ** 16, codec: JSONCodec | None = None):
+        #: The keys of objects or indices of arrays leading to the values to extract
+        self.path: list[str] = path.split(".") if path else []
+        #: The maximum size in bytes of each chunk to read from the response
+        self.chunk_size = chunk_size
+        #: The codec to encode JSON data with when serializing
+        self.codec = codec if codec is not None else get_json_codec()
+
+    async def serialize(self, payload: str | bytes | bytearray | list[JSON]) -> str:
+        if isinstance(payload, str | bytes | bytearray):
+            payload = await self.deserialize(payload)
+        return self.codec.dumps(payload)
+
+    async def deserialize(self, response: str | bytes | bytearray | ClientResponse | JSON) -> list[JSON]:
+        match response:
+            case ClientResponse():
+                return [value async for value in self.iterate(response)]
+            case str():
+                return self._parse(response.encode())
+            case bytes() | bytearray():
+                return self._parse(bytes(response))
+            case dict() | list():
+                return list(self._select(response, path=self.path))
+            case _:
+                raise PayloadHandlerError(f"Unrecognised input type: {response}")
+
+    async def iterate(self, response: ClientResponse) -> AsyncIterator[JSON]:
+        """
+        Read the payload of the given ``response`` in chunks, yielding each value at the path once it has been read.
+
+        :raise PayloadHandlerError: When the payload is not a valid JSON document.
+        """
+        parser = _JSONStreamParser(self.path)
+        while chunk := await response.content.read(self.chunk_size):
+            for value in parser.feed(chunk):
+                yield value
+
+        for value in parser.close():
+            yield value
+
+    def _parse(self, data: bytes) -> list[JSON]:
+        parser = _JSONStreamParser(self.path)
+        return parser.feed(data) + parser.close()
+
+    def _select(self, value: JSON, path: list[str]) -> Iterator[JSON]:
+        """Yield the values at the given ``path`` of an already decoded ``value``."""
+        if not path:
+            yield value
+            return
+
+        segment, *path = path
+        match value:
+            case dict():
+                items = value.items()
+            case list():
+                items = enumerate(value)
+            case _:
+                return
+
+        for key, item in items:
+            if _JSONStreamParser._match(segment, key):
+                yield from self._select(item, path=path)
+
+
+_CONTENT_RANGE_START = re.compile(r"^bytes (\d+)-")
+
+
+class FilePayloadHandler(PayloadHandler[Path]):
+    """
+    Handles payloads by writing them to a file in chunks as they are read from the response,
+    keeping memory usage bounded by the ``chunk_size`` regardless of the size of the payload.
+
+    The number of bytes written is tracked so that, when used with :py:meth:`.RequestHandler.download`,
+    a request which fails part way through reading the payload is retried from the last byte written
+    with a ``Range`` header. Should the retried response return the whole payload, the file is written again
+    from the start. Should it return a partial payload which does not start from this byte, an error is raised
+    and progress on the payload is forgotten such that the next request asks for the whole payload.
+    An instance should only be used for one download at a time.
+
+    :param path: The path of the file to write payloads to.
+    :param chunk_size: The maximum size in bytes of each chunk to read from the response.
+    :param digest: The name of a :py:mod:`hashlib` algorithm to compute the digest of the payload with
+        as it is written e.g. ``sha256``.
+    """
+
+    __slots__ = ("path", "chunk_size", "digest", "_hash", "_offset", "_validator")
+
+    @property
+    def offset(self) -> int:
+        """The number of bytes of the current payload written to the file."""
+        return self._offset
+
+    @property
+    def hexdigest(self) -> str | None:
+        """The digest of the bytes of the current payload written to the file, or None if no digest is configured."""
+        return self._hash.hexdigest() if self._hash is not None else None
+
+    def __init__(self, path: str | Path, chunk_size: int = 2 ** 16, digest: str | None = None):
+        #: The path of the file to write payloads to
+        self.path = Path(path)
+        #: The maximum size in bytes of each chunk to read from the response
+        self.chunk_size = chunk_size
+        #: The name of the :py:mod:`hashlib` algorithm to compute the digest of the payload with
+        self.digest = digest
+
+        self._hash = None
+        self._offset = 0
+        self._validator: str | None = None
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget any progress on the current payload so that the next payload is written from the start."""
+        self._hash = hashlib.new(self.digest) if self.digest else None
+        self._offset = 0
+        self._validator = None
+
+    def get_headers(self, headers: Mapping[str, str] | None = None) -> dict[str, str]:
+        """
+        Get the given request ``headers`` updated to only request the bytes of the payload not yet written.
+
+        The ``If-Range`` header is set from the ``ETag`` or ``Last-Modified`` header of the response
+        which started the payload so that the whole payload is returned should it have changed since.
+        """
+        headers = dict(headers or {})
+        if self._offset:
+            headers[hdrs.RANGE] = f"bytes={self._offset}-"
+            if self._validator:
+                headers[hdrs.IF_RANGE] = self._validator
+        return headers
+
+    async def serialize(self, payload: str | bytes | bytearray | Path) -> str:
+        if isinstance(payload, Path):
+            raise PayloadHandlerError(f"Payloads written to a file cannot be serialized: {payload}")
+        if isinstance(payload, bytes | bytearray):
+            return bytes(payload).decode()
+        return str(payload)
+
+    async def deserialize(self, response: str | bytes | bytearray | ClientResponse | Path) -> Path:
+        match response:
+            case ClientResponse():
+                return await self._write_response(response)
+            case str():
+                return self._write(response.encode())
+            case bytes() | bytearray():
+                return self._write(bytes(response))
+            case Path():
+                return response
+            case _:
+                raise PayloadHandlerError(f"Unrecognised input type: {response}")
+
+    def _write(self, data: bytes) -> Path:
+        self.reset()
+        with open(self.path, "wb") as file:
+            self._write_chunk(file, data)
+        return self.path
+
+    async def _write_response(self, response: ClientResponse) -> Path:
+        """
+        Write the payload of the given ``response``, continuing the current payload when the response allows.
+
+        :raise PayloadHandlerError: When the response is a partial payload which does not start from the last byte
+            written, as writing it would corrupt the file.
+        """
+        if response.status == HTTPStatus.PARTIAL_CONTENT and self._get_range_start(response) != self._offset:
+            content_range = response.headers.get(hdrs.CONTENT_RANGE)
+            self.reset()
+            raise PayloadHandlerError(
+                f"Partial response does not continue the payload from the last byte written: {content_range}"
+            )
+
+        if not self._continues(response):
+            self.reset()
+            self._validator = self._get_validator(response)
+            open(self.path, "wb").close()
+
+        # the file is closed on failure so that all bytes counted in the offset are written when retrying
+        with open(self.path, "ab") as file:
+            while chunk := await response.content.read(self.chunk_size):
+                self._write_chunk(file, chunk)
+
+        return self.path
+
+    def _write_chunk(self, file: BinaryIO, chunk: bytes) -> None:
+        file.write(chunk)
+        self._offset += len(chunk)
+        if self._hash is not None:
+            self._hash.update(chunk)
+
+    def _continues(self, response: ClientResponse) -> bool:
+        """Check whether the given ``response`` continues the current payload from the last byte written."""
+        if not self._offset or response.status != HTTPStatus.PARTIAL_CONTENT:
+            return False
+        return self._get_range_start(response) == self._offset
+
+    @staticmethod
+    def _get_range_start(response: ClientResponse) -> int | None:
+        """Get the position of the first byte of the given partial ``response`` from its Content-Range header."""
+        match = _CONTENT_RANGE_START.match(response.headers.get(hdrs.CONTENT_RANGE, ""))
+        return int(match.group(1)) if match is not None else None
+
+    @staticmethod
+    def _get_validator(response: ClientResponse) -> str | None:
+        """Get the value to identify the payload of the given ``response`` when requesting the rest of its bytes."""
+        etag = response.headers.get(hdrs.ETAG)
+        if etag and not etag.startswith("W/"):  # only strong validators may be used for range requests
+            return etag
+        return response.headers.get(hdrs.LAST_MODIFIED)
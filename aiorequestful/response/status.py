@@ -10,12 +10,14 @@ import logging
 from abc import ABC, abstractmethod
 from collections.abc import Awaitable
 from datetime import datetime, timedelta
-from http import HTTPStatus
+from http import HTTPStatus, HTTPMethod
 from typing import NoReturn
 
 from aiohttp import ClientResponse, ClientSession
 
 from aiorequestful.auth import Authoriser
+from aiorequestful.exception import DeadlineExceededError
+from aiorequestful.limiter import RateLimiter
 from aiorequestful.response.exception import ResponseError, StatusHandlerError
 from aiorequestful.timer import Timer
 
@@ -121,7 +123,12 @@ class UnauthorisedStatusHandler(StatusHandler):
 
 
 class RateLimitStatusHandler(StatusHandler):
-    """Handles rate limits by increasing a timer value for every response that returns a rate limit status."""
+    """
+    Handles rate limits by increasing a timer value for every response that returns a rate limit status.
+
+    When the response gives a time to wait before retrying, the given rate limiter is also paused for this time
+    such that all requests which share the rate limiter back off together.
+    """
 
     __slots__ = ("_wait_logged",)
 
@@ -138,6 +145,8 @@ class RateLimitStatusHandler(StatusHandler):
             response: ClientResponse,
             wait_timer: Timer | None = None,
             retry_timer: Timer | None = None,
+            time_remaining: float | None = None,
+            rate_limiter: RateLimiter | None = None,
             *_,
             **__
     ) -> bool:
@@ -149,6 +158,8 @@ class RateLimitStatusHandler(StatusHandler):
             return False
 
         wait_seconds = int(response.headers["retry-after"])
+        if rate_limiter is not None:  # pause all requests sharing the rate limiter, even if this one gives up
+            rate_limiter.pause(method=HTTPMethod(response.method), url=response.url, delay=wait_seconds)
         wait_dt_str = (datetime.now() + timedelta(seconds=wait_seconds)).strftime("%Y-%m-%d %H:%M:%S")
 
         if retry_timer is not None and wait_seconds > retry_timer.total:  # exception if too long
@@ -156,6 +167,11 @@ class RateLimitStatusHandler(StatusHandler):
                 "Rate limit exceeded and wait time is greater than remaining timeout "
                 f"of {retry_timer.total_remaining:.2f} seconds. Retry again at {wait_dt_str}"
             )
+        if time_remaining is not None and wait_seconds >= time_remaining:  # exception if past the deadline
+            raise DeadlineExceededError(
+                "Rate limit exceeded and wait time is greater than the time remaining until the deadline "
+                f"of {time_remaining:.2f} seconds. Retry again at {wait_dt_str}"
+            )
 
         if not self._wait_logged:
             self.logger.warning(f"\33[93mRate limit exceeded. Retrying again at {wait_dt_str}\33[0m")
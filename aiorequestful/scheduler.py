@@ -0,0 +1,195 @@
+"""
+Implements a scheduler to share the capacity of a :py:class:`.RequestHandler` between lanes of requests.
+
+Requests are assigned to a lane, such as a lane for interactive requests and a lane for bulk requests.
+When more requests are waiting than the scheduler allows in flight, requests are dispatched from each lane
+using weighted fair queueing such that each lane receives a share of the capacity proportional to its weight.
+Requests in a high weight lane therefore skip ahead of requests in a low weight lane
+without the low weight lane ever being starved.
+"""
+import asyncio
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+from aiorequestful.exception import InputError
+from aiorequestful.types import Number
+
+
+class Lane:
+    """
+    Configuration for one lane of requests on a :py:class:`RequestScheduler`.
+
+    :param name: The name of the lane.
+    :param weight: The share of the capacity of the scheduler to give to this lane relative to the other lanes.
+    :param limit: The maximum number of requests in this lane allowed in flight at once.
+    """
+
+    __slots__ = ("name", "weight", "limit")
+
+    def __init__(self, name: str, weight: Number = 1, limit: int | None = None):
+        if weight <= 0:
+            raise InputError(f"Weight must be greater than 0: {weight}")
+        if limit is not None and limit < 1:
+            raise InputError(f"Limit must be at least 1: {limit}")
+
+        #: The name of the lane
+        self.name = name
+        #: The share of the capacity of the scheduler to give to this lane relative to the other lanes
+        self.weight = weight
+        #: The maximum number of requests in this lane allowed in flight at once
+        self.limit = limit
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(name={self.name!r}, weight={self.weight}, limit={self.limit})"
+
+
+@dataclass
+class _LaneState:
+    """The state of the requests for one lane."""
+    lane: Lane
+    waiters: deque[asyncio.Future] = field(default_factory=deque)
+    in_flight: int = 0
+    start: float = 0
+    finish: float = 0
+
+
+class RequestScheduler:
+    """
+    Limits the number of requests in flight, dispatching waiting requests from each lane
+    using weighted fair queueing.
+
+    Each time a request is allowed to be sent, the next request is taken from the lane which has received the
+    smallest share of the capacity relative to its weight.
+    As the scheduler is placed in front of the rate limiter and the rest of the send path,
+    the rate of requests is also shared between lanes in proportion to their weights
+    whenever requests are waiting on the rate limit.
+
+    :param lanes: The lanes to share the capacity of the scheduler between.
+        Where weights are equal, requests are taken from lanes in the order given.
+    :param limit: The maximum number of requests in all lanes allowed in flight at once.
+    :param default: The name of the lane to use for requests which do not give a lane.
+        Defaults to the first of the given ``lanes``.
+    """
+
+    __slots__ = ("limit", "default", "_lanes", "_in_flight", "_virtual_time")
+
+    @property
+    def lanes(self) -> list[Lane]:
+        """The lanes to share the capacity of the scheduler between."""
+        return [state.lane for state in self._lanes.values()]
+
+    @property
+    def in_flight(self) -> int:
+        """The current number of requests in flight in all lanes."""
+        return self._in_flight
+
+    @property
+    def waiting(self) -> int:
+        """The current number of requests waiting to be sent in all lanes."""
+        return sum(len(state.waiters) for state in self._lanes.values())
+
+    def __init__(self, lanes: Iterable[Lane], limit: int = 10, default: str | None = None):
+        self._lanes: dict[str, _LaneState] = {}
+        for lane in lanes:
+            if lane.name in self._lanes:
+                raise InputError(f"Lane names must be unique: {lane.name}")
+            self._lanes[lane.name] = _LaneState(lane=lane)
+
+        if not self._lanes:
+            raise InputError("At least one lane must be given")
+        if limit < 1:
+            raise InputError(f"Limit must be at least 1: {limit}")
+        if default is not None and default not in self._lanes:
+            raise InputError(f"Default lane not found: {default}")
+
+        #: The maximum number of requests in all lanes allowed in flight at once
+        self.limit = limit
+        #: The name of the lane to use for requests which do not give a lane
+        self.default = default if default is not None else next(iter(self._lanes))
+
+        self._in_flight = 0
+        self._virtual_time = 0.0
+
+    def _get_state(self, lane: str | None) -> _LaneState:
+        lane = lane if lane is not None else self.default
+        if lane not in self._lanes:
+            raise InputError(f"Lane not found: {lane}")
+        return self._lanes[lane]
+
+    def get_in_flight(self, lane: str | None = None) -> int:
+        """Get the current number of requests in flight in the given ``lane``."""
+        return self._get_state(lane).in_flight
+
+    def get_waiting(self, lane: str | None = None) -> int:
+        """Get the current number of requests waiting to be sent in the given ``lane``."""
+        return len(self._get_state(lane).waiters)
+
+    async def acquire(self, lane: str | None = None) -> None:
+        """
+        Wait until a request in the given ``lane`` is allowed to be sent.
+        Every call must be followed by a call to :py:meth:`release` for the same ``lane``
+        once the request has completed.
+
+        :param lane: The name of the lane of the request. Defaults to the ``default`` lane.
+        :raise InputError: If the lane is not found.
+        """
+        state = self._get_state(lane)
+
+        future = asyncio.get_running_loop().create_future()
+        if not state.waiters:  # lane is now waiting, an idle lane cannot claim capacity used while it was idle
+            state.start = max(state.finish, self._virtual_time)
+        state.waiters.append(future)
+        self._dispatch()
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():  # slot was given to this waiter, pass it on
+                self.release(lane)
+            raise
+        finally:
+            if future in state.waiters:
+                state.waiters.remove(future)
+
+    def release(self, lane: str | None = None) -> None:
+        """Release a request in the given ``lane`` which was allowed by :py:meth:`acquire`."""
+        state = self._get_state(lane)
+        state.in_flight -= 1
+        self._in_flight -= 1
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        """Allow waiting requests to be sent up to the limits, taking the next request from the fairest lane."""
+        while self._in_flight < self.limit:
+            state = self._get_next_lane()
+            if state is None:
+                break
+
+            future = state.waiters.popleft()
+            if future.done():  # waiter was cancelled
+                continue
+
+            self._virtual_time = state.start
+            state.finish = state.start + 1 / state.lane.weight
+            state.start = state.finish
+
+            state.in_flight += 1
+            self._in_flight += 1
+            future.set_result(None)
+
+    def _get_next_lane(self) -> _LaneState | None:
+        """Get the lane with waiting requests which has received the smallest share of capacity for its weight."""
+        next_state = None
+        next_finish = None
+
+        for state in self._lanes.values():
+            if not state.waiters or (state.lane.limit is not None and state.in_flight >= state.lane.limit):
+                continue
+
+            finish = state.start + 1 / state.lane.weight
+            if next_finish is None or finish < next_finish:
+                next_state = state
+                next_finish = finish
+
+        return next_state
@@ -10,6 +10,7 @@ which often return a '429 - Too Many Requests' status.
 import asyncio
 import functools
 import itertools
+import random
 from abc import ABC, ABCMeta, abstractmethod
 from asyncio import sleep
 from collections.abc import Generator
@@ -489,3 +490,183 @@ class PowerCeilingTimer(CeilingTimer):
 
         self._counter += 1
         return True
+
+
+###########################################################################
+## Jitter timers
+###########################################################################
+class JitterTimer(CountTimer, metaclass=ABCMeta):
+    """
+    Abstract implementation of a :py:class:`CountTimer` which sets the timer to a random value
+    within an exponentially increasing range each time it is increased.
+
+    Randomising the timer value spreads out retries of requests which failed at the same time,
+    preventing them from retrying in lockstep.
+    As the timer value is random, :py:attr:`final`, :py:attr:`total` and :py:attr:`total_remaining`
+    give the upper bounds of the timer values.
+
+    Deep copies of this timer share the same random number generator such that each copy
+    draws different values while a seeded timer still produces a reproducible sequence of values.
+
+    :param initial: The base value from which to calculate the range of each value.
+    :param count: The amount of times to increase the value.
+    :param factor: The amount to multiply the upper bound of the range by for each value increase.
+    :param cap: The maximum value of the timer.
+    :param seed: The seed for the random number generator or the :py:class:`random.Random` generator to use.
+    """
+
+    __slots__ = ("_factor", "_cap", "_random")
+
+    @property
+    def final(self):
+        if self.count is None:
+            return self.cap
+        return self._get_bound(self.count)
+
+    @property
+    def total(self):
+        if self.count is None:
+            return
+        return sum(self._get_bound(i) for i in range(self.count + 1))
+
+    @property
+    def total_remaining(self):
+        if self.count is None:
+            return
+        return sum(self._get_bound(i) for i in range(self.counter + 1, self.count + 1))
+
+    @property
+    def factor(self) -> Number:
+        """The amount to multiply the upper bound of the range by in seconds."""
+        return self._factor
+
+    @property
+    def cap(self) -> Number | None:
+        """The maximum value of the timer in seconds."""
+        return self._cap
+
+    def __init__(
+            self,
+            initial: Number = 1,
+            count: int = None,
+            factor: Number = 2,
+            cap: Number = None,
+            seed: int | random.Random | None = None
+    ):
+        super().__init__(initial=initial, count=count)
+        self._factor = factor
+        self._cap = cap
+        self._random = seed if isinstance(seed, random.Random) else random.Random(seed)
+
+        self.reset()
+
+    def __deepcopy__(self, memo: dict):
+        memo[id(self._random)] = self._random
+        return super().__deepcopy__(memo)
+
+    def _apply_cap(self, value: Number) -> Number:
+        return value if self.cap is None else min(self.cap, value)
+
+    @abstractmethod
+    def _get_bound(self, counter: int) -> Number:
+        """Returns the upper bound of the timer value after it has been increased ``counter`` times."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def _draw(self) -> Number:
+        """Returns a new random timer value for the current ``counter``."""
+        raise NotImplementedError
+
+    def increase(self) -> bool:
+        if not self.can_increase:
+            return False
+
+        self._counter += 1
+        self._value = self._draw()
+        return True
+
+    def reset(self) -> None:
+        super().reset()
+        self._value = self._draw()
+
+
+class FullJitterTimer(JitterTimer):
+    """
+    Sets the timer value to a random value between 0 and an exponentially increasing upper bound
+    a distinct number of times.
+
+    The timer value is drawn from ``uniform(0, min(cap, initial * factor ** counter))``.
+
+    :param initial: The base value from which to calculate the range of each value.
+    :param count: The amount of times to increase the value.
+    :param factor: The amount to multiply the upper bound of the range by for each value increase.
+    :param cap: The maximum value of the timer.
+    :param seed: The seed for the random number generator or the :py:class:`random.Random` generator to use.
+    """
+
+    __slots__ = ()
+
+    def _get_bound(self, counter: int) -> Number:
+        return self._apply_cap(self.initial * self.factor ** counter)
+
+    def _draw(self) -> Number:
+        return self._random.uniform(0, self._get_bound(self.counter))
+
+
+class EqualJitterTimer(JitterTimer):
+    """
+    Sets the timer value to a random value between half of and an exponentially increasing upper bound
+    a distinct number of times.
+
+    The timer value is drawn from ``uniform(bound / 2, bound)`` where ``bound = min(cap, initial * factor ** counter)``.
+
+    :param initial: The base value from which to calculate the range of each value.
+    :param count: The amount of times to increase the value.
+    :param factor: The amount to multiply the upper bound of the range by for each value increase.
+    :param cap: The maximum value of the timer.
+    :param seed: The seed for the random number generator or the :py:class:`random.Random` generator to use.
+    """
+
+    __slots__ = ()
+
+    def _get_bound(self, counter: int) -> Number:
+        return self._apply_cap(self.initial * self.factor ** counter)
+
+    def _draw(self) -> Number:
+        bound = self._get_bound(self.counter)
+        return bound / 2 + self._random.uniform(0, bound / 2)
+
+
+class DecorrelatedJitterTimer(JitterTimer):
+    """
+    Sets the timer value to a random value between the ``initial`` value and
+    a multiple of the previous timer value a distinct number of times.
+
+    The timer value is drawn from ``min(cap, uniform(initial, previous * factor))``
+    where ``previous`` is the previous timer value or the ``initial`` value when the timer is reset.
+
+    :param initial: The base value from which to calculate the range of each value.
+    :param count: The amount of times to increase the value.
+    :param factor: The amount to multiply the previous timer value by to get the upper bound of the range.
+    :param cap: The maximum value of the timer.
+    :param seed: The seed for the random number generator or the :py:class:`random.Random` generator to use.
+    """
+
+    __slots__ = ()
+
+    def __init__(
+            self,
+            initial: Number = 1,
+            count: int = None,
+            factor: Number = 3,
+            cap: Number = None,
+            seed: int | random.Random | None = None
+    ):
+        super().__init__(initial=initial, count=count, factor=factor, cap=cap, seed=seed)
+
+    def _get_bound(self, counter: int) -> Number:
+        return self._apply_cap(self.initial * self.factor ** (counter + 1))
+
+    def _draw(self) -> Number:
+        previous = self.initial if self.counter == 0 else self._value
+        return self._apply_cap(self._random.uniform(self.initial, previous * self.factor))
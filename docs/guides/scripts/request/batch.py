@@ -0,0 +1,45 @@
+from docs.guides.scripts.request._base import *
+
+# INSTANTIATION
+
+from aiorequestful.batch import BatchLoader
+
+
+def batch_request(keys: list[str]) -> dict[str, Any]:
+    """Returns the kwargs of the request for all the items of the given ``keys`` at once."""
+    return {"url": f"{api_url}/tracks", "params": {"ids": ",".join(keys)}}
+
+
+def split(keys: list[str], payload: dict[str, Any]) -> dict[str, Any]:
+    """Returns a map of each key to its item from the payload of the request for many items."""
+    return {item["id"]: item for item in payload["tracks"] if item is not None}
+
+
+def item_request(key: str) -> dict[str, Any]:
+    """Returns the kwargs of the request for the single item of the given ``key``."""
+    return {"url": f"{api_url}/tracks/{key}"}
+
+
+loader = BatchLoader(
+    request_handler,
+    batch_request=batch_request,
+    split=split,
+    item_request=item_request,
+    max_batch_size=50,
+    delay=0.005,
+)
+
+# END
+# LOAD
+
+
+async def get_tracks(keys: list[str]) -> list[Any]:
+    """Loads the track for each of the given ``keys`` one at a time, batching them into as few requests as possible."""
+    async with request_handler:
+        return await asyncio.gather(*(loader.load(key) for key in keys))
+
+tracks = asyncio.run(get_tracks(["1", "2", "3"]))
+
+print(tracks)
+
+# END
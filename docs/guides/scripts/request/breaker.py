@@ -0,0 +1,15 @@
+from docs.guides.scripts.request._base import *
+
+# INSTANTIATION
+
+from aiorequestful.breaker import CircuitBreaker
+
+circuit_breaker = CircuitBreaker(failure_threshold=5, recovery_time=30, half_open_requests=1)
+request_handler = RequestHandler.create(circuit_breaker=circuit_breaker)
+
+task = send_get_request(request_handler, url=api_url)
+result = asyncio.run(task)
+
+print(result)
+
+# END
@@ -0,0 +1,31 @@
+from docs.guides.scripts.request._base import *
+
+# INSTANTIATION
+
+from functools import partial
+
+from aiorequestful.executor import ProcessRequestExecutor
+from aiorequestful.limiter import SharedGCRARateLimiter
+from aiorequestful.response.payload import JSONPayloadHandler
+
+factory = partial(RequestHandler.create, payload_handler=JSONPayloadHandler())
+rate_limiter = SharedGCRARateLimiter(rate=10, period=1, burst=5)
+
+executor = ProcessRequestExecutor(factory, processes=4, limit=20, rate_limiter=rate_limiter)
+
+# END
+# REQUEST
+
+
+async def send_get_requests(url: str | URL, count: int = 20) -> list[Any]:
+    """Sends many GET requests for the given ``url`` across all worker processes."""
+    async with executor:
+        return await executor.request_many({"method": "GET", "url": url} for _ in range(count))
+
+
+if __name__ == "__main__":  # worker processes import this module when they start
+    results = asyncio.run(send_get_requests(api_url))
+    for result in results:
+        print(result)
+
+# END
@@ -0,0 +1,21 @@
+from docs.guides.scripts.request._base import *
+
+# ASSIGNMENT
+
+from aiorequestful.budget import RequestBudget
+from aiorequestful.hedge import Hedger
+
+request_handler.hedger = Hedger(delay=0.5, quantile=0.95, budget=RequestBudget(ratio=0.05, minimum=1))
+
+# END
+# INSTANTIATION
+
+hedger = Hedger(delay=0.5, quantile=0.95)
+request_handler = RequestHandler.create(hedger=hedger)
+
+task = send_get_request(request_handler, url=api_url)
+result = asyncio.run(task)
+
+print(result)
+
+# END
@@ -0,0 +1,54 @@
+from docs.guides.scripts.request._base import *
+
+# ASSIGNMENT
+
+from aiorequestful.limiter import GCRARateLimiter
+
+request_handler.rate_limiter = GCRARateLimiter(rate=10, period=1, burst=5)
+
+# END
+# SCOPE
+
+from http import HTTPMethod
+
+request_handler.rate_limiter = GCRARateLimiter(
+    rate=100,
+    period=60,
+    scope="route",
+    cost=lambda method, url: 5 if method == HTTPMethod.POST else 1,
+)
+
+# END
+# INSTANTIATION
+
+rate_limiter = GCRARateLimiter(rate=10, period=1, burst=5)
+request_handler = RequestHandler.create(rate_limiter=rate_limiter)
+
+task = send_get_request(request_handler, url=api_url)
+result = asyncio.run(task)
+
+print(result)
+
+# END
+# SHARED
+
+from aiorequestful.limiter import SQLiteGCRARateLimiter
+
+rate_limiter = SQLiteGCRARateLimiter("rate_limit.db", rate=10, period=1, burst=5, name="my-api-key")
+request_handler = RequestHandler.create(rate_limiter=rate_limiter)
+
+# END
+# CONCURRENCY
+
+from aiorequestful.limiter import AIMDConcurrencyLimiter
+
+concurrency_limiter = AIMDConcurrencyLimiter(initial=10, minimum=1, maximum=100)
+request_handler = RequestHandler.create(concurrency_limiter=concurrency_limiter)
+
+task = send_get_request(request_handler, url=api_url)
+result = asyncio.run(task)
+
+print(result)
+print(concurrency_limiter.limit)
+
+# END
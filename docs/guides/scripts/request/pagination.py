@@ -0,0 +1,28 @@
+from docs.guides.scripts.request._base import *
+
+# OFFSET
+
+from aiorequestful.pagination import OffsetPaginator
+
+
+async def get_all_items(handler: RequestHandler, url: str | URL) -> list[Any]:
+    """Get every item from the paginated collection at the given ``url`` using the given ``handler``."""
+    paginator = OffsetPaginator(limit=50, offset_param="offset", limit_param="limit", total_key="total")
+
+    async with handler:
+        return [item async for item in handler.paginate(paginator, limit=10, url=url)]
+
+items = asyncio.run(get_all_items(request_handler, url=api_url))
+
+print(items)
+
+# END
+# STRATEGIES
+
+from aiorequestful.pagination import CursorPaginator, NextURLPaginator, LinkHeaderPaginator
+
+paginator = CursorPaginator(cursor_key="meta.next_cursor", cursor_param="cursor", items_key="data")
+paginator = NextURLPaginator(next_key="links.next", items_key="data")
+paginator = LinkHeaderPaginator(rel="next")
+
+# END
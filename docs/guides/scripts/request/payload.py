@@ -25,3 +25,41 @@ print(result)
 print(type(result).__name__)
 
 # END
+# STREAMING
+
+from aiorequestful.response.payload import StreamingJSONPayloadHandler
+
+
+async def count_items(handler: RequestHandler, url: str | URL) -> int:
+    """Count the items of the ``items`` array in the payload at the given ``url`` using the given ``handler``."""
+    payload_handler = StreamingJSONPayloadHandler(path="items.*", chunk_size=2 ** 16)
+
+    count = 0
+    async with handler:
+        async for item in handler.stream_payload(payload_handler, method="GET", url=url):
+            count += 1
+
+    return count
+
+count = asyncio.run(count_items(request_handler, url=api_url))
+
+print(count)
+
+# END
+# DOWNLOAD
+
+from aiorequestful.response.payload import FilePayloadHandler
+
+
+async def download(handler: RequestHandler, url: str | URL) -> None:
+    """Download the payload at the given ``url`` to a file using the given ``handler``."""
+    payload_handler = FilePayloadHandler(path="download.bin", chunk_size=2 ** 16, digest="sha256")
+
+    async with handler:
+        path = await handler.download(payload_handler, url=url)
+
+    print(path, payload_handler.offset, payload_handler.hexdigest)
+
+asyncio.run(download(request_handler, url=api_url))
+
+# END
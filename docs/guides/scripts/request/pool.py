@@ -0,0 +1,59 @@
+from docs.guides.scripts.request._base import *
+
+# INSTANTIATION
+
+from aiorequestful.pool import ConnectionPool
+
+pool = ConnectionPool(limit=50, limit_per_host=10, keepalive_timeout=30, ttl_dns_cache=300)
+request_handler = RequestHandler.create(pool=pool)
+
+# END
+# PRESETS
+
+pool = ConnectionPool.bulk_crawl()
+pool = ConnectionPool.low_latency(limit=20)
+
+# END
+# STATS
+
+request_handler = RequestHandler.create(pool=pool)
+
+
+async def send_and_report(handler: RequestHandler, url: str | URL) -> None:
+    """Sends many GET requests using the given ``handler`` for the given ``url`` and reports on the pool."""
+    async with handler:
+        await handler.get_many([url] * 50)
+        print(pool.stats)
+
+asyncio.run(send_and_report(request_handler, url=api_url))
+
+# END
+# WARM UP
+
+from aiorequestful.pool import ConnectionWarmer
+
+connection_warmer = ConnectionWarmer(urls=[api_url], connections=5)
+request_handler = RequestHandler.create(pool=pool, connection_warmer=connection_warmer)
+
+task = send_get_request(request_handler, url=api_url)
+result = asyncio.run(task)
+
+print(result)
+
+# END
+# PERSISTENT
+
+request_handler = RequestHandler.create(pool=pool, persistent=True)
+
+
+async def run_jobs(handler: RequestHandler, url: str | URL, count: int = 5) -> None:
+    """Runs many jobs which each enter the context of the given ``handler`` to send a GET request."""
+    for _ in range(count):
+        async with handler:  # only the first job opens the session and authorises
+            print(await handler.get(url))
+
+    await handler.close()
+
+asyncio.run(run_jobs(request_handler, url=api_url))
+
+# END
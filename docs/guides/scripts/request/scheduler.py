@@ -0,0 +1,29 @@
+from docs.guides.scripts.request._base import *
+
+# INSTANTIATION
+
+from aiorequestful.scheduler import Lane, RequestScheduler
+
+scheduler = RequestScheduler(
+    lanes=[Lane("interactive", weight=10), Lane("bulk", weight=1, limit=5)],
+    limit=10,
+    default="bulk",
+)
+request_handler = RequestHandler.create(scheduler=scheduler)
+
+# END
+# LANES
+
+
+async def send_requests(handler: RequestHandler) -> list[Any]:
+    """Sends many bulk requests and one interactive request using the given ``handler``."""
+    async with handler:
+        bulk = [handler.get(api_url) for _ in range(20)]
+        interactive = handler.get(api_url, lane="interactive")
+        return await asyncio.gather(*bulk, interactive)
+
+results = asyncio.run(send_requests(request_handler))
+
+print(results[-1])
+
+# END
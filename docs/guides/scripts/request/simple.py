@@ -29,9 +29,9 @@ print(type(result).__name__)
 # END
 # MANY
 
-async def send_get_requests(handler: RequestHandler, url: str | URL, count: int = 20) -> tuple[Any]:
+async def send_get_requests(handler: RequestHandler, url: str | URL, count: int = 20) -> list[Any]:
     async with handler:
-        payloads = await asyncio.gather(*[handler.get(url) for _ in range(count)])
+        payloads = await handler.get_many([url] * count, limit=5)
 
     return payloads
 
@@ -39,6 +39,16 @@ results = asyncio.run(send_get_requests(request_handler, url=api_url, count=20))
 for result in results:
     print(result)
 
+# END
+# STREAM
+
+async def stream_get_requests(handler: RequestHandler, url: str | URL, count: int = 20) -> None:
+    async with handler:
+        async for request, result in handler.stream(({"method": "GET", "url": url} for _ in range(count)), limit=5):
+            print(request["url"], result)
+
+asyncio.run(stream_get_requests(request_handler, url=api_url, count=20))
+
 # END
 # INIT
 
@@ -52,3 +62,22 @@ def connector() -> aiohttp.ClientSession:
 request_handler = RequestHandler(connector=connector)
 
 # END
+# UPLOAD
+
+from aiorequestful.body import FileBody, FactoryBody
+
+
+async def upload(handler: RequestHandler, url: str | URL) -> None:
+    """Upload a large file and a generated body to the given ``url`` using the given ``handler``."""
+    async with handler:
+        await handler.put(url, data=FileBody("upload.bin", chunk_size=2 ** 16))
+
+        def generate_lines():
+            for i in range(1_000_000):
+                yield f"line {i}\n".encode()
+
+        await handler.post(url, data=FactoryBody(generate_lines, content_type="text/plain"))
+
+asyncio.run(upload(request_handler, url=api_url))
+
+# END
@@ -18,6 +18,26 @@ from aiorequestful.timer import StepCeilingTimer
 
 request_handler.wait_timer = StepCeilingTimer(initial=0, final=1, step=0.1)
 
+# END
+# ASSIGNMENT - RETRY BUDGET
+
+from aiorequestful.budget import RequestBudget
+
+request_handler.retry_budget = RequestBudget(ratio=0.1, minimum=5, window=10)
+
+# END
+# ASSIGNMENT - DEADLINE
+
+request_handler.deadline = 30
+
+
+async def send_get_request_with_deadline(handler: RequestHandler, url: str | URL) -> Any:
+    """Sends a simple GET request using the given ``handler`` for the given ``url`` within a 5 second deadline."""
+    async with handler:
+        payload = await handler.get(url, deadline=5)
+
+    return payload
+
 # END
 # INSTANTIATION
 
@@ -33,3 +33,68 @@ async def handle(handler: PayloadHandler, payload: Any) -> None:
 asyncio.run(handle(handler=payload_handler, payload=payload_data))
 
 # END
+# CODEC
+
+from aiorequestful.response.codec import StdlibJSONCodec, get_json_codec
+
+print(get_json_codec())  # the fastest codec installed
+
+payload_handler = JSONPayloadHandler(codec=StdlibJSONCodec())
+
+asyncio.run(handle(handler=payload_handler, payload=payload_data))
+
+# END
+# SCHEMA
+
+from dataclasses import dataclass
+
+from aiorequestful.response.payload import SchemaPayloadHandler
+
+
+@dataclass(slots=True)
+class Item:
+    id: int
+    name: str
+
+
+payload_data = '[{"id": 1, "name": "first", "unknown": true}, {"id": 2, "name": "second"}]'
+payload_handler = SchemaPayloadHandler(list[Item])
+
+
+async def handle(handler: PayloadHandler, payload: Any) -> None:
+    print(await handler.serialize(payload))  # convert the payload data to a string
+    print(await handler.deserialize(payload))  # convert the payload data to a list of Item objects
+
+asyncio.run(handle(handler=payload_handler, payload=payload_data))
+
+# END
+# STREAMING
+
+from aiorequestful.response.payload import StreamingJSONPayloadHandler
+
+payload_data = '{"total": 2, "items": [{"id": 1}, {"id": 2}]}'
+payload_handler = StreamingJSONPayloadHandler(path="items.*")
+
+
+async def handle(handler: PayloadHandler, payload: Any) -> None:
+    print(await handler.serialize(payload))  # convert the values at the path to a string
+    print(await handler.deserialize(payload))  # convert the payload data to a list of the values at the path
+
+asyncio.run(handle(handler=payload_handler, payload=payload_data))
+
+# END
+# FILE
+
+from aiorequestful.response.payload import FilePayloadHandler
+
+payload_data = b"binary data"
+payload_handler = FilePayloadHandler(path="payload.bin", digest="sha256")
+
+
+async def handle(handler: FilePayloadHandler, payload: Any) -> None:
+    print(await handler.deserialize(payload))  # write the payload data to the file and return its path
+    print(handler.hexdigest)  # the digest of the payload data
+
+asyncio.run(handle(handler=payload_handler, payload=payload_data))
+
+# END
@@ -76,3 +76,42 @@ timer.increase()  # value = 60
 print(float(timer))
 
 # END
+# FullJitterTimer
+
+from aiorequestful.timer import FullJitterTimer
+
+timer = FullJitterTimer(initial=1, count=3, factor=2, cap=10, seed=42)  # value = random between 0-1
+timer.increase()  # value = random between 0-2
+timer.increase()  # value = random between 0-4
+timer.increase()  # value = random between 0-8
+timer.increase()  # value unchanged (max count of 3 reached)
+
+print(float(timer), timer.total)  # total = 15, the sum of the maximum possible values
+
+# END
+# EqualJitterTimer
+
+from aiorequestful.timer import EqualJitterTimer
+
+timer = EqualJitterTimer(initial=1, count=3, factor=2, cap=10, seed=42)  # value = random between 0.5-1
+timer.increase()  # value = random between 1-2
+timer.increase()  # value = random between 2-4
+timer.increase()  # value = random between 4-8
+timer.increase()  # value unchanged (max count of 3 reached)
+
+print(float(timer))
+
+# END
+# DecorrelatedJitterTimer
+
+from aiorequestful.timer import DecorrelatedJitterTimer
+
+timer = DecorrelatedJitterTimer(initial=1, count=3, factor=3, cap=10, seed=42)  # value = random between 1-3
+timer.increase()  # value = random between 1 and 3x the previous value
+timer.increase()  # value = random between 1 and 3x the previous value
+timer.increase()  # value = random between 1 and 3x the previous value, up to a maximum of 10
+timer.increase()  # value unchanged (max count of 3 reached)
+
+print(float(timer))
+
+# END
@@ -0,0 +1,94 @@
+from typing import Any, Self
+
+from aiorequestful.cache.backend.base import ResponseRepository, ResponseValidators
+from tests.cache.backend.utils import MockResponseRepositorySettings
+
+
+class TestResponseValidators:
+
+    def test_from_headers(self):
+        assert ResponseValidators.from_headers({}) is None
+        assert ResponseValidators.from_headers({"Content-Type": "application/json"}) is None
+
+        validators = ResponseValidators.from_headers({"ETag": '"version"'})
+        assert validators == ResponseValidators(etag='"version"')
+
+        last_modified = "Wed, 21 Oct 2015 07:28:00 GMT"
+        validators = ResponseValidators.from_headers({"ETag": 'W/"version"', "Last-Modified": last_modified})
+        assert validators == ResponseValidators(etag='W/"version"', last_modified=last_modified)
+
+    def test_headers(self):
+        assert ResponseValidators().headers == {}
+        assert ResponseValidators(etag='"version"').headers == {"If-None-Match": '"version"'}
+
+        last_modified = "Wed, 21 Oct 2015 07:28:00 GMT"
+        assert ResponseValidators(etag='"version"', last_modified=last_modified).headers == {
+            "If-None-Match": '"version"', "If-Modified-Since": last_modified
+        }
+
+
+class DictResponseRepository(ResponseRepository[tuple, Any]):
+    """A repository implementing only the methods required before response validators were stored."""
+
+    _required_modules = []
+
+    @classmethod
+    def create(cls, *args, **kwargs) -> Self:
+        return cls(*args, **kwargs)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.connection = {}
+
+    def __await__(self):
+        yield
+        return self
+
+    def __aiter__(self):
+        raise NotImplementedError
+
+    async def commit(self) -> None:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+    async def count(self, include_expired: bool = True) -> int:
+        return len(self.connection)
+
+    async def contains(self, request) -> bool:
+        return self.get_key_from_request(request) in self.connection
+
+    async def clear(self, expired_only: bool = False) -> int:
+        count = len(self.connection)
+        self.connection.clear()
+        return count
+
+    def get_key_from_request(self, request) -> tuple:
+        return request
+
+    async def get_response(self, request) -> Any:
+        return self.connection.get(self.get_key_from_request(request))
+
+    async def _set_item_from_key_value_pair(self, __key: tuple, __value: Any) -> None:
+        self.connection[__key] = __value
+
+    async def delete_response(self, request) -> bool:
+        return self.connection.pop(self.get_key_from_request(request), None) is not None
+
+
+class TestResponseRepository:
+
+    async def test_repository_without_validators(self):
+        repository = DictResponseRepository(settings=MockResponseRepositorySettings(name="test"))
+        key = ("id",)
+
+        await repository.save_response((key, "value"))
+        assert await repository.get_response(key) == "value"
+
+        await repository._set_item_with_validators(key, "new value", validators=ResponseValidators(etag='"version"'))
+        assert await repository.get_response(key) == "new value"
+
+        # repositories which do not store validators never revalidate their responses
+        assert await repository.get_response_with_validators(key) is None
+        assert not await repository.refresh_response(key, validators=ResponseValidators(etag='"version"'))
@@ -169,6 +169,26 @@ class TestSQLiteTable(SQLiteTester, ResponseRepositoryTester):
         with pytest.raises(ValueError):
             assert await repository.count()
 
+    async def test_init_adds_validator_columns(
+            self, connection: aiosqlite.Connection, settings: ResponseRepositorySettings
+    ):
+        async with connection:
+            # a table created before response validators were stored
+            await connection.execute(
+                f'CREATE TABLE "{settings.name}" ('
+                '"method" VARCHAR(7) NOT NULL, "id" VARCHAR(255) NOT NULL, "name" TEXT, '
+                '"cached_at" TIMESTAMP NOT NULL, "expires_at" TIMESTAMP NOT NULL, "payload" TEXT, '
+                'PRIMARY KEY ("method", "id"))'
+            )
+            repository = await SQLiteTable(connection, settings=settings)
+
+            async with connection.execute(f"SELECT name FROM pragma_table_info('{settings.name}');") as cur:
+                columns = {row[0] async for row in cur}
+            assert {repository.etag_column, repository.last_modified_column}.issubset(columns)
+
+            # creating the table again keeps the existing columns
+            await repository.create()
+
 
 class TestSQLiteCache(SQLiteTester, ResponseCacheTester):
 
@@ -7,8 +7,10 @@ from typing import Any
 import pytest
 from aiohttp import ClientResponse, ClientSession
 from faker import Faker
+from multidict import CIMultiDict, CIMultiDictProxy
 
-from aiorequestful.cache.backend.base import ResponseRepository, ResponseCache, ResponseRepositorySettings
+from aiorequestful.cache.backend.base import ResponseRepository, ResponseCache, ResponseRepositorySettings, \
+    ResponseValidators
 from aiorequestful.cache.exception import CacheError
 from aiorequestful.response.payload import PayloadHandler, StringPayloadHandler, JSONPayloadHandler
 from tests.cache.backend.utils import MockResponseRepositorySettings, MockPaginatedRequestSettings
@@ -244,6 +246,41 @@ class ResponseRepositoryTester(BaseResponseTester, metaclass=ABCMeta):
         assert await repository.contains(key)
         assert await repository.get_response(key) == value
 
+    async def test_save_response_with_validators(self, repository: ResponseRepository):
+        key, value = await self.generate_item(repository.settings)
+        response = await self.generate_response_from_item(repository.settings, key, value)
+        response._headers = CIMultiDictProxy(CIMultiDict({"ETag": '"version"'}))
+        assert await repository.get_response_with_validators(key) is None
+
+        await repository.save_response(response)
+        assert await repository.get_response_with_validators(key) == (value, ResponseValidators(etag='"version"'))
+
+        # responses without validators cannot be revalidated
+        await repository.save_response((key, value))
+        assert await repository.get_response(key) == value
+        assert await repository.get_response_with_validators(key) is None
+
+    async def test_refresh_response(self, repository: ResponseRepository):
+        key, value = await self.generate_item(repository.settings)
+        assert not await repository.refresh_response(key)
+
+        expire = repository._expire
+        repository._expire = -expire  # save a response which has already expired
+        validators = ResponseValidators(last_modified="Wed, 21 Oct 2015 07:28:00 GMT")
+        await repository._set_item_with_validators(key, await repository.serialize(value), validators=validators)
+        repository._expire = expire
+
+        assert await repository.get_response(key) is None
+        assert await repository.get_response_with_validators(key) == (value, validators)
+
+        assert await repository.refresh_response(key)
+        assert await repository.get_response(key) == value
+        assert await repository.get_response_with_validators(key) == (value, validators)
+
+        validators = ResponseValidators(etag='W/"version"')
+        assert await repository.refresh_response(key, validators=validators)
+        assert await repository.get_response_with_validators(key) == (value, validators)
+
     async def test_save_response_fails_silently(self, repository: ResponseRepository):
         key, value = await self.generate_item(repository.settings)
         assert not await repository.contains(key)
@@ -5,7 +5,8 @@ import pytest
 from aioresponses import aioresponses
 from faker import Faker
 
-from aiorequestful.cache.backend.base import ResponseCache
+from aiorequestful.cache.backend.base import ResponseCache, ResponseValidators
+from aiorequestful.cache.response import CachedResponse
 from aiorequestful.cache.session import CachedSession
 from aiorequestful.response.payload import PayloadHandler, JSONPayloadHandler, StringPayloadHandler
 from tests.cache.backend.test_sqlite import TestSQLiteCache as SQLiteCacheTester
@@ -142,3 +143,102 @@ class TestCachedSession:
         assert len(requests_mock.requests) == 1
         assert sum(map(len, requests_mock.requests.values())) == 2
         assert await repository.contains(key)
+
+    async def test_revalidation(
+            self,
+            session: CachedSession,
+            cache: ResponseCache,
+            tester: ResponseCacheTester,
+            requests_mock: aioresponses,
+    ):
+        repository = choice(list(cache.values()))
+
+        expected = await tester.generate_response(repository.settings, session=session)
+        request = expected.request_info
+        key = repository.get_key_from_request(request)
+        value = await repository.deserialize(expected)
+
+        # save a response which has already expired
+        expire = repository._expire
+        repository._expire = -expire
+        validators = ResponseValidators(etag='"version"')
+        await repository._set_item_with_validators(key, await repository.serialize(value), validators=validators)
+        repository._expire = expire
+        assert not await repository.contains(key)
+
+        requests_mock.get(request.url, status=304, headers={"ETag": '"version"'})
+        async with session.request(method=request.method, url=request.url) as response:
+            assert isinstance(response, CachedResponse)
+            assert response.status == 200
+            assert await response.text() == await expected.text()
+
+        call = next(iter(requests_mock.requests.values()))[0]
+        assert call.kwargs["headers"]["If-None-Match"] == '"version"'
+        assert await repository.contains(key)  # expiry time was reset
+
+        # cached response is returned without revalidating until it expires again
+        async with session.request(method=request.method, url=request.url) as response:
+            assert isinstance(response, CachedResponse)
+        assert sum(map(len, requests_mock.requests.values())) == 1
+
+    async def test_revalidation_modified(
+            self,
+            session: CachedSession,
+            cache: ResponseCache,
+            tester: ResponseCacheTester,
+            requests_mock: aioresponses,
+    ):
+        repository = choice(list(cache.values()))
+
+        expected = await tester.generate_response(repository.settings, session=session)
+        request = expected.request_info
+        key = repository.get_key_from_request(request)
+
+        expire = repository._expire
+        repository._expire = -expire
+        await repository._set_item_with_validators(
+            key, await repository.serialize({"old": "value"}), validators=ResponseValidators(etag='"old"')
+        )
+        repository._expire = expire
+
+        requests_mock.get(request.url, status=200, body=await expected.text(), headers={"ETag": '"new"'})
+        async with session.request(method=request.method, url=request.url) as response:
+            assert not isinstance(response, CachedResponse)
+            assert await response.text() == await expected.text()
+
+        # the new response and its validators replace the expired response
+        assert await repository.get_response(key) == await repository.deserialize(expected)
+        _, validators = await repository.get_response_with_validators(key)
+        assert validators == ResponseValidators(etag='"new"')
+
+    async def test_conditional_request_not_revalidated(
+            self,
+            session: CachedSession,
+            cache: ResponseCache,
+            tester: ResponseCacheTester,
+            requests_mock: aioresponses,
+    ):
+        repository = choice(list(cache.values()))
+
+        expected = await tester.generate_response(repository.settings, session=session)
+        request = expected.request_info
+        key = repository.get_key_from_request(request)
+
+        expire = repository._expire
+        repository._expire = -expire
+        await repository._set_item_with_validators(
+            key, await repository.serialize(await repository.deserialize(expected)),
+            validators=ResponseValidators(etag='"version"')
+        )
+        repository._expire = expire
+
+        # the caller handles the response to their own conditional request
+        requests_mock.get(request.url, status=304)
+        headers = {"If-None-Match": '"other"'}
+        async with session.request(method=request.method, url=request.url, headers=headers, persist=False) as response:
+            assert not isinstance(response, CachedResponse)
+            assert response.status == 304
+
+        call = next(iter(requests_mock.requests.values()))[0]
+        assert call.kwargs["headers"]["If-None-Match"] == '"other"'
+        assert not await repository.contains(key)
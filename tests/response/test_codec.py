@@ -0,0 +1,117 @@
+import json
+import timeit
+from collections.abc import Callable
+
+import pytest
+
+from aiorequestful.exception import AIORequestfulImportError
+from aiorequestful.response.codec import JSONCodec, StdlibJSONCodec, OrjsonJSONCodec, MsgspecJSONCodec, \
+    get_json_codec
+from aiorequestful.response.exception import PayloadHandlerError
+from aiorequestful.types import JSON
+
+CODECS: list[type[JSONCodec]] = [StdlibJSONCodec, OrjsonJSONCodec, MsgspecJSONCodec]
+
+
+def get_codec(codec: type[JSONCodec]) -> JSONCodec:
+    try:
+        return codec()
+    except AIORequestfulImportError:
+        pytest.skip(f"{codec.__name__} is not installed")
+
+
+class TestJSONCodec:
+
+    @pytest.fixture(params=CODECS)
+    def codec(self, request: pytest.FixtureRequest) -> JSONCodec:
+        return get_codec(request.param)
+
+    @pytest.fixture
+    def payload(self) -> JSON:
+        return {"key": "value", "items": [1, 2.5, None, True, "é"], "nested": {"key": {"key": []}}}
+
+    def test_loads(self, codec: JSONCodec, payload: JSON):
+        data = json.dumps(payload)
+        assert codec.loads(data) == payload
+        assert codec.loads(data.encode()) == payload
+        assert codec.loads(bytearray(data.encode())) == payload
+        assert codec.loads(memoryview(data.encode())) == payload
+
+        with pytest.raises(PayloadHandlerError):
+            codec.loads('{"key": ')
+        with pytest.raises(PayloadHandlerError):
+            codec.loads(b"\xff")
+
+    def test_dumps(self, codec: JSONCodec, payload: JSON):
+        assert json.loads(codec.dumps(payload)) == payload
+        assert json.loads(codec.dumps({1: "value"})) == {"1": "value"}
+
+        for indent in (2, 4):
+            data = codec.dumps(payload, indent=indent)
+            assert f'\n{" " * indent}"key"' in data
+            assert json.loads(data) == payload
+
+        with pytest.raises(PayloadHandlerError):
+            codec.dumps({"key": object()})
+
+    def test_validate(self, codec: JSONCodec, payload: JSON):
+        codec.validate(payload)
+
+        with pytest.raises(PayloadHandlerError):
+            codec.validate({"key": {"key": object()}})
+
+        payload["circular"] = payload
+        with pytest.raises(PayloadHandlerError):
+            codec.validate(payload)
+
+    def test_get_json_codec(self):
+        # the fastest codec installed is preferred with the stdlib codec as the fallback
+        for codec_class in (OrjsonJSONCodec, MsgspecJSONCodec, StdlibJSONCodec):
+            try:
+                codec_class()
+            except AIORequestfulImportError:
+                continue
+
+            assert isinstance(get_json_codec(), codec_class)
+            break
+
+    @pytest.mark.slow
+    def test_benchmark(self):
+        """
+        Report the speed of the third party codecs installed against the stdlib codec when handling a large payload.
+        Timings vary between runs, so only check that no codec is far slower than the stdlib codec.
+        """
+        payload = {
+            "items": [
+                {"id": i, "name": f"item {i}", "tags": list(range(10)), "meta": {"score": i / 3, "active": i % 2 == 0}}
+                for i in range(20000)
+            ]
+        }
+        data = json.dumps(payload).encode()
+        margin = 2
+
+        def measure(func: Callable[[], object], repeat: int = 5) -> float:
+            return min(timeit.repeat(func, number=1, repeat=repeat))
+
+        stdlib = StdlibJSONCodec()
+        expected = {
+            "loads": measure(lambda: stdlib.loads(data)),
+            "dumps": measure(lambda: stdlib.dumps(payload)),
+            "validate": measure(lambda: json.loads(json.dumps(payload))),  # round trip check of a Python object walk
+        }
+
+        for codec_class in (OrjsonJSONCodec, MsgspecJSONCodec):
+            try:
+                codec = codec_class()
+            except AIORequestfulImportError:
+                continue
+
+            assert codec.loads(data) == payload
+            results = {
+                "loads": measure(lambda: codec.loads(data)),
+                "dumps": measure(lambda: codec.dumps(payload)),
+                "validate": measure(lambda: codec.validate(payload)),
+            }
+            for name, result in results.items():
+                print(f"{codec_class.__name__}.{name}: {expected[name] / result:.1f}x the speed of the stdlib codec")
+                assert result < expected[name] * margin
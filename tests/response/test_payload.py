@@ -1,14 +1,44 @@
+import hashlib
 import json
+import pickle
+import tracemalloc
 from abc import ABC, abstractmethod
 from asyncio import StreamReader
-from typing import Any
+from dataclasses import dataclass, field
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, TypedDict
+
+import aiosqlite
 
 import pytest
 from aiohttp import ClientResponse
+from multidict import CIMultiDict, CIMultiDictProxy
 
+from aiorequestful.exception import AIORequestfulImportError
+from aiorequestful.response.codec import JSONCodec, StdlibJSONCodec, OrjsonJSONCodec, MsgspecJSONCodec
 from aiorequestful.response.exception import PayloadHandlerError
-from aiorequestful.response.payload import PayloadHandler, JSONPayloadHandler, StringPayloadHandler, BytesPayloadHandler
+from aiorequestful.cache.backend.sqlite import SQLiteTable
+from aiorequestful.response.payload import PayloadHandler, JSONPayloadHandler, StringPayloadHandler, \
+    BytesPayloadHandler, StreamingJSONPayloadHandler, SchemaPayloadHandler, FilePayloadHandler
+# noinspection PyProtectedMember
+from aiorequestful.response.payload import _JSONStreamParser
 from aiorequestful.types import JSON
+from tests.cache.backend.utils import MockResponseRepositorySettings
+
+
+@dataclass(slots=True)
+class Record:
+    """A simple schema for records returned in a payload"""
+    id: int
+    name: str
+    tags: list[str] = field(default_factory=list)
+
+
+class RecordDict(TypedDict):
+    """A simple schema for records returned in a payload"""
+    id: int
+    name: str
 
 
 class PayloadHandlerTester(ABC):
@@ -108,18 +138,320 @@ class TestBytesPayloadHandler(PayloadHandlerTester):
 
 class TestJSONPayloadHandler(PayloadHandlerTester):
 
-    @pytest.fixture
-    def handler(self) -> JSONPayloadHandler:
-        return JSONPayloadHandler()
+    @pytest.fixture(params=[StdlibJSONCodec, OrjsonJSONCodec, MsgspecJSONCodec])
+    def handler(self, request: pytest.FixtureRequest) -> JSONPayloadHandler:
+        try:
+            return JSONPayloadHandler(codec=request.param())
+        except AIORequestfulImportError:
+            pytest.skip(f"{request.param.__name__} is not installed")
 
     @pytest.fixture
     def payload(self) -> JSON:
         return {"key": "value"}
 
     @pytest.fixture
-    def payload_serialized(self, payload: Any) -> str:
-        return json.dumps(payload)
+    def payload_serialized(self, handler: JSONPayloadHandler, payload: Any) -> str:
+        return handler.codec.dumps(payload)
 
     @pytest.fixture
     def payload_encoded(self, payload: Any) -> bytes:
         return json.dumps(payload).encode()
+
+    async def test_deserialize_invalid(self, handler: JSONPayloadHandler, dummy_response: ClientResponse):
+        with pytest.raises(PayloadHandlerError):
+            await handler.deserialize('{"key": ')
+        with pytest.raises(PayloadHandlerError):
+            await handler.deserialize({"key": object()})
+
+        # empty responses have no payload
+        # noinspection PyProtectedMember
+        dummy_response.content = StreamReader(loop=dummy_response._loop)
+        dummy_response.content.feed_eof()
+        assert await handler.deserialize(dummy_response) is None
+
+    async def test_deserialize_returns_given_payload(self, handler: JSONPayloadHandler):
+        payload = {"key": ["value", 1, 2.5, None, True]}
+        assert await handler.deserialize(payload) is payload
+
+
+class TestSchemaPayloadHandler(PayloadHandlerTester):
+
+    @pytest.fixture
+    def handler(self) -> SchemaPayloadHandler[list[Record]]:
+        try:
+            return SchemaPayloadHandler(list[Record])
+        except AIORequestfulImportError:
+            pytest.skip("msgspec is not installed")
+
+    @pytest.fixture
+    def payload(self) -> list[Record]:
+        return [Record(id=1, name="first", tags=["tag"]), Record(id=2, name="second")]
+
+    @pytest.fixture
+    def payload_serialized(self, payload: list[Record]) -> str:
+        records = [{"id": record.id, "name": record.name, "tags": record.tags} for record in payload]
+        return json.dumps(records, separators=(",", ":"))
+
+    @pytest.fixture
+    def payload_encoded(self, payload_serialized: str) -> bytes:
+        return payload_serialized.encode()
+
+    async def test_deserialize_validates(self, handler: SchemaPayloadHandler[list[Record]]):
+        # unknown fields are skipped
+        payload = [{"id": 1, "name": "first", "unknown": {"key": "value"}}]
+        assert await handler.deserialize(json.dumps(payload)) == [Record(id=1, name="first")]
+        assert await handler.deserialize(payload) == [Record(id=1, name="first")]
+
+        with pytest.raises(PayloadHandlerError):
+            await handler.deserialize('[{"id": "not an int", "name": "first"}]')
+        with pytest.raises(PayloadHandlerError):
+            await handler.deserialize('[{"id": 1}]')
+        with pytest.raises(PayloadHandlerError):
+            await handler.deserialize([{"id": 1}])
+        with pytest.raises(PayloadHandlerError):
+            await handler.deserialize('[{"id": 1, ')
+
+    async def test_typed_dict_schema(self, handler: SchemaPayloadHandler):
+        handler = SchemaPayloadHandler(RecordDict, indent=2)
+        payload = await handler.deserialize(b'{"id": 1, "name": "first", "unknown": true}')
+        assert payload == {"id": 1, "name": "first"}
+        assert await handler.serialize(payload) == json.dumps(payload, indent=2)
+
+    async def test_pickle(self, handler: SchemaPayloadHandler[list[Record]], payload_serialized: str):
+        handler = pickle.loads(pickle.dumps(handler))
+        assert handler.schema == list[Record]
+        assert await handler.deserialize(payload_serialized)
+
+    async def test_cache_round_trip(self, handler: SchemaPayloadHandler[list[Record]], payload: list[Record]):
+        class RecordRepositorySettings(MockResponseRepositorySettings):
+            @staticmethod
+            def get_name(payload: list[Record]) -> str | None:
+                return payload[0].name
+
+        settings = RecordRepositorySettings(name="records", payload_handler=handler)
+
+        async with aiosqlite.connect(":memory:") as connection:
+            repository = await SQLiteTable(connection, settings=settings, expire=timedelta(days=1))
+            key = ("GET", "records")
+            await repository.save_response((key, payload))
+
+            assert await repository.get_response(key) == payload
+
+    async def test_memory_usage(self, handler: SchemaPayloadHandler[list[Record]]):
+        records = [{"id": i, "name": f"record {i}", "tags": [], "unknown": None} for i in range(10000)]
+        data = json.dumps(records).encode()
+
+        def measure(deserialize) -> int:
+            tracemalloc.start()
+            try:
+                payload = deserialize(data)
+                size, _ = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            assert len(payload) == len(records)
+            return size
+
+        # noinspection PyProtectedMember
+        size_schema = measure(handler._decode)
+        size_json = measure(json.loads)
+        assert size_schema * 1.5 < size_json
+
+
+class TestStreamingJSONPayloadHandler:
+
+    @pytest.fixture
+    def payload(self) -> JSON:
+        return {
+            "meta": {"skipped": [1, {"key": "}]\\\"["}], "escaped": "\\\"value\\\""},
+            "items": [{"id": i, "values": [i, "é", None, True, 1.5e3]} for i in range(20)] + [12345, "string", [], {}],
+            "total": -0.5,
+        }
+
+    @staticmethod
+    def get_response(response: ClientResponse, payload: bytes) -> ClientResponse:
+        # noinspection PyProtectedMember
+        response.content = StreamReader(loop=response._loop)
+        response.content.feed_data(payload)
+        response.content.feed_eof()
+        return response
+
+    @pytest.mark.parametrize("path,expected", [
+        ("items.*", lambda payload: payload["items"]),
+        ("*", lambda payload: list(payload.values())),
+        ("", lambda payload: [payload]),
+        ("items.3.id", lambda _: [3]),
+        ("meta.skipped.*", lambda payload: payload["meta"]["skipped"]),
+        ("*.*", lambda payload: [*payload["meta"].values(), *payload["items"]]),
+        ("missing.*", lambda _: []),
+    ])
+    async def test_deserialize(self, payload: JSON, path: str, expected, dummy_response: ClientResponse):
+        handler = StreamingJSONPayloadHandler(path)
+        expected = expected(payload)
+        payload_encoded = json.dumps(payload).encode()
+
+        assert await handler.deserialize(payload) == expected
+        assert await handler.deserialize(payload_encoded.decode()) == expected
+        assert await handler.deserialize(payload_encoded) == expected
+        assert await handler.deserialize(bytearray(payload_encoded)) == expected
+
+        for chunk_size in (1, 3, 7, 64):
+            handler.chunk_size = chunk_size
+            response = self.get_response(dummy_response, payload_encoded)
+            assert await handler.deserialize(response) == expected
+
+        with pytest.raises(PayloadHandlerError):
+            await handler.deserialize(None)
+
+    @pytest.mark.parametrize("codec", [StdlibJSONCodec, OrjsonJSONCodec, MsgspecJSONCodec])
+    async def test_serialize(self, payload: JSON, codec: type[JSONCodec]):
+        try:
+            handler = StreamingJSONPayloadHandler("items.*", codec=codec())
+        except AIORequestfulImportError:
+            pytest.skip(f"{codec.__name__} is not installed")
+
+        expected = handler.codec.dumps(payload["items"])
+        assert await handler.serialize(payload["items"]) == expected
+        assert await handler.serialize(json.dumps(payload)) == expected
+
+        with pytest.raises(PayloadHandlerError):
+            await handler.serialize([object()])
+
+    async def test_iterate(self, dummy_response: ClientResponse):
+        handler = StreamingJSONPayloadHandler("*.id", chunk_size=4)
+        response = self.get_response(dummy_response, json.dumps([{"id": i} for i in range(5)]).encode())
+
+        values = handler.iterate(response)
+        assert await anext(values) == 0
+        assert not response.content.at_eof()  # values are returned before the payload is read in full
+        assert [value async for value in values] == [1, 2, 3, 4]
+
+    @pytest.mark.parametrize("payload", [
+        b'{"items": [1, 2', b'{"items" 1}', b'[1, 2]x', b'{"items": [1, 2]', b'{"items": [1.]}', b'{"other": tru}',
+        b'{"items": [1,]}', b'{"items": [1,,2]}', b'{"items": [,1]}', b'{"items": [1], }', b'{,"items": [1]}',
+        b'{"other": [1,], "items": []}', b'{"other": {"a": 1,}, "items": []}', b'{"other": {"a": [1,,2]}}',
+    ])
+    async def test_invalid_payload(self, payload: bytes):
+        with pytest.raises(PayloadHandlerError):
+            await StreamingJSONPayloadHandler("items.*").deserialize(payload)
+
+    def test_skip_large_string(self):
+        parser = _JSONStreamParser(["items", "*"])
+        chunk_size = 2 ** 10
+        data = json.dumps({"other": "a\"b" * 2 ** 16, "items": [1, "value"]}).encode()
+
+        values = []
+        for start in range(0, len(data), chunk_size):
+            values.extend(parser.feed(data[start:start + chunk_size]))
+            assert len(parser._buffer) <= chunk_size  # the skipped string is never buffered
+        assert values + parser.close() == [1, "value"]
+
+    @pytest.mark.parametrize("document,path", [
+        *((document, path) for path in ("", "*", "missing") for document in [
+            '{"items": [1.5e3, 2], "total": -0.25E-2}',
+            '[true, false, null, 10, -1, 0.5, 3e+2, "a\\"b", "é€😀", {"key": [1e1]}]',
+            '{"a": {"b": [12345678901234567890, -0, "c"]}, "c": 1.0, "d": {}, "e": [[], {"f": [true]}]}',
+            '{"a": ["[,", "{ ,", "x, ]", ",,", "\\",]"], "b": [{}, [ ]]}',
+            '[1.]', '[1e]', '[-]', '[01]', '[tru]', '{"key": 1.5e}', '[1, 2', '1 2',
+            '[1,]', '{"a": 1,}', '{"a": [1,,2]}', '[,1]', '{,}', '{"a": [[1],]}', '{"a": [{"b": 1, }]}', '[[,]]',
+        ]),
+        # a scalar document has no values at any path
+        *((document, path) for path in ("", "missing") for document in ['  -12.75e-1  ', '"\\u00e9 string"']),
+    ])
+    def test_parse_split_at_every_offset(self, document: str, path: str):
+        data = document.encode()
+        try:
+            expected = json.loads(document)
+            if path == "*":
+                expected = list(expected.values()) if isinstance(expected, dict) else expected
+            elif path:
+                expected = []
+            else:
+                expected = [expected]
+        except json.JSONDecodeError:
+            expected = PayloadHandlerError
+
+        for offset in range(len(data) + 1):
+            parser = _JSONStreamParser(path.split(".") if path else [])
+            try:
+                values = parser.feed(data[:offset]) + parser.feed(data[offset:]) + parser.close()
+            except PayloadHandlerError:
+                assert expected is PayloadHandlerError, offset
+            else:
+                assert values == expected, offset
+
+
+class TestFilePayloadHandler:
+
+    @pytest.fixture
+    def handler(self, tmp_path: Path) -> FilePayloadHandler:
+        return FilePayloadHandler(tmp_path.joinpath("payload.bin"), chunk_size=3, digest="sha256")
+
+    @staticmethod
+    def get_response(
+            response: ClientResponse, payload: bytes, status: int = 200, headers: dict[str, str] | None = None
+    ) -> ClientResponse:
+        # noinspection PyProtectedMember
+        response.content = StreamReader(loop=response._loop)
+        response.content.feed_data(payload)
+        response.content.feed_eof()
+        response.status = status
+        response._headers = CIMultiDictProxy(CIMultiDict(headers or {}))
+        response._cache.pop("headers", None)  # clear the headers cached from any previous response
+        return response
+
+    async def test_serialize(self, handler: FilePayloadHandler):
+        assert await handler.serialize("payload") == "payload"
+        assert await handler.serialize(b"payload") == "payload"
+        with pytest.raises(PayloadHandlerError):
+            await handler.serialize(handler.path)
+
+    async def test_deserialize(self, handler: FilePayloadHandler, dummy_response: ClientResponse):
+        assert await handler.deserialize("payload") == handler.path
+        assert handler.path.read_bytes() == b"payload"
+        assert await handler.deserialize(bytearray(b"other")) == handler.path
+        assert handler.path.read_bytes() == b"other"
+        assert handler.offset == 5
+        assert handler.hexdigest == hashlib.sha256(b"other").hexdigest()
+        assert await handler.deserialize(handler.path) == handler.path
+
+        response = self.get_response(dummy_response, b"response payload", headers={"ETag": '"version"'})
+        assert await handler.deserialize(response) == handler.path
+        assert handler.path.read_bytes() == b"response payload"
+        assert handler.hexdigest == hashlib.sha256(b"response payload").hexdigest()
+
+        with pytest.raises(PayloadHandlerError):
+            await handler.deserialize(None)
+
+    async def test_resume(self, handler: FilePayloadHandler, dummy_response: ClientResponse):
+        assert handler.get_headers({"key": "value"}) == {"key": "value"}
+
+        payload = b"0123456789"
+        response = self.get_response(dummy_response, payload[:4], headers={"ETag": 'W/"weak"', "Last-Modified": "date"})
+        await handler.deserialize(response)
+        assert handler.get_headers() == {"Range": "bytes=4-", "If-Range": "date"}
+
+        # continues from the last byte written
+        headers = {"Content-Range": "bytes 4-9/10"}
+        await handler.deserialize(self.get_response(dummy_response, payload[4:], status=206, headers=headers))
+        assert handler.path.read_bytes() == payload
+        assert handler.hexdigest == hashlib.sha256(payload).hexdigest()
+
+        # starts again when the whole payload is returned
+        await handler.deserialize(self.get_response(dummy_response, payload[::-1], headers={"ETag": '"version"'}))
+        assert handler.path.read_bytes() == payload[::-1]
+        assert handler.hexdigest == hashlib.sha256(payload[::-1]).hexdigest()
+
+        # fails without writing when a partial response does not continue from the last byte written
+        for content_range in ("bytes 2-9/10", "bytes 0-9/10", None):
+            await handler.deserialize(self.get_response(dummy_response, payload[:4], headers={"ETag": '"version"'}))
+
+            headers = {"Content-Range": content_range} if content_range else {}
+            response = self.get_response(dummy_response, payload[2:], status=206, headers=headers)
+            with pytest.raises(PayloadHandlerError):
+                await handler.deserialize(response)
+            assert handler.path.read_bytes() == payload[:4]
+            assert handler.get_headers() == {}  # the whole payload is requested next
+
+        handler.reset()
+        assert handler.offset == 0
+        assert handler.get_headers() == {}
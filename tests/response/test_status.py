@@ -9,6 +9,8 @@ from aiohttp import ClientResponse, ClientSession, ClientRequest
 from aiohttp.helpers import TimerNoop
 from multidict import CIMultiDictProxy, CIMultiDict
 
+from aiorequestful.exception import DeadlineExceededError
+from aiorequestful.limiter import GCRARateLimiter
 from aiorequestful.response.exception import ResponseError, StatusHandlerError
 from aiorequestful.response.status import StatusHandler, ClientErrorStatusHandler, UnauthorisedStatusHandler, \
     RateLimitStatusHandler
@@ -113,6 +115,15 @@ class TestRateLimitStatusHandler(StatusHandlerTester):
         with pytest.raises(ResponseError):  # retry after time > total retry timer
             await handler(response, retry_timer=retry_timer)
 
+        with pytest.raises(DeadlineExceededError):  # retry after time > time remaining until deadline
+            await handler(response, time_remaining=0.5)
+
+        # rate limiter is paused even when the request gives up
+        rate_limiter = GCRARateLimiter(rate=100)
+        with pytest.raises(DeadlineExceededError):
+            await handler(response, time_remaining=0.5, rate_limiter=rate_limiter)
+        assert rate_limiter._reserve(key=rate_limiter.get_key(response.method, response.url), cost=1) > 0.9
+
     async def test_handle_timers(self, handler: RateLimitStatusHandler, response_valid: ClientResponse):
         wait_timer = StepCountTimer(initial=0.1, count=2, step=0.1)
         retry_timer = StepCountTimer(initial=0.1, count=3, step=0.1)
@@ -0,0 +1,140 @@
+import asyncio
+import re
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+import pytest
+from aioresponses import aioresponses, CallbackResult
+from pytest_mock import MockerFixture
+from yarl import URL
+
+from aiorequestful.batch import BatchLoader
+from aiorequestful.cache.backend.sqlite import SQLiteCache
+from aiorequestful.exception import InputError
+from aiorequestful.request import RequestHandler
+from aiorequestful.response.exception import ResponseError
+from aiorequestful.response.payload import JSONPayloadHandler
+from aiorequestful.response.status import ClientErrorStatusHandler
+from aiorequestful.types import RequestKwargs
+from tests.cache.backend.utils import MockResponseRepositorySettings
+
+
+class TestBatchLoader:
+
+    @pytest.fixture
+    def url(self) -> URL:
+        return URL("http://test.com/items")
+
+    @pytest.fixture
+    def request_handler(self) -> RequestHandler:
+        return RequestHandler.create(
+            cache=SQLiteCache.connect_with_in_memory_db(),
+            response_handlers=[ClientErrorStatusHandler()],
+            payload_handler=JSONPayloadHandler(),
+        )
+
+    @pytest.fixture
+    def batches(self, url: URL, requests_mock: aioresponses) -> list[list[str]]:
+        """Mock the batch endpoint, returning a list which records the keys of each batched request sent"""
+        batches = []
+
+        def _response(request_url: URL, **__) -> CallbackResult:
+            ids = request_url.query["ids"].split(",")
+            batches.append(ids)
+            return CallbackResult(payload={"items": [{"id": key, "name": f"item {key}"} for key in ids if key != "0"]})
+
+        requests_mock.get(re.compile(rf"^{re.escape(str(url))}\?ids=.*"), callback=_response, repeat=True)
+        return batches
+
+    @pytest.fixture
+    def loader(self, request_handler: RequestHandler, url: URL) -> BatchLoader[str, dict[str, Any]]:
+        def batch_request(keys: Sequence[str]) -> RequestKwargs:
+            return {"url": url, "params": {"ids": ",".join(keys)}}
+
+        def split(_: Sequence[str], payload: dict[str, Any]) -> Mapping[str, dict[str, Any]]:
+            return {item["id"]: item for item in payload["items"]}
+
+        def item_request(key: str) -> RequestKwargs:
+            return {"url": url.joinpath(key)}
+
+        return BatchLoader(
+            request_handler, batch_request=batch_request, split=split, item_request=item_request, max_batch_size=10
+        )
+
+    def test_init_fails(self, request_handler: RequestHandler):
+        with pytest.raises(InputError):
+            BatchLoader(request_handler, batch_request=lambda _: {}, split=lambda _, __: {}, max_batch_size=0)
+
+    async def test_load_batches(self, loader: BatchLoader, batches: list[list[str]]):
+        keys = [str(i) for i in range(1, 26)]
+
+        async with loader.handler:
+            results = await loader.load_many(keys)
+
+        assert results == [{"id": key, "name": f"item {key}"} for key in keys]
+        assert sorted(map(len, batches)) == [5, 10, 10]
+        assert sorted(key for batch in batches for key in batch) == sorted(keys)
+
+    async def test_load_same_key(self, loader: BatchLoader, batches: list[list[str]]):
+        async with loader.handler:
+            results = await loader.load_many(["1", "2", "1", "1"])
+
+        assert results[0] == results[2] == results[3]
+        assert batches == [["1", "2"]]
+
+    async def test_load_separate_windows(self, loader: BatchLoader, batches: list[list[str]]):
+        async with loader.handler:
+            assert (await loader.load("1"))["id"] == "1"
+            assert await loader.load_many(["2", "3"])
+
+        assert batches == [["1"], ["2", "3"]]
+
+    async def test_load_missing_key(self, loader: BatchLoader, batches: list[list[str]]):
+        async with loader.handler:
+            assert await loader.load_many(["0", "1"]) == [None, {"id": "1", "name": "item 1"}]
+
+    async def test_load_fails(self, loader: BatchLoader, url: URL, requests_mock: aioresponses):
+        requests_mock.get(re.compile(rf"^{re.escape(str(url))}\?ids=.*"), status=400, repeat=True)
+
+        async with loader.handler:
+            results = await asyncio.gather(*map(loader.load, ["1", "2", "3"]), return_exceptions=True)
+
+        assert all(isinstance(result, ResponseError) for result in results)
+        assert sum(map(len, requests_mock.requests.values())) == 1
+
+    async def test_load_cancelled(self, loader: BatchLoader, mocker: MockerFixture):
+        event = asyncio.Event()
+
+        async def request(**__) -> None:
+            await event.wait()
+
+        mock_request = mocker.patch.object(RequestHandler, "request", side_effect=request)
+
+        async with loader.handler:
+            loads = [asyncio.create_task(loader.load(key)) for key in ["1", "2", "3"]]
+            while not mock_request.await_count:  # wait until the batched request is in flight
+                await asyncio.sleep(0.001)
+            for task in loader._tasks:
+                task.cancel()
+
+            results = await asyncio.wait_for(asyncio.gather(*loads, return_exceptions=True), timeout=1)
+
+        # callers waiting on a cancelled batch are cancelled too instead of waiting forever
+        assert all(isinstance(result, asyncio.CancelledError) for result in results)
+
+    async def test_load_from_cache(self, loader: BatchLoader, batches: list[list[str]]):
+        async with loader.handler as handler:
+            settings = MockResponseRepositorySettings(name="test", payload_handler=handler.payload_handler)
+            repository = await handler.session.cache.create_repository(settings)
+            handler.session.cache.repository_getter = lambda _, url: repository if URL(url).name.isdigit() else None
+
+            await repository.save_response((("GET", "2"), {"id": "2", "name": "cached item 2"}))
+
+            results = await loader.load_many(["1", "2", "3"])
+            assert results[1] == {"id": "2", "name": "cached item 2"}
+            assert batches == [["1", "3"]]
+
+            # values from batched request are saved as responses for each single item
+            assert await repository.get_response(("GET", "1")) == {"id": "1", "name": "item 1"}
+            assert await loader.load_many(["1", "3"]) == [results[0], results[2]]
+            assert len(batches) == 1
@@ -0,0 +1,158 @@
+import io
+import tracemalloc
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import pytest
+from aiohttp import web, test_utils
+
+from aiorequestful.body import RequestBody, FileBody, StreamBody, FactoryBody
+from aiorequestful.exception import InputError
+from aiorequestful.request import RequestHandler
+from aiorequestful.timer import StepCountTimer
+
+
+class RequestBodyTester:
+
+    @pytest.fixture
+    def data(self) -> bytes:
+        return bytes(range(256)) * 40
+
+    async def test_iterate(self, body: RequestBody, data: bytes):
+        chunks = [chunk async for chunk in body.iterate()]
+        assert all(len(chunk) <= body.chunk_size for chunk in chunks)
+        assert b"".join(chunks) == data
+
+        # every iteration reads the body from its start
+        assert await body.read() == data
+        assert await body.read() == data
+
+    async def test_open(self, body: RequestBody, data: bytes):
+        payload = body.open()
+        assert payload.size == len(data)
+        assert payload.content_type == body.content_type
+
+        assert b"".join([bytes(chunk) async for chunk in payload._value]) == data
+        await payload.close()
+
+        payload = body.open()
+        assert bytes(await anext(payload._value)) == data[:body.chunk_size]
+        await payload.close()
+        assert b"".join([bytes(chunk) async for chunk in body.open()._value]) == data
+
+
+class TestFileBody(RequestBodyTester):
+
+    @pytest.fixture
+    def body(self, data: bytes, tmp_path: Path) -> RequestBody:
+        path = tmp_path.joinpath("upload.bin")
+        path.write_bytes(data)
+        return FileBody(path, chunk_size=1000)
+
+    def test_init_fails(self, tmp_path: Path):
+        with pytest.raises(InputError):
+            FileBody(tmp_path)
+        with pytest.raises(InputError):
+            FileBody(tmp_path.joinpath("missing.bin"))
+
+        path = tmp_path.joinpath("upload.bin")
+        path.touch()
+        with pytest.raises(InputError):
+            FileBody(path, chunk_size=0)
+
+    async def test_closes_file(self, body: FileBody):
+        payload = body.open()
+        await anext(payload._value)
+        await payload.close()
+
+        # the file is no longer in use by the body
+        body.path.unlink()
+        assert not body.path.exists()
+
+
+class TestStreamBody(RequestBodyTester):
+
+    @pytest.fixture
+    def body(self, data: bytes) -> RequestBody:
+        stream = io.BytesIO(b"skip" + data)
+        stream.seek(4)
+        return StreamBody(stream, chunk_size=1000)
+
+    def test_init_fails(self, tmp_path: Path):
+        path = tmp_path.joinpath("upload.txt")
+        path.write_text("data")
+
+        with path.open("r") as file, pytest.raises(InputError):
+            StreamBody(file)
+
+        class UnseekableStream(io.BytesIO):
+            def seekable(self) -> bool:
+                return False
+
+        with pytest.raises(InputError):
+            StreamBody(UnseekableStream(b"data"))
+
+    def test_size_keeps_position(self, body: StreamBody, data: bytes):
+        body.stream.seek(10)
+        assert body.size == len(data)
+        assert body.stream.tell() == 10
+
+
+class TestFactoryBody(RequestBodyTester):
+
+    @pytest.fixture(params=["bytes", "iterable", "async"])
+    def body(self, data: bytes, request: pytest.FixtureRequest) -> RequestBody:
+        chunks = [data[i:i + 1000] for i in range(0, len(data), 1000)]
+
+        async def generate() -> AsyncIterator[bytes]:
+            for chunk in chunks:
+                yield chunk
+
+        match request.param:
+            case "bytes":
+                return FactoryBody(lambda: data, chunk_size=1000)
+            case "iterable":
+                return FactoryBody(lambda: iter(chunks), size=len(data), chunk_size=1000)
+            case _:
+                return FactoryBody(generate, size=len(data), chunk_size=1000)
+
+    def test_init_fails(self):
+        with pytest.raises(InputError):
+            FactoryBody(lambda: b"", size=-1)
+
+    def test_unknown_size(self):
+        body = FactoryBody(lambda: iter([b"data"]))
+        assert body.size is None
+        assert body.open().size is None
+
+        # the size of bytes is always known
+        assert FactoryBody(lambda: b"data").open().size == 4
+
+    @pytest.mark.parametrize("size", [None, 2 ** 24])
+    async def test_upload_in_constant_memory(self, size: int | None):
+        chunk = b"0" * 2 ** 16
+        received: list[int] = []
+
+        async def handle(request: web.Request) -> web.Response:
+            total = 0
+            while data := await request.content.read(2 ** 16):
+                total += len(data)
+            received.append(total)
+            return web.json_response({"received": total})
+
+        app = web.Application(client_max_size=2 ** 30)
+        app.router.add_post("/", handle)
+
+        body = FactoryBody(lambda: (chunk for _ in range(2 ** 24 // len(chunk))), size=size)
+        handler = RequestHandler.create(retry_timer=StepCountTimer(initial=0, count=1))
+
+        async with test_utils.TestServer(app) as server, handler:
+            tracemalloc.start()
+            try:
+                await handler.post(server.make_url("/"), data=body)
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+
+        assert received == [2 ** 24]
+        assert peak < 2 ** 24 // 4
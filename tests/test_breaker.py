@@ -0,0 +1,131 @@
+import time
+
+import aiohttp
+import pytest
+from aiohttp import ClientResponse
+from pytest_mock import MockerFixture
+from yarl import URL
+
+from aiorequestful.breaker import CircuitBreaker, CircuitState
+from aiorequestful.exception import CircuitOpenError, InputError
+
+
+class TestCircuitBreaker:
+
+    @pytest.fixture
+    def now(self, mocker: MockerFixture) -> list[float]:
+        """Patch the monotonic clock to a fixed, manually controlled value"""
+        now = [100.0]
+        mocker.patch.object(time, "monotonic", side_effect=lambda: now[0])
+        return now
+
+    @pytest.fixture
+    def url(self) -> URL:
+        return URL("http://test.com/path")
+
+    def test_init_fails(self):
+        with pytest.raises(InputError):
+            CircuitBreaker(failure_threshold=0)
+        with pytest.raises(InputError):
+            CircuitBreaker(half_open_requests=0)
+
+    def test_is_failure(self, dummy_response: ClientResponse):
+        assert CircuitBreaker.is_failure(aiohttp.ClientConnectionError())
+        assert CircuitBreaker.is_failure(TimeoutError())
+        assert not CircuitBreaker.is_failure(ValueError())
+
+        assert not CircuitBreaker.is_failure(dummy_response)
+        dummy_response.status = 429
+        assert not CircuitBreaker.is_failure(dummy_response)
+        dummy_response.status = 503
+        assert CircuitBreaker.is_failure(dummy_response)
+
+    def test_get_key(self, url: URL):
+        assert CircuitBreaker().get_key(url) == CircuitBreaker().get_key(url.with_path("other"))
+        breaker = CircuitBreaker(per_route=True)
+        assert breaker.get_key(url) != breaker.get_key(url.with_path("other"))
+
+    # noinspection PyUnusedLocal
+    def test_opens_on_consecutive_failures(self, url: URL, now: list[float]):
+        breaker = CircuitBreaker(failure_threshold=3)
+
+        for _ in range(2):
+            breaker.release(breaker.acquire(url), failed=True)
+        breaker.release(breaker.acquire(url), failed=False)  # success resets failures
+        assert breaker.get_state(url) == CircuitState.CLOSED
+
+        for _ in range(3):
+            breaker.release(breaker.acquire(url), failed=True)
+        assert breaker.get_state(url) == CircuitState.OPEN
+
+        with pytest.raises(CircuitOpenError):
+            breaker.acquire(url)
+        with pytest.raises(CircuitOpenError):
+            breaker.acquire(url.with_path("other"))
+        breaker.acquire(URL("http://other.com"))  # other hosts are unaffected
+
+    def test_half_open_probes(self, url: URL, now: list[float]):
+        breaker = CircuitBreaker(failure_threshold=1, recovery_time=10, half_open_requests=2)
+        breaker.release(breaker.acquire(url), failed=True)
+        assert breaker.get_state(url) == CircuitState.OPEN
+
+        now[0] += 10
+        assert breaker.get_state(url) == CircuitState.HALF_OPEN
+        probe = breaker.acquire(url)
+        straggler = breaker.acquire(url)
+        assert probe.probe and straggler.probe
+        with pytest.raises(CircuitOpenError):  # probe limit reached
+            breaker.acquire(url)
+
+        breaker.release(probe, failed=None)  # cancelled probe frees a slot without affecting the state
+        assert breaker.get_state(url) == CircuitState.HALF_OPEN
+        probe = breaker.acquire(url)
+
+        # failed probe re-opens the circuit
+        breaker.release(probe, failed=True)
+        assert breaker.get_state(url) == CircuitState.OPEN
+        breaker.release(straggler, failed=True)  # straggling probe does not extend the recovery time
+        now[0] += 10
+        assert breaker.get_state(url) == CircuitState.HALF_OPEN
+
+        # successful probe closes the circuit
+        breaker.release(breaker.acquire(url), failed=False)
+        assert breaker.get_state(url) == CircuitState.CLOSED
+        assert not breaker.acquire(url).probe
+
+    def test_ignores_requests_allowed_before_state_change(self, url: URL, now: list[float]):
+        breaker = CircuitBreaker(failure_threshold=1, recovery_time=10, half_open_requests=1)
+        before_open = [breaker.acquire(url) for _ in range(3)]
+        breaker.release(before_open.pop(), failed=True)
+        assert breaker.get_state(url) == CircuitState.OPEN
+
+        # a late success from before the circuit opened does not close the circuit
+        breaker.release(before_open.pop(), failed=False)
+        assert breaker.get_state(url) == CircuitState.OPEN
+
+        now[0] += 10
+        probe = breaker.acquire(url)
+
+        # a late result from before the circuit opened does not free the probe
+        breaker.release(before_open.pop(), failed=None)
+        with pytest.raises(CircuitOpenError):
+            breaker.acquire(url)
+
+        breaker.release(probe, failed=False)
+        assert breaker.get_state(url) == CircuitState.CLOSED
+        before_close = breaker.acquire(url)
+
+        # failures from before the circuit closed do not count towards opening it again
+        breaker.release(probe, failed=True)
+        assert breaker.get_state(url) == CircuitState.CLOSED
+        breaker.release(before_close, failed=True)
+        assert breaker.get_state(url) == CircuitState.OPEN
+
+    # noinspection PyUnusedLocal
+    def test_reset(self, url: URL, now: list[float]):
+        breaker = CircuitBreaker(failure_threshold=1)
+        breaker.release(breaker.acquire(url), failed=True)
+        assert breaker.get_state(url) == CircuitState.OPEN
+
+        breaker.reset()
+        assert breaker.get_state(url) == CircuitState.CLOSED
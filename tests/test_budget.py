@@ -0,0 +1,68 @@
+import time
+
+import pytest
+from pytest_mock import MockerFixture
+
+from aiorequestful.budget import RequestBudget
+from aiorequestful.exception import InputError
+
+
+class TestRequestBudget:
+
+    @pytest.fixture
+    def now(self, mocker: MockerFixture) -> list[float]:
+        """Patch the monotonic clock to a fixed, manually controlled value"""
+        now = [100.0]
+        mocker.patch.object(time, "monotonic", side_effect=lambda: now[0])
+        return now
+
+    def test_init_fails(self):
+        with pytest.raises(InputError):
+            RequestBudget(ratio=-1)
+        with pytest.raises(InputError):
+            RequestBudget(minimum=-1)
+        with pytest.raises(InputError):
+            RequestBudget(window=0)
+
+    # noinspection PyUnusedLocal
+    def test_minimum(self, now: list[float]):
+        budget = RequestBudget(ratio=0.5, minimum=2)
+        assert budget.remaining == 2
+
+        assert budget.withdraw()
+        assert budget.withdraw()
+        assert not budget.withdraw()
+        assert budget.withdrawals == 2
+
+    # noinspection PyUnusedLocal
+    def test_ratio(self, now: list[float]):
+        budget = RequestBudget(ratio=0.2, minimum=0)
+        assert not budget.withdraw()
+
+        for _ in range(10):
+            budget.record()
+        assert budget.requests == 10
+        assert budget.remaining == 2
+
+        assert budget.withdraw()
+        assert budget.withdraw()
+        assert not budget.withdraw()
+
+    def test_window(self, now: list[float]):
+        budget = RequestBudget(ratio=1, minimum=0, window=10)
+        for _ in range(5):
+            budget.record()
+        assert budget.withdraw()
+        assert budget.remaining == 4
+
+        now[0] += 5
+        budget.record()
+        assert budget.remaining == 5
+
+        now[0] += 5  # initial requests and withdrawal expire
+        assert budget.requests == 1
+        assert budget.withdrawals == 0
+        assert budget.remaining == 1
+
+        budget.reset()
+        assert budget.requests == budget.withdrawals == budget.remaining == 0
@@ -0,0 +1,135 @@
+import asyncio
+import multiprocessing
+import os
+import time
+from functools import partial
+
+import pytest
+from aiohttp import web, test_utils
+
+from aiorequestful.exception import InputError, RequestError
+from aiorequestful.executor import ProcessRequestExecutor
+from aiorequestful.limiter import SharedGCRARateLimiter
+from aiorequestful.request import RequestHandler
+from aiorequestful.response.exception import ResponseError
+from aiorequestful.response.payload import JSONPayloadHandler
+from aiorequestful.response.status import ClientErrorStatusHandler
+
+
+def create_handler() -> RequestHandler:
+    """Create a handler in each worker process"""
+    return RequestHandler.create(payload_handler=JSONPayloadHandler(), response_handlers=[ClientErrorStatusHandler()])
+
+
+def create_failing_handler() -> RequestHandler:
+    """Exit the worker process immediately"""
+    os._exit(3)
+
+
+class TestProcessRequestExecutor:
+
+    @pytest.fixture
+    def app(self) -> web.Application:
+        async def handle(request: web.Request) -> web.Response:
+            await asyncio.sleep(float(request.query.get("sleep", 0)))
+            return web.json_response({"id": request.query.get("id"), "pid": request.query.get("pid")})
+
+        async def handle_missing(_: web.Request) -> web.Response:
+            return web.json_response({"error": "not found"}, status=404)
+
+        app = web.Application()
+        app.router.add_get("/", handle)
+        app.router.add_get("/missing", handle_missing)
+        return app
+
+    async def test_init_fails(self):
+        with pytest.raises(InputError):
+            ProcessRequestExecutor(create_handler, processes=0)
+        with pytest.raises(InputError):
+            ProcessRequestExecutor(create_handler, limit=0)
+
+        with pytest.raises(InputError):
+            async with ProcessRequestExecutor(lambda: RequestHandler.create(), processes=1):
+                pass
+
+    async def test_closed(self):
+        executor = ProcessRequestExecutor(create_handler, processes=1)
+        assert executor.closed
+        with pytest.raises(RequestError):
+            await executor.get("http://localhost")
+
+    async def test_request(self, app: web.Application):
+        executor = ProcessRequestExecutor(create_handler, processes=2, limit=4)
+
+        async with test_utils.TestServer(app) as server, executor:
+            assert not executor.closed
+            assert len({worker.process.pid for worker in executor._workers}) == 2
+
+            url = server.make_url("/")
+            requests = [{"method": "GET", "url": url, "params": {"id": str(i), "sleep": "0.05"}} for i in range(8)]
+
+            start = time.monotonic()
+            payloads = await executor.request_many(requests)
+            assert [payload["id"] for payload in payloads] == [str(i) for i in range(8)]
+            assert time.monotonic() - start >= 0.1  # 8 requests at most 4 at once
+            assert executor.in_flight == 0
+
+            with pytest.raises(ResponseError):  # exceptions from the worker are raised in the caller
+                await executor.get(server.make_url("/missing"))
+
+        assert executor.closed
+
+    async def test_shared_rate_limiter(self, app: web.Application):
+        context = multiprocessing.get_context("spawn")
+        rate_limiter = SharedGCRARateLimiter(rate=20, period=1, context=context)
+        executor = ProcessRequestExecutor(
+            partial(create_handler), processes=2, rate_limiter=rate_limiter, context=context
+        )
+
+        async with test_utils.TestServer(app) as server, executor:
+            await executor.get(server.make_url("/"))  # wait for all workers to start
+
+            start = time.monotonic()
+            await executor.request_many({"method": "GET", "url": server.make_url("/")} for _ in range(6))
+            # 6 requests at 20 per second across both processes
+            assert time.monotonic() - start >= 0.25
+
+    async def test_worker_exits(self):
+        executor = ProcessRequestExecutor(create_failing_handler, processes=1)
+
+        async with executor:
+            with pytest.raises(RequestError):
+                await executor.get("http://localhost")
+
+    async def test_unpicklable_request(self, app: web.Application):
+        executor = ProcessRequestExecutor(create_handler, processes=1, limit=1)
+
+        async with test_utils.TestServer(app) as server, executor:
+            url = server.make_url("/")
+            with pytest.raises(InputError):
+                await asyncio.wait_for(executor.get(url, json={"key": lambda: None}), timeout=5)
+            assert executor.in_flight == 0
+
+            # the request did not take the only slot
+            payload = await asyncio.wait_for(executor.get(url, params={"id": "1"}), timeout=5)
+            assert payload["id"] == "1"
+
+    async def test_worker_killed_while_others_respond(self, app: web.Application):
+        executor = ProcessRequestExecutor(create_handler, processes=2)
+
+        async with test_utils.TestServer(app) as server, executor:
+            url = server.make_url("/")
+            await executor.request_many({"method": "GET", "url": url} for _ in range(2))  # wait for workers to start
+
+            slow = asyncio.create_task(executor.get(url, params={"sleep": "10"}))
+            await asyncio.sleep(0.5)
+            next(worker for worker in executor._workers if worker.pending).process.kill()
+
+            async def respond() -> None:
+                while not slow.done():
+                    await executor.get(url)
+
+            busy = asyncio.create_task(respond())
+            with pytest.raises(RequestError):
+                await asyncio.wait_for(slow, timeout=5)
+            await busy
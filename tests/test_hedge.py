@@ -0,0 +1,54 @@
+from http import HTTPMethod
+
+import pytest
+from yarl import URL
+
+from aiorequestful.exception import InputError
+from aiorequestful.hedge import Hedger
+
+
+class TestHedger:
+
+    def test_init_fails(self):
+        with pytest.raises(InputError):
+            Hedger()
+        with pytest.raises(InputError):
+            Hedger(quantile=1)
+
+    def test_can_hedge(self):
+        hedger = Hedger(delay=1)
+        assert hedger.can_hedge(HTTPMethod.GET)
+        assert hedger.can_hedge(HTTPMethod.PUT)
+        assert not hedger.can_hedge(HTTPMethod.POST)
+        assert not hedger.can_hedge(HTTPMethod.PATCH)
+
+    def test_default_budget(self):
+        budget = Hedger(delay=1).budget
+        assert budget.ratio == 0.05
+        assert budget.minimum == 1
+
+    def test_get_delay(self):
+        url = URL("http://test.com/path")
+        hedger = Hedger(delay=0.5, quantile=0.9, min_samples=5)
+        assert hedger.get_delay(url) == 0.5
+
+        for latency in (0.4, 0.3, 0.2, 0.1):
+            hedger.record(url.with_query(a="b"), latency)
+        assert hedger.get_delay(url) == 0.5  # not enough samples
+
+        for latency in range(1, 7):
+            hedger.record(url, latency)
+        assert hedger.get_delay(url) == 5
+        assert hedger.get_delay(url.with_path("other")) == 0.5
+
+        hedger = Hedger(quantile=0.5, min_samples=1)
+        assert hedger.get_delay(url) is None
+        hedger.record(url, 0.1)
+        assert hedger.get_delay(url) == 0.1
+
+    def test_samples_limit(self):
+        url = URL("http://test.com/path")
+        hedger = Hedger(quantile=0.5, samples=3, min_samples=1)
+        for latency in (10, 10, 10, 1, 1, 1):
+            hedger.record(url, latency)
+        assert hedger.get_delay(url) == 1
@@ -0,0 +1,364 @@
+import asyncio
+import sqlite3
+import time
+from http import HTTPMethod
+from pathlib import Path
+
+import pytest
+from aiohttp import ClientResponse
+from pytest_mock import MockerFixture
+from yarl import URL
+
+from aiorequestful.exception import InputError, RateLimiterError
+from aiorequestful.limiter import GCRARateLimiter, RateLimitScope, AIMDConcurrencyLimiter, SharedGCRARateLimiter, \
+    SQLiteGCRARateLimiter
+
+
+class TestGCRARateLimiter:
+
+    @pytest.fixture
+    def now(self, mocker: MockerFixture) -> list[float]:
+        """Patch the monotonic clock to a fixed, manually controlled value"""
+        now = [100.0]
+        mocker.patch.object(time, "monotonic", side_effect=lambda: now[0])
+        return now
+
+    def test_init_fails(self):
+        with pytest.raises(InputError):
+            GCRARateLimiter(rate=0)
+        with pytest.raises(InputError):
+            GCRARateLimiter(rate=1, period=0)
+        with pytest.raises(InputError):
+            GCRARateLimiter(rate=1, burst=0)
+
+    def test_reserve_steady_rate(self, now: list[float]):
+        limiter = GCRARateLimiter(rate=10, period=1)
+        assert limiter.interval == 0.1
+
+        delays = [limiter._reserve(key=None, cost=1) for _ in range(5)]
+        assert delays == pytest.approx([0, 0.1, 0.2, 0.3, 0.4])
+
+        # idle time does not allow more than the burst capacity to be sent at once
+        now[0] += 10
+        delays = [limiter._reserve(key=None, cost=1) for _ in range(3)]
+        assert delays == pytest.approx([0, 0.1, 0.2])
+
+    def test_reserve_burst(self, now: list[float]):
+        limiter = GCRARateLimiter(rate=10, period=1, burst=3)
+
+        delays = [limiter._reserve(key=None, cost=1) for _ in range(5)]
+        assert delays == pytest.approx([-0.2, -0.1, 0, 0.1, 0.2])
+
+        now[0] += 0.1  # one token refilled
+        assert limiter._reserve(key=None, cost=1) == pytest.approx(0.2)
+
+    def test_reserve_cost(self, now: list[float]):
+        limiter = GCRARateLimiter(rate=10, period=1, burst=5)
+
+        assert limiter._reserve(key=None, cost=5) <= 0
+        assert limiter._reserve(key=None, cost=2) == pytest.approx(0.2)
+
+    def test_scopes(self):
+        url = URL("http://test.com/path/to/resource")
+
+        limiter = GCRARateLimiter(rate=1, scope=RateLimitScope.GLOBAL)
+        assert limiter.get_key(HTTPMethod.GET, url) == limiter.get_key(HTTPMethod.GET, URL("http://other.com"))
+
+        limiter = GCRARateLimiter(rate=1, scope="host")
+        assert limiter.get_key(HTTPMethod.GET, url) == limiter.get_key(HTTPMethod.GET, url.with_path("other"))
+        assert limiter.get_key(HTTPMethod.GET, url) != limiter.get_key(HTTPMethod.GET, URL("http://other.com"))
+
+        limiter = GCRARateLimiter(rate=1, scope="route")
+        assert limiter.get_key(HTTPMethod.GET, url) == limiter.get_key(HTTPMethod.POST, url.with_query(a="b"))
+        assert limiter.get_key(HTTPMethod.GET, url) != limiter.get_key(HTTPMethod.GET, url.with_path("other"))
+
+    def test_buckets_are_independent(self, now: list[float]):
+        limiter = GCRARateLimiter(rate=1, scope=RateLimitScope.HOST)
+
+        assert limiter._reserve(key="test1.com", cost=1) == 0
+        assert limiter._reserve(key="test2.com", cost=1) == 0
+        assert limiter._reserve(key="test1.com", cost=1) == 1
+
+    def test_cost(self):
+        url = URL("http://test.com/path")
+        assert GCRARateLimiter(rate=1, cost=3).get_cost(HTTPMethod.GET, url) == 3
+
+        limiter = GCRARateLimiter(rate=1, cost=lambda method, _: 5 if method == HTTPMethod.POST else 1)
+        assert limiter.get_cost(HTTPMethod.GET, url) == 1
+        assert limiter.get_cost(HTTPMethod.POST, url) == 5
+
+    def test_pause(self, now: list[float]):
+        limiter = GCRARateLimiter(rate=10, period=1, burst=3, scope=RateLimitScope.HOST)
+        url = URL("http://test.com/path")
+
+        limiter.pause(HTTPMethod.GET, url, delay=2)
+        assert limiter._reserve(key="test.com", cost=1) == pytest.approx(2.1)
+        assert limiter._reserve(key="other.com", cost=1) <= 0
+
+        # pausing for less time than already reserved does not bring reservations forward
+        limiter.pause(HTTPMethod.GET, url, delay=1)
+        assert limiter._reserve(key="test.com", cost=1) == pytest.approx(2.2)
+
+    async def test_acquire(self):
+        limiter = GCRARateLimiter(rate=100, period=1, burst=2)
+        url = URL("http://test.com")
+
+        start = time.monotonic()
+        await asyncio.gather(*(limiter.acquire(HTTPMethod.GET, url) for _ in range(6)))
+        assert time.monotonic() - start == pytest.approx(0.04, abs=0.02)
+
+
+class TestSharedGCRARateLimiter:
+
+    @pytest.fixture
+    def now(self, mocker: MockerFixture) -> list[float]:
+        """Patch the monotonic clock to a fixed, manually controlled value"""
+        now = [100.0]
+        mocker.patch.object(time, "monotonic", side_effect=lambda: now[0])
+        return now
+
+    def test_init_fails(self):
+        with pytest.raises(InputError):
+            SharedGCRARateLimiter(rate=1, slots=0)
+
+    def test_reserve_steady_rate(self, now: list[float]):
+        limiter = SharedGCRARateLimiter(rate=10, period=1, burst=2)
+        assert len(limiter._shared) == 1
+
+        delays = [limiter._reserve(key=None, cost=1) for _ in range(4)]
+        assert delays == pytest.approx([-0.1, 0, 0.1, 0.2])
+
+    def test_slots(self, now: list[float]):
+        limiter = SharedGCRARateLimiter(rate=1, scope=RateLimitScope.HOST, slots=16)
+        assert len(limiter._shared) == 16
+
+        slot = limiter._get_slot("test1.com")
+        assert slot == limiter._get_slot("test1.com")
+        other = next(key for key in (f"test{i}.com" for i in range(2, 100)) if limiter._get_slot(key) != slot)
+
+        assert limiter._reserve(key="test1.com", cost=1) == 0
+        assert limiter._reserve(key=other, cost=1) == 0
+        assert limiter._reserve(key="test1.com", cost=1) == 1
+
+
+class TestSQLiteGCRARateLimiter:
+
+    @pytest.fixture
+    def now(self, mocker: MockerFixture) -> list[float]:
+        """Patch the system clock to a fixed, manually controlled value"""
+        now = [100.0]
+        mocker.patch.object(time, "time", side_effect=lambda: now[0])
+        return now
+
+    @pytest.fixture
+    def path(self, tmp_path: Path) -> Path:
+        return tmp_path.joinpath("limiter.db")
+
+    # noinspection PyUnusedLocal
+    def test_reserve_shared(self, path: Path, now: list[float]):
+        limiter = SQLiteGCRARateLimiter(path, rate=10, period=1)
+        other = SQLiteGCRARateLimiter(path, rate=10, period=1)
+
+        delays = [limiter._reserve(key=None, cost=1), other._reserve(key=None, cost=1), limiter._reserve(None, 1)]
+        assert delays == pytest.approx([0, 0.1, 0.2])
+
+        # limits with different names are independent
+        assert SQLiteGCRARateLimiter(path, rate=10, period=1, name="other")._reserve(key=None, cost=1) == 0
+
+        limiter.close()
+        other.close()
+
+    # noinspection PyUnusedLocal
+    def test_pause_shared(self, path: Path, now: list[float]):
+        limiter = SQLiteGCRARateLimiter(path, rate=10, period=1, scope=RateLimitScope.HOST)
+        other = SQLiteGCRARateLimiter(path, rate=10, period=1, scope=RateLimitScope.HOST)
+
+        limiter.pause(HTTPMethod.GET, URL("http://test.com"), delay=5)
+        assert other._reserve(key="test.com", cost=1) == pytest.approx(5.1)
+        assert other._reserve(key="other.com", cost=1) == 0
+
+        limiter.close()
+        other.close()
+
+    async def test_acquire(self, path: Path):
+        limiter = SQLiteGCRARateLimiter(path, rate=100, period=1, burst=2)
+        other = SQLiteGCRARateLimiter(path, rate=100, period=1, burst=2)
+        url = URL("http://test.com")
+
+        start = time.monotonic()
+        await asyncio.gather(*(lim.acquire(HTTPMethod.GET, url) for lim in [limiter, other] * 3))
+        assert 0.04 <= time.monotonic() - start < 0.5
+
+        limiter.close()
+        other.close()
+
+    async def test_pause_in_background(self, path: Path):
+        limiter = SQLiteGCRARateLimiter(path, rate=100, period=1, scope=RateLimitScope.HOST)
+        url = URL("http://test.com")
+
+        limiter.pause(HTTPMethod.GET, url, delay=0.2)
+        assert limiter._pauses
+
+        # the pause applies to the next request to acquire
+        start = time.monotonic()
+        await limiter.acquire(HTTPMethod.GET, url)
+        assert time.monotonic() - start >= 0.15
+        assert not limiter._pauses
+
+        limiter.close()
+
+    async def test_pause_when_locked(self, path: Path, mocker: MockerFixture):
+        limiter = SQLiteGCRARateLimiter(path, rate=100, period=1, timeout=0.2)
+        limiter._connect()
+        mock_warning = mocker.patch.object(limiter.logger, "warning")
+
+        other = sqlite3.connect(path, isolation_level=None)
+        other.execute("BEGIN IMMEDIATE")
+        try:
+            start = time.monotonic()
+            limiter.pause(HTTPMethod.GET, URL("http://test.com"), delay=5)
+            assert time.monotonic() - start < 0.1  # does not block the event loop
+
+            await asyncio.wait(limiter._pauses)
+        finally:
+            other.execute("ROLLBACK")
+            other.close()
+
+        # the pause is dropped without failing
+        mock_warning.assert_called_once()
+        assert "database is locked" in mock_warning.call_args.args[0]
+        assert limiter._reserve(key=None, cost=1) == 0
+
+        limiter.close()
+
+    async def test_acquire_when_locked(self, path: Path):
+        limiter = SQLiteGCRARateLimiter(path, rate=100, period=1, timeout=0.2)
+        url = URL("http://test.com")
+        limiter._connect()
+
+        other = sqlite3.connect(path, isolation_level=None)
+        other.execute("BEGIN IMMEDIATE")
+        try:
+            with pytest.raises(RateLimiterError, match="database is locked"):
+                await limiter.acquire(HTTPMethod.GET, url)
+        finally:
+            other.execute("ROLLBACK")
+            other.close()
+
+        # the failure does not affect later requests
+        await asyncio.wait_for(limiter.acquire(HTTPMethod.GET, url), timeout=1)
+
+        limiter.close()
+
+    async def test_pause_fails(self, path: Path, mocker: MockerFixture):
+        limiter = SQLiteGCRARateLimiter(path, rate=100, period=1)
+        url = URL("http://test.com")
+        mock_warning = mocker.patch.object(limiter.logger, "warning")
+
+        mock_update = mocker.patch.object(
+            SQLiteGCRARateLimiter, "_update", side_effect=sqlite3.DatabaseError("malformed")
+        )
+        limiter.pause(HTTPMethod.GET, url, delay=5)
+        await asyncio.wait(limiter._pauses)
+        mock_update.side_effect = RuntimeError("unexpected")
+        limiter.pause(HTTPMethod.GET, url, delay=5)
+        await asyncio.wait(limiter._pauses)
+        await asyncio.sleep(0)
+        mocker.stop(mock_update)
+
+        # failed pauses are logged and dropped without failing later requests
+        assert mock_warning.call_count == 2
+        assert "malformed" in mock_warning.call_args_list[0].args[0]
+        assert "unexpected" in mock_warning.call_args_list[1].args[0]
+        assert not limiter._pauses
+
+        start = time.monotonic()
+        await limiter.acquire(HTTPMethod.GET, url)
+        assert time.monotonic() - start < 0.1
+
+        limiter.close()
+
+
+class TestAIMDConcurrencyLimiter:
+
+    def test_init_fails(self):
+        with pytest.raises(InputError):
+            AIMDConcurrencyLimiter(initial=5, minimum=10)
+        with pytest.raises(InputError):
+            AIMDConcurrencyLimiter(initial=5, maximum=1)
+        with pytest.raises(InputError):
+            AIMDConcurrencyLimiter(decrease=1)
+
+    def test_is_overloaded(self, dummy_response: ClientResponse):
+        limiter = AIMDConcurrencyLimiter()
+        assert not limiter.is_overloaded(dummy_response)
+        assert not limiter.is_overloaded(None)
+
+        dummy_response.status = 429
+        assert limiter.is_overloaded(dummy_response)
+        dummy_response.status = 503
+        assert limiter.is_overloaded(dummy_response)
+
+    async def test_acquire_waits_for_limit(self):
+        limiter = AIMDConcurrencyLimiter(initial=2)
+
+        start = await limiter.acquire()
+        await limiter.acquire()
+        assert limiter.in_flight == 2
+
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        limiter.release(start)
+        await asyncio.wait_for(waiter, timeout=1)
+        assert limiter.in_flight == 2
+
+    async def test_cancelled_waiter(self):
+        limiter = AIMDConcurrencyLimiter(initial=1)
+        start = await limiter.acquire()
+
+        waiters = [asyncio.create_task(limiter.acquire()) for _ in range(2)]
+        await asyncio.sleep(0)
+        waiters[0].cancel()
+
+        limiter.release(start)
+        await asyncio.wait_for(waiters[1], timeout=1)
+        assert limiter.in_flight == 1
+
+    async def test_additive_increase(self):
+        limiter = AIMDConcurrencyLimiter(initial=2, maximum=3, latency_tolerance=None)
+
+        # does not increase when the limit is not being used
+        for _ in range(10):
+            limiter.release(await limiter.acquire(), latency=0.1)
+        assert limiter.limit == 2
+
+        for _ in range(10):
+            starts = [await limiter.acquire() for _ in range(limiter.limit)]
+            for start in starts:
+                limiter.release(start, latency=0.1)
+        assert limiter.limit == 3  # capped at maximum
+
+    async def test_multiplicative_decrease(self):
+        limiter = AIMDConcurrencyLimiter(initial=16, minimum=3)
+
+        starts = [await limiter.acquire() for _ in range(4)]
+        for start in starts:  # only decreases once for all requests in flight
+            limiter.release(start, overloaded=True)
+        assert limiter.limit == 8
+
+        limiter.release(await limiter.acquire(), overloaded=True)
+        assert limiter.limit == 4
+        limiter.release(await limiter.acquire(), overloaded=True)
+        assert limiter.limit == 3  # capped at minimum
+
+    async def test_decrease_on_latency(self):
+        limiter = AIMDConcurrencyLimiter(initial=10, latency_tolerance=2)
+
+        limiter.release(await limiter.acquire(), latency=0.1)
+        limiter.release(await limiter.acquire(), latency=0.15)
+        assert limiter.limit == 10
+
+        limiter.release(await limiter.acquire(), latency=0.3)
+        assert limiter.limit == 5
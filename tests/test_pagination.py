@@ -0,0 +1,131 @@
+import pytest
+from aiohttp import ClientResponse
+from multidict import CIMultiDict, CIMultiDictProxy
+from yarl import URL
+
+from aiorequestful.exception import InputError
+from aiorequestful.pagination import Paginator, OffsetPaginator, CursorPaginator, NextURLPaginator, \
+    LinkHeaderPaginator
+from aiorequestful.types import RequestKwargs
+
+
+@pytest.fixture
+def request_kwargs() -> RequestKwargs:
+    return {"method": "GET", "url": "http://test.com/items", "params": {"key": "value"}}
+
+
+def test_get_value():
+    payload = {"data": {"items": [1, 2, 3], "total": 3}}
+    assert Paginator.get_value(payload, "data.items") == [1, 2, 3]
+    assert Paginator.get_value(payload, "data.total") == 3
+    assert Paginator.get_value(payload, "data.missing") is None
+    assert Paginator.get_value(payload, "data.items.nested") is None
+    assert Paginator.get_value(payload, None) == payload
+
+
+def test_get_items():
+    assert CursorPaginator(items_key="data.items").get_items({"data": {"items": [1, 2, 3]}}) == [1, 2, 3]
+    assert CursorPaginator(items_key=None).get_items([1, 2, 3]) == [1, 2, 3]
+    assert CursorPaginator(items_key="items").get_items({}) == []
+
+    with pytest.raises(InputError):
+        CursorPaginator(items_key=None).get_items("not a list")
+
+
+class TestOffsetPaginator:
+
+    @pytest.fixture
+    def paginator(self) -> OffsetPaginator:
+        return OffsetPaginator(limit=10, offset_param="start", limit_param="size")
+
+    def test_init_fails(self):
+        with pytest.raises(InputError):
+            OffsetPaginator(limit=0)
+
+    def test_get_first(self, paginator: OffsetPaginator, request_kwargs: RequestKwargs):
+        request = paginator.get_first(request_kwargs)
+        assert request["params"] == {"key": "value", "start": 0, "size": 10}
+        assert "start" not in request_kwargs["params"]
+
+    def test_get_next(self, paginator: OffsetPaginator, request_kwargs: RequestKwargs, dummy_response: ClientResponse):
+        request = paginator.get_first(request_kwargs)
+
+        request = paginator.get_next(request, response=dummy_response, payload={"items": list(range(10))})
+        assert request["params"] == {"key": "value", "start": 10, "size": 10}
+
+        # stops on a partial page or when the total is reached
+        assert paginator.get_next(request, response=dummy_response, payload={"items": list(range(5))}) is None
+        assert paginator.get_next(
+            request, response=dummy_response, payload={"items": list(range(10)), "total": 20}
+        ) is None
+
+    def test_get_remaining(
+            self, paginator: OffsetPaginator, request_kwargs: RequestKwargs, dummy_response: ClientResponse
+    ):
+        request = paginator.get_first(request_kwargs)
+        assert paginator.get_remaining(request, response=dummy_response, payload={"items": []}) is None
+
+        requests = paginator.get_remaining(request, response=dummy_response, payload={"items": [], "total": 35})
+        assert [req["params"]["start"] for req in requests] == [10, 20, 30]
+        assert all(req["params"]["key"] == "value" for req in requests)
+
+        paginator.total_key = None
+        assert paginator.get_remaining(request, response=dummy_response, payload={"total": 35}) is None
+
+
+class TestCursorPaginator:
+
+    def test_get_next(self, request_kwargs: RequestKwargs, dummy_response: ClientResponse):
+        paginator = CursorPaginator(cursor_key="meta.next", cursor_param="after")
+
+        request = paginator.get_next(request_kwargs, response=dummy_response, payload={"meta": {"next": "abc"}})
+        assert request["params"] == {"key": "value", "after": "abc"}
+        assert paginator.get_remaining(request, response=dummy_response, payload={}) is None
+
+        assert paginator.get_next(request, response=dummy_response, payload={"meta": {"next": None}}) is None
+        assert paginator.get_next(request, response=dummy_response, payload={"meta": {"next": ""}}) is None
+
+
+class TestNextURLPaginator:
+
+    def test_get_next(self, request_kwargs: RequestKwargs, dummy_response: ClientResponse):
+        paginator = NextURLPaginator(next_key="links.next")
+        dummy_response._url = URL(request_kwargs["url"])
+
+        payload = {"links": {"next": "http://test.com/items?page=2"}}
+        request = paginator.get_next(request_kwargs, response=dummy_response, payload=payload)
+        assert request["url"] == URL("http://test.com/items?page=2")
+        assert "params" not in request
+
+        payload = {"links": {"next": "/items?page=3"}}
+        request = paginator.get_next(request, response=dummy_response, payload=payload)
+        assert request["url"] == URL("http://test.com/items?page=3")
+
+        assert paginator.get_next(request, response=dummy_response, payload={"links": {"next": None}}) is None
+
+
+class TestLinkHeaderPaginator:
+
+    @pytest.mark.parametrize("link,expected", [
+        (
+            '<http://test.com/items?page=1>; rel="prev", <http://test.com/items?page=3>; rel="next"',
+            URL("http://test.com/items?page=3")
+        ),
+        ('</items?page=3>; rel="next"', URL("http://test.com/items?page=3")),
+        ('<http://test.com/items?page=1>; rel="prev"', None),
+        (None, None),
+    ], ids=["absolute", "relative", "no next", "no header"])
+    def test_get_next(
+            self, request_kwargs: RequestKwargs, dummy_response: ClientResponse, link: str | None, expected: URL | None
+    ):
+        paginator = LinkHeaderPaginator()
+        dummy_response._url = URL(request_kwargs["url"])
+        dummy_response._headers = CIMultiDictProxy(CIMultiDict({"Link": link} if link else {}))
+
+        request = paginator.get_next(request_kwargs, response=dummy_response, payload=[])
+        if expected is None:
+            assert request is None
+            return
+
+        assert request["url"] == expected
+        assert "params" not in request
@@ -0,0 +1,174 @@
+import asyncio
+
+import aiohttp
+import pytest
+from aiohttp import web, test_utils
+
+from aiorequestful.exception import InputError
+from aiorequestful.pool import ConnectionPool, ConnectionPoolStats, ConnectionWarmer
+from aiorequestful.request import RequestHandler
+from aiorequestful.response.payload import JSONPayloadHandler
+
+
+class TestConnectionPool:
+
+    @pytest.fixture
+    def app(self) -> web.Application:
+        async def handle(_: web.Request) -> web.Response:
+            await asyncio.sleep(0.05)
+            return web.json_response({"key": "value"})
+
+        app = web.Application()
+        app.router.add_get("/", handle)
+        return app
+
+    def test_init_fails(self):
+        with pytest.raises(InputError):
+            ConnectionPool(limit=-1)
+        with pytest.raises(InputError):
+            ConnectionPool(limit_per_host=-1)
+        with pytest.raises(InputError):
+            ConnectionPool(keepalive_timeout=-1)
+
+    def test_presets(self):
+        pool = ConnectionPool.bulk_crawl()
+        assert pool.limit > ConnectionPool().limit
+        assert pool.limit_per_host > 0
+
+        pool = ConnectionPool.low_latency(limit=20)
+        assert pool.limit == 20
+        assert pool.keepalive_timeout > ConnectionPool().keepalive_timeout
+
+    async def test_create_connector(self):
+        pool = ConnectionPool(limit=5, limit_per_host=2, keepalive_timeout=5, ttl_dns_cache=None, ssl=False)
+        connector = pool.create_connector()
+        assert connector.limit == 5
+        assert connector.limit_per_host == 2
+        assert connector._keepalive_timeout == 5
+        assert not connector._ssl
+        await connector.close()
+
+        # keepalive timeout cannot be given to aiohttp when connections are not kept alive
+        connector = ConnectionPool(force_close=True).create_connector()
+        assert connector.force_close
+        await connector.close()
+
+    def test_stats_without_connector(self):
+        stats = ConnectionPool(limit=5).stats
+        assert stats.limit == 5
+        assert stats.in_use == stats.idle == stats.waiting == stats.acquired == 0
+        assert stats.mean_wait_time == 0
+
+    def test_stats_properties(self):
+        stats = ConnectionPoolStats(created=2, reused=2, wait_time=2)
+        assert stats.acquired == 4
+        assert stats.mean_wait_time == 0.5
+
+    async def test_stats(self, app: web.Application):
+        pool = ConnectionPool(limit=2)
+        handler = RequestHandler.create(payload_handler=JSONPayloadHandler(), pool=pool)
+
+        async with test_utils.TestServer(app) as server, handler:
+            assert isinstance(handler.session.connector, aiohttp.TCPConnector)
+            assert handler.session.connector.limit == 2
+
+            url = server.make_url("/")
+            tasks = [asyncio.create_task(handler.get(url)) for _ in range(4)]
+            await asyncio.sleep(0.02)
+
+            stats = pool.stats
+            assert stats.in_use == 2
+            assert stats.waiting == 2
+
+            assert await asyncio.gather(*tasks) == [{"key": "value"}] * 4
+
+            stats = pool.stats
+            assert stats.in_use == 0
+            assert stats.idle == 2
+            assert stats.waiting == 0
+            assert stats.created == 2
+            assert stats.reused == 2
+            assert stats.acquired == 4
+            assert stats.queued == 2
+            assert stats.max_wait_time >= 0.02
+            assert 0 < stats.mean_wait_time <= stats.max_wait_time
+
+        # stats are reset for the connector of each new session
+        async with handler:
+            assert pool.stats.acquired == 0
+
+    async def test_stats_with_session_trace_configs(self, app: web.Application):
+        created: list[bool] = []
+
+        async def on_create(*_):
+            created.append(True)
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_connection_create_end.append(on_create)
+
+        pool = ConnectionPool()
+        handler = RequestHandler.create(pool=pool, trace_configs=[trace_config])
+
+        async with test_utils.TestServer(app) as server, handler:
+            await handler.get(server.make_url("/"))
+
+        assert created == [True]
+        assert pool.stats.created == 1
+
+
+class TestConnectionWarmer:
+
+    @pytest.fixture
+    def app(self) -> web.Application:
+        async def handle(_: web.Request) -> web.Response:
+            return web.json_response({"key": "value"})
+
+        app = web.Application()
+        app.router.add_get("/{path:.*}", handle)
+        return app
+
+    def test_init(self):
+        with pytest.raises(InputError):
+            ConnectionWarmer(urls=[], connections=0)
+        with pytest.raises(InputError):
+            ConnectionWarmer(urls=[], timeout=0)
+
+        urls = ["https://api.example.com/v1/items?id=1", "https://api.example.com/v2", "http://example.com:8080/path"]
+        warmer = ConnectionWarmer(urls=urls)
+        assert [str(url) for url in warmer.urls] == ["https://api.example.com", "http://example.com:8080"]
+
+    async def test_warm_up(self, app: web.Application):
+        pool = ConnectionPool(limit=10)
+        handler = RequestHandler.create(pool=pool)
+
+        async with test_utils.TestServer(app) as server, handler:
+            warmer = ConnectionWarmer(urls=[server.make_url("/path")], connections=3)
+            assert await warmer.warm_up(handler.session) == 3
+            assert pool.stats.idle == 3
+
+            await handler.get(server.make_url("/path"))
+            stats = pool.stats
+            assert stats.reused == 1
+            assert stats.created == 0
+            assert stats.idle == 3
+
+    async def test_warm_up_bounded_by_limits(self, app: web.Application):
+        async with test_utils.TestServer(app) as server, test_utils.TestServer(app) as other:
+            urls = [server.make_url("/"), other.make_url("/")]
+
+            pool = ConnectionPool(limit=10, limit_per_host=2)
+            async with aiohttp.ClientSession(**pool.get_session_kwargs()) as session:
+                assert await ConnectionWarmer(urls=urls, connections=5).warm_up(session) == 4
+
+            pool = ConnectionPool(limit=3)
+            async with aiohttp.ClientSession(**pool.get_session_kwargs()) as session:
+                assert await ConnectionWarmer(urls=urls, connections=2).warm_up(session) == 3
+
+            pool = ConnectionPool(force_close=True)
+            async with aiohttp.ClientSession(**pool.get_session_kwargs()) as session:
+                assert await ConnectionWarmer(urls=urls).warm_up(session) == 0
+
+    async def test_warm_up_skips_failed_connections(self, app: web.Application, unused_tcp_port: int):
+        async with test_utils.TestServer(app) as server, aiohttp.ClientSession() as session:
+            urls = [f"http://127.0.0.1:{unused_tcp_port}", server.make_url("/")]
+            assert await ConnectionWarmer(urls=urls, connections=2, timeout=1).warm_up(session) == 2
@@ -1,12 +1,15 @@
+import asyncio
+import hashlib
 import json
 from collections.abc import Mapping
 from http import HTTPMethod
+from pathlib import Path
 from typing import Any
 from unittest.mock import AsyncMock
 
 import aiohttp
 import pytest
-from aiohttp import ClientResponse
+from aiohttp import ClientResponse, web, test_utils
 from aioresponses import aioresponses
 from aioresponses.core import RequestCall
 from pytest_mock import MockerFixture
@@ -14,14 +17,23 @@ from yarl import URL
 
 from aiorequestful.auth import Authoriser
 from aiorequestful.auth.basic import BasicAuthoriser
+from aiorequestful.body import FileBody, StreamBody, FactoryBody
 from aiorequestful.cache.backend.base import ResponseCache
 from aiorequestful.cache.backend.sqlite import SQLiteCache
 from aiorequestful.cache.session import CachedSession
-from aiorequestful.exception import RequestError
+from aiorequestful.breaker import CircuitBreaker
+from aiorequestful.budget import RequestBudget
+from aiorequestful.exception import RequestError, InputError, CircuitOpenError, DeadlineExceededError
+from aiorequestful.hedge import Hedger
+from aiorequestful.limiter import GCRARateLimiter, AIMDConcurrencyLimiter
+from aiorequestful.pagination import OffsetPaginator, CursorPaginator, LinkHeaderPaginator
+from aiorequestful.pool import ConnectionPool, ConnectionWarmer
 from aiorequestful.request import RequestHandler
-from aiorequestful.response.exception import ResponseError
-from aiorequestful.response.payload import JSONPayloadHandler, StringPayloadHandler
+from aiorequestful.response.exception import ResponseError, PayloadHandlerError
+from aiorequestful.response.payload import JSONPayloadHandler, StringPayloadHandler, StreamingJSONPayloadHandler, \
+    FilePayloadHandler
 from aiorequestful.response.status import ClientErrorStatusHandler, RateLimitStatusHandler, UnauthorisedStatusHandler
+from aiorequestful.scheduler import Lane, RequestScheduler
 from aiorequestful.timer import StepCountTimer, Timer
 from tests.cache.backend.utils import MockResponseRepositorySettings
 
@@ -118,6 +130,83 @@ class TestRequestHandler:
             for repository in cache.values():
                 assert isinstance(repository.settings.payload_handler, StringPayloadHandler)
 
+    async def test_nested_context_shares_session(self, request_handler: RequestHandler, mocker: MockerFixture):
+        mock_authorise = mocker.patch.object(RequestHandler, "authorise", return_value={})
+
+        async with request_handler:
+            session = request_handler.session
+            async with request_handler:
+                assert request_handler.session is session
+            assert not request_handler.closed
+
+        assert request_handler.closed
+        mock_authorise.assert_awaited_once()
+
+    async def test_interleaved_enter_and_exit(self, request_handler: RequestHandler, mocker: MockerFixture):
+        mocker.patch.object(RequestHandler, "authorise", return_value={})
+        close_session = RequestHandler._close_session
+
+        async def slow_close_session(self, *args) -> None:
+            await asyncio.sleep(0.05)
+            await close_session(self, *args)
+
+        mocker.patch.object(RequestHandler, "_close_session", slow_close_session)
+
+        await request_handler.__aenter__()
+        session = request_handler.session
+
+        # enter a new context while the last context is still closing its session
+        exit_task = asyncio.create_task(request_handler.__aexit__(None, None, None))
+        await asyncio.sleep(0)
+        async with request_handler:
+            assert exit_task.done()
+            assert session.closed
+            assert request_handler.session is not session
+            assert not request_handler.closed
+
+        assert request_handler.closed
+
+    async def test_persistent_session(self, request_handler: RequestHandler, mocker: MockerFixture):
+        mock_authorise = mocker.patch.object(RequestHandler, "authorise", return_value={})
+        request_handler.persistent = True
+
+        async with request_handler:
+            session = request_handler.session
+        assert not request_handler.closed
+
+        async with request_handler:
+            assert request_handler.session is session
+        mock_authorise.assert_awaited_once()
+
+        await request_handler.close()
+        assert request_handler.closed
+
+        async with request_handler:
+            assert request_handler.session is not session
+        assert mock_authorise.await_count == 2
+        await request_handler.close()
+
+    async def test_persistent_session_reaps_idle_connections(self):
+        async def handle(_: web.Request) -> web.Response:
+            return web.json_response({"key": "value"})
+
+        app = web.Application()
+        app.router.add_get("/", handle)
+
+        pool = ConnectionPool(keepalive_timeout=0.05)
+        handler = RequestHandler.create(pool=pool, persistent=True)
+
+        async with test_utils.TestServer(app) as server:
+            async with handler:
+                await handler.get(server.make_url("/"))
+            assert pool.stats.idle == 1
+
+            await asyncio.sleep(0.2)
+            assert pool.stats.idle == 0
+            assert not handler.closed
+
+            await handler.close()
+
     async def test_kwargs_cleaned(self, request_handler: RequestHandler, url: URL, requests_mock: aioresponses):
         url = url.joinpath("test")
         expected = {"key": "value"}
@@ -346,3 +435,920 @@ class TestRequestHandler:
         assert request_handler.closed
         with pytest.raises(RequestError):
             await request_handler.get(url)
+
+    async def test_request_many(self, request_handler: RequestHandler, url: URL, requests_mock: aioresponses):
+        urls = [url.joinpath(str(i)) for i in range(10)]
+        for i, u in enumerate(urls):
+            requests_mock.get(u, status=200, payload={"index": i})
+
+        async with request_handler as handler:
+            results = await handler.request_many(({"method": "GET", "url": u} for u in urls), limit=3)
+
+        assert results == [{"index": i} for i in range(len(urls))]
+
+    async def test_request_many_limits_concurrency(
+            self, request_handler: RequestHandler, url: URL, mocker: MockerFixture
+    ):
+        hosts = ["http://test1.com", "http://test2.com", "http://test3.com"]
+        urls = [URL(host).joinpath(str(i)) for i in range(6) for host in hosts]
+        in_flight: dict[str | None, int] = {host: 0 for host in map(lambda h: URL(h).host, hosts)}
+        in_flight_max: dict[str | None, int] = {None: 0} | in_flight.copy()
+
+        async def request(**kwargs) -> str:
+            host = URL(kwargs["url"]).host
+            in_flight[host] += 1
+            in_flight_max[host] = max(in_flight[host], in_flight_max[host])
+            in_flight_max[None] = max(sum(in_flight.values()), in_flight_max[None])
+
+            await asyncio.sleep(0.01)
+            in_flight[host] -= 1
+            return str(kwargs["url"])
+
+        mocker.patch.object(RequestHandler, attribute="request", side_effect=request)
+
+        async with request_handler as handler:
+            results = await handler.get_many(urls, limit=5, limit_per_host=2)
+
+        assert results == list(map(str, urls))
+        assert in_flight_max.pop(None) == 5
+        assert all(count == 2 for count in in_flight_max.values())
+
+    async def test_request_many_fails_fast(
+            self, request_handler: RequestHandler, url: URL, requests_mock: aioresponses, mocker: MockerFixture
+    ):
+        request_handler.retry_timer = StepCountTimer(initial=10, count=5)
+        request_handler.response_handlers = [ClientErrorStatusHandler()]
+        requests_mock.get(url.joinpath("fail"), status=400)
+        requests_mock.get(url.joinpath("retry"), status=500, repeat=True)
+        mock_retry_timer = mocker.spy(RequestHandler, "_handle_retry_timer")
+
+        async with request_handler as handler:
+            task = handler.get_many([url.joinpath("retry"), url.joinpath("fail")], limit=2)
+            with pytest.raises(ResponseError):
+                await asyncio.wait_for(task, timeout=1)
+
+        # pending retry was cancelled instead of sleeping for the full retry time
+        mock_retry_timer.assert_called_once()
+
+    async def test_request_many_returns_exceptions(
+            self, request_handler: RequestHandler, url: URL, requests_mock: aioresponses
+    ):
+        request_handler.response_handlers = [ClientErrorStatusHandler()]
+        requests_mock.get(url.joinpath("0"), status=200, payload={"key": "value"})
+        requests_mock.get(url.joinpath("1"), status=400)
+        requests_mock.get(url.joinpath("2"), status=200, payload={"key": "value"})
+
+        async with request_handler as handler:
+            results = await handler.get_many(
+                [url.joinpath(str(i)) for i in range(3)], limit=1, return_exceptions=True
+            )
+
+        assert results[0] == results[2] == {"key": "value"}
+        assert isinstance(results[1], ResponseError)
+
+    async def test_request_many_fails(self, request_handler: RequestHandler, url: URL):
+        with pytest.raises(RequestError):
+            await request_handler.get_many([url])
+
+        async with request_handler as handler:
+            with pytest.raises(InputError):
+                await handler.get_many([url], limit=0)
+            with pytest.raises(InputError):
+                await handler.get_many([url], limit_per_host=0)
+
+    async def test_stream(self, request_handler: RequestHandler, url: URL, mocker: MockerFixture):
+        in_flight = 0
+        in_flight_max = 0
+        consumed = 0
+
+        async def request(**kwargs) -> str:
+            nonlocal in_flight, in_flight_max
+            in_flight += 1
+            in_flight_max = max(in_flight, in_flight_max)
+
+            index = int(URL(kwargs["url"]).name)
+            await asyncio.sleep(0.001 * (10 - index % 10))
+            in_flight -= 1
+
+            if index == 5:
+                raise RequestError("Failed")
+            return str(kwargs["url"])
+
+        async def requests():
+            nonlocal consumed
+            for i in range(20):
+                consumed += 1
+                yield {"method": "GET", "url": url.joinpath(str(i))}
+
+        mocker.patch.object(RequestHandler, attribute="request", side_effect=request)
+
+        results = {}
+        async with request_handler as handler:
+            async for kwargs, result in handler.stream(requests(), limit=4):
+                assert consumed - len(results) <= 4  # requests are only consumed as needed
+                results[str(kwargs["url"])] = result
+
+        assert in_flight_max == 4
+        assert len(results) == 20
+
+        failed = results.pop(str(url.joinpath("5")))
+        assert isinstance(failed, RequestError)
+        assert all(key == value for key, value in results.items())
+
+    async def test_stream_cancels_on_close(self, request_handler: RequestHandler, url: URL, mocker: MockerFixture):
+        cancelled = 0
+
+        async def request(**kwargs) -> str:
+            nonlocal cancelled
+            try:
+                await asyncio.sleep(0 if URL(kwargs["url"]).name == "0" else 10)
+            except asyncio.CancelledError:
+                cancelled += 1
+                raise
+            return str(kwargs["url"])
+
+        mocker.patch.object(RequestHandler, attribute="request", side_effect=request)
+
+        async with request_handler as handler:
+            stream = handler.stream(({"method": "GET", "url": url.joinpath(str(i))} for i in range(10)), limit=3)
+            async for kwargs, result in stream:
+                assert result == str(kwargs["url"])
+                break
+            await stream.aclose()
+
+        assert cancelled == 2  # all requests still in flight
+
+    async def test_rate_limiter(
+            self,
+            request_handler: RequestHandler,
+            url: URL,
+            requests_mock: aioresponses,
+            mocker: MockerFixture
+    ):
+        url = url.joinpath("test")
+        request_handler.rate_limiter = GCRARateLimiter(rate=1)
+        mock_acquire = mocker.patch.object(GCRARateLimiter, "acquire", side_effect=AsyncMock())
+        requests_mock.get(url, payload={"key": "value"}, repeat=True)
+
+        async with request_handler as handler:
+            repository_settings = MockResponseRepositorySettings(name="test", payload_handler=handler.payload_handler)
+            repository = await handler.session.cache.create_repository(repository_settings)
+            handler.session.cache.repository_getter = lambda _, __: repository
+
+            await handler.get(url)
+            await handler.get(url)
+            assert sum(map(len, requests_mock.requests.values())) == 1
+            mock_acquire.assert_awaited_once_with(method=HTTPMethod.GET, url=url)
+
+        request_handler = RequestHandler.create(rate_limiter=request_handler.rate_limiter)
+        async with request_handler as handler:
+            await handler.get(url)
+            assert mock_acquire.await_count == 2
+
+    async def test_connections_released_before_pacing(self):
+        connector = aiohttp.TCPConnector(limit=2)
+        pool_in_use: list[int] = []
+
+        class PoolOccupancyTimer(StepCountTimer):
+            """Records the number of connections in use whenever the timer is awaited"""
+            def __await__(self):
+                # noinspection PyProtectedMember
+                pool_in_use.append(len(connector._acquired))
+                return super().__await__()
+
+        rate_limited: set[str] = set()
+
+        async def handle(request: web.Request) -> web.Response:
+            if request.query.get("id") not in rate_limited:  # rate limit the first request for each ID
+                rate_limited.add(request.query.get("id"))
+                # large enough that the body cannot be buffered in full without being read
+                body = {"error": "rate limited", "detail": "x" * 2 ** 20}
+                return web.json_response(body, status=429, headers={"Retry-After": "0"})
+            return web.json_response({"key": "value"})
+
+        app = web.Application()
+        app.router.add_get("/", handle)
+
+        handler = RequestHandler(
+            connector=lambda: aiohttp.ClientSession(connector=connector, connector_owner=False),
+            payload_handler=JSONPayloadHandler(),
+            response_handlers=[RateLimitStatusHandler()],
+            wait_timer=PoolOccupancyTimer(initial=0.1, count=0),
+        )
+
+        async with test_utils.TestServer(app) as server, handler:
+            url = server.make_url("/")
+            for i in range(3):
+                assert await handler.get(url, params={"id": f"seq{i}"}) == {"key": "value"}
+            assert pool_in_use == [0] * 6
+
+            urls = [url.with_query(id=f"con{i}") for i in range(8)]
+            assert await handler.get_many(urls, limit=8) == [{"key": "value"}] * 8
+            assert len(connector._acquired) == 0
+
+        await connector.close()
+
+    async def test_connection_warmer(self, request_handler: RequestHandler, url: URL, mocker: MockerFixture):
+        authorised = asyncio.Event()
+        warmed_up = asyncio.Event()
+
+        async def authorise(*_, **__) -> dict[str, str]:
+            authorised.set()
+            await asyncio.wait_for(warmed_up.wait(), timeout=1)  # deadlocks when not run concurrently
+            return {}
+
+        async def warm_up(*_, **__) -> int:
+            warmed_up.set()
+            await asyncio.wait_for(authorised.wait(), timeout=1)
+            return 1
+
+        mocker.patch.object(RequestHandler, "authorise", side_effect=authorise)
+        mock_warm_up = mocker.patch.object(ConnectionWarmer, "warm_up", side_effect=warm_up)
+
+        request_handler.connection_warmer = ConnectionWarmer(urls=[url])
+        async with request_handler:
+            mock_warm_up.assert_awaited_once_with(request_handler.session)
+
+    async def test_connection_warmer_cancelled_on_failed_authorise(
+            self, request_handler: RequestHandler, url: URL, mocker: MockerFixture
+    ):
+        cancelled = asyncio.Event()
+
+        async def warm_up(*_, **__) -> int:
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return 1
+
+        async def authorise(*_, **__) -> dict[str, str]:
+            await asyncio.sleep(0.01)
+            raise RequestError("failed")
+
+        mocker.patch.object(RequestHandler, "authorise", side_effect=authorise)
+        mocker.patch.object(ConnectionWarmer, "warm_up", side_effect=warm_up)
+
+        request_handler.connection_warmer = ConnectionWarmer(urls=[url])
+        with pytest.raises(RequestError):
+            async with request_handler:
+                pass
+
+        assert cancelled.is_set()
+        assert request_handler.closed
+
+    async def test_single_flight_key(self, url: URL):
+        get_key = RequestHandler._get_single_flight_key
+
+        key = get_key({"method": HTTPMethod.GET, "url": url.with_query(b="2", a="1")})
+        assert key == get_key({"method": HTTPMethod.GET, "url": url, "params": {"a": "1", "b": "2"}})
+        url_partial = url.with_query(a="1").with_fragment("fragment")
+        assert key == get_key({"method": HTTPMethod.GET, "url": url_partial, "params": {"b": "2"}})
+        assert key != get_key({"method": HTTPMethod.HEAD, "url": url.with_query(b="2", a="1")})
+        assert key != get_key({"method": HTTPMethod.GET, "url": url.with_query(a="1")})
+
+        key = get_key({"method": HTTPMethod.GET, "url": url, "json": {"a": 1, "b": 2}})
+        assert key == get_key({"method": HTTPMethod.GET, "url": url, "json": {"b": 2, "a": 1}})
+        assert key != get_key({"method": HTTPMethod.GET, "url": url, "json": {"a": 1}})
+        assert key != get_key({"method": HTTPMethod.GET, "url": url})
+
+        key = get_key({"method": HTTPMethod.GET, "url": url, "data": "body"})
+        assert key == get_key({"method": HTTPMethod.GET, "url": url, "data": b"body"})
+
+        headers = {"Accept": "text/csv", "Range": "bytes=0-9"}
+        key = get_key({"method": HTTPMethod.GET, "url": url, "headers": headers})
+        headers = {"range": "bytes=0-9", "ACCEPT": "text/csv"}
+        assert key == get_key({"method": HTTPMethod.GET, "url": url, "headers": headers})
+        assert key != get_key({"method": HTTPMethod.GET, "url": url, "headers": {"Accept": "text/csv"}})
+        assert key != get_key({"method": HTTPMethod.GET, "url": url})
+
+        # requests which are unsafe to share or which have unhashable bodies are never shared
+        assert get_key({"method": HTTPMethod.POST, "url": url}) is None
+        assert get_key({"method": HTTPMethod.GET, "url": url, "data": iter([b"body"])}) is None
+
+    async def test_single_flight(self, request_handler: RequestHandler, url: URL, requests_mock: aioresponses):
+        request_handler.single_flight = True
+        requests_mock.get(url, payload={"key": "value"}, repeat=True)
+        requests_mock.get(url.with_query(a="1"), payload={"key": "other"}, repeat=True)
+
+        async with request_handler as handler:
+            results = await asyncio.gather(
+                *(handler.get(url) for _ in range(10)), *(handler.get(url, params={"a": "1"}) for _ in range(10))
+            )
+            assert not handler._in_flight
+
+        assert sum(map(len, requests_mock.requests.values())) == 2
+        assert results == [{"key": "value"}] * 10 + [{"key": "other"}] * 10
+        assert len(set(map(id, results))) == len(results)  # each caller is given its own payload
+
+        async with request_handler as handler:  # sent again when no identical requests are in flight
+            await handler.get(url)
+        assert sum(map(len, requests_mock.requests.values())) == 3
+
+    async def test_single_flight_headers(self, request_handler: RequestHandler, url: URL, requests_mock: aioresponses):
+        request_handler.single_flight = True
+        requests_mock.get(url, payload={"key": "value"}, repeat=True)
+
+        async with request_handler as handler:
+            await asyncio.gather(
+                *(handler.get(url, headers={"Accept": "application/json"}) for _ in range(5)),
+                *(handler.get(url, headers={"Accept": "text/plain"}) for _ in range(5)),
+            )
+
+        # requests with different headers are never shared
+        requests = next(iter(requests_mock.requests.values()))
+        assert len(requests) == 2
+        assert {request.kwargs["headers"]["Accept"] for request in requests} == {"application/json", "text/plain"}
+
+    async def test_single_flight_cancellation(
+            self, request_handler: RequestHandler, url: URL, mocker: MockerFixture
+    ):
+        request_handler.single_flight = True
+        cancelled = asyncio.Event()
+
+        async def request(**_) -> tuple[None, dict[str, str]]:
+            try:
+                await asyncio.sleep(0.1)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return None, {"key": "value"}
+
+        mocker.patch.object(RequestHandler, attribute="_request_with_retry", side_effect=request)
+
+        async with request_handler as handler:
+            tasks = [asyncio.create_task(handler.get(url)) for _ in range(3)]
+            await asyncio.sleep(0)
+
+            # shared request continues whilst any caller is still waiting for it
+            tasks[0].cancel()
+            tasks[1].cancel()
+            assert await tasks[2] == {"key": "value"}
+            assert not cancelled.is_set()
+
+            tasks = [asyncio.create_task(handler.get(url)) for _ in range(3)]
+            await asyncio.sleep(0)
+            for task in tasks:
+                task.cancel()
+            await asyncio.wait_for(cancelled.wait(), timeout=1)
+            assert not handler._in_flight
+
+    async def test_single_flight_shares_errors(
+            self, request_handler: RequestHandler, url: URL, requests_mock: aioresponses
+    ):
+        request_handler.single_flight = True
+        request_handler.response_handlers = [ClientErrorStatusHandler()]
+        requests_mock.get(url, status=400)
+
+        async with request_handler as handler:
+            results = await asyncio.gather(*(handler.get(url) for _ in range(5)), return_exceptions=True)
+
+        assert sum(map(len, requests_mock.requests.values())) == 1
+        assert all(isinstance(result, ResponseError) for result in results)
+
+    async def test_hedged_request(
+            self, request_handler: RequestHandler, url: URL, mocker: MockerFixture, dummy_response: ClientResponse
+    ):
+        request_handler.hedger = Hedger(delay=0.05)
+        cancelled = []
+
+        async def send(timing=None, **_):
+            if timing is not None:  # unhedged requests are sent without timing
+                timing.mark_sent()
+            sleep = 10 if mock_send.call_count == 1 else 0
+            try:
+                await asyncio.sleep(sleep)
+            except asyncio.CancelledError:
+                cancelled.append(sleep)
+                raise
+            return dummy_response, f"response {mock_send.call_count}"
+
+        mock_send = mocker.patch.object(RequestHandler, attribute="_send", side_effect=send)
+
+        async with request_handler as handler:
+            assert await asyncio.wait_for(handler.get(url), timeout=1) == "response 2"
+            assert cancelled == [10]
+
+            # unsafe methods are not hedged
+            mock_send.reset_mock()
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(handler.post(url), timeout=0.2)
+            mock_send.assert_called_once()
+
+    async def test_hedged_request_waits_for_success(
+            self, request_handler: RequestHandler, url: URL, mocker: MockerFixture, dummy_response: ClientResponse
+    ):
+        request_handler.hedger = Hedger(delay=0.05)
+
+        async def send(timing, **_):
+            timing.mark_sent()
+            if mock_send.call_count == 1:
+                await asyncio.sleep(0.1)
+                return dummy_response, "response 1"
+            return aiohttp.ClientConnectionError(), None
+
+        mock_send = mocker.patch.object(RequestHandler, attribute="_send", side_effect=send)
+
+        async with request_handler as handler:
+            assert await handler.get(url) == "response 1"
+        assert mock_send.call_count == 2
+
+    async def test_hedged_request_budget(
+            self, request_handler: RequestHandler, url: URL, mocker: MockerFixture, dummy_response: ClientResponse
+    ):
+        request_handler.hedger = Hedger(delay=0, budget=RequestBudget(ratio=0, minimum=1))
+
+        async def send(timing, **_):
+            timing.mark_sent()
+            await asyncio.sleep(0.01)
+            return dummy_response, "response"
+
+        mock_send = mocker.patch.object(RequestHandler, attribute="_send", side_effect=send)
+
+        async with request_handler as handler:
+            for _ in range(3):
+                await handler.get(url)
+
+        assert mock_send.call_count == 4
+        assert request_handler.hedger.budget.withdrawals == 1
+        assert request_handler.hedger.budget.requests == 3
+        # noinspection PyProtectedMember
+        assert len(request_handler.hedger._latencies[Hedger.get_route(url)]) >= 3
+
+    async def test_hedged_request_ignores_rate_limit_wait(self):
+        received = []
+
+        async def handle(request: web.Request) -> web.Response:
+            received.append(request.url)
+            return web.json_response({"key": "value"})
+
+        app = web.Application()
+        app.router.add_get("/", handle)
+
+        handler = RequestHandler.create(payload_handler=JSONPayloadHandler())
+        handler.rate_limiter = GCRARateLimiter(rate=10)
+        handler.hedger = Hedger(delay=0.05)
+
+        async with test_utils.TestServer(app) as server, handler:
+            url = server.make_url("/")
+            # requests queue on the rate limiter for much longer than the hedger's delay
+            await asyncio.gather(*(handler.get(url) for _ in range(10)))
+
+        assert len(received) == 10
+        assert handler.hedger.budget.withdrawals == 0
+        assert handler.hedger.budget.requests == 10
+        # noinspection PyProtectedMember
+        assert all(latency < 0.05 for latency in handler.hedger._latencies[Hedger.get_route(url)])
+
+    async def test_circuit_breaker(self, request_handler: RequestHandler, url: URL, requests_mock: aioresponses):
+        request_handler.circuit_breaker = CircuitBreaker(failure_threshold=3, recovery_time=60)
+        request_handler.retry_timer = StepCountTimer(initial=0, count=10, step=0)
+        requests_mock.get(url, status=503, repeat=True)
+
+        async with request_handler as handler:
+            with pytest.raises(CircuitOpenError):
+                await handler.get(url)
+            assert sum(map(len, requests_mock.requests.values())) == 3
+
+            with pytest.raises(CircuitOpenError):  # fails without sending a request
+                await handler.get(url.joinpath("other"))
+            assert sum(map(len, requests_mock.requests.values())) == 3
+
+    async def test_concurrency_limiter(self, request_handler: RequestHandler, url: URL, requests_mock: aioresponses):
+        request_handler.concurrency_limiter = AIMDConcurrencyLimiter(initial=8, latency_tolerance=None)
+        request_handler.retry_timer = StepCountTimer(initial=0, count=1, step=0)
+        requests_mock.get(url, status=503)
+        requests_mock.get(url, payload={"key": "value"})
+
+        async with request_handler as handler:
+            assert await handler.get(url) == {"key": "value"}
+
+        assert request_handler.concurrency_limiter.limit == 4
+        assert request_handler.concurrency_limiter.in_flight == 0
+
+    async def test_concurrency_limiter_ignores_rate_limit_wait(self):
+        async def handle(_: web.Request) -> web.Response:
+            await asyncio.sleep(0.02)
+            return web.json_response({"key": "value"})
+
+        app = web.Application()
+        app.router.add_get("/", handle)
+
+        handler = RequestHandler.create(payload_handler=JSONPayloadHandler())
+        handler.rate_limiter = GCRARateLimiter(rate=50)
+        handler.concurrency_limiter = AIMDConcurrencyLimiter(initial=20, latency_tolerance=2.0)
+
+        async with test_utils.TestServer(app) as server, handler:
+            url = server.make_url("/")
+            # requests queue on the rate limiter for much longer than the service takes to respond
+            await asyncio.gather(*(handler.get(url) for _ in range(20)))
+
+        assert handler.concurrency_limiter.limit >= 20
+        assert handler.concurrency_limiter.in_flight == 0
+
+    async def test_retry_budget(self, request_handler: RequestHandler, url: URL, requests_mock: aioresponses):
+        request_handler.retry_budget = RequestBudget(ratio=0, minimum=2)
+        request_handler.retry_timer = StepCountTimer(initial=0, count=10, step=0)
+        requests_mock.get(url, status=500, repeat=True)
+
+        async with request_handler as handler:
+            with pytest.raises(ResponseError):
+                await handler.get(url)
+            assert sum(map(len, requests_mock.requests.values())) == 3
+
+            # fails immediately once the budget is exhausted
+            with pytest.raises(ResponseError):
+                await handler.get(url)
+            assert sum(map(len, requests_mock.requests.values())) == 4
+
+        assert request_handler.retry_budget.requests == 2
+        assert request_handler.retry_budget.withdrawals == 2
+
+    async def test_retry_budget_exhausted(self, request_handler: RequestHandler, url: URL):
+        request_handler.retry_budget = RequestBudget(ratio=0, minimum=0)
+        timer = StepCountTimer(initial=0, count=10, step=0)
+
+        with pytest.raises(RequestError, match="Retry budget exhausted"):
+            await request_handler._handle_retry_timer(method=HTTPMethod.GET, url=url, timer=timer)
+        assert timer.counter == 0
+
+    async def test_deadline_shrinks_timeout(
+            self, request_handler: RequestHandler, url: URL, requests_mock: aioresponses
+    ):
+        request_handler.deadline = 5
+        requests_mock.get(url, payload={"key": "value"}, repeat=True)
+
+        async with request_handler as handler:
+            assert await handler.get(url) == {"key": "value"}
+            assert await handler.get(url, timeout=aiohttp.ClientTimeout(total=1, sock_read=0.5))
+
+        timeouts = [req.kwargs["timeout"] for req in next(iter(requests_mock.requests.values()))]
+        assert 4 < timeouts[0].total <= 5
+        assert timeouts[1].total == 1
+        assert timeouts[1].sock_read == 0.5
+
+        request_handler.deadline = 0.5
+        async with request_handler as handler:
+            await handler.get(url, timeout=aiohttp.ClientTimeout(total=1, sock_read=0.2))
+
+        timeout = next(iter(requests_mock.requests.values()))[-1].kwargs["timeout"]
+        assert timeout.total <= 0.5
+        assert timeout.sock_read == 0.2
+
+    async def test_deadline_skips_retries(self, request_handler: RequestHandler, url: URL, requests_mock: aioresponses):
+        request_handler.deadline = 1
+        request_handler.retry_timer = StepCountTimer(initial=0.01, count=10, step=0.5)
+        requests_mock.get(url, status=500, repeat=True)
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        async with request_handler as handler:
+            with pytest.raises(DeadlineExceededError):
+                await handler.get(url)
+
+        # retries with wait times of 0.01 and 0.51 fit in the deadline, the next retry of 1.01 does not
+        assert loop.time() - start < 1
+        assert sum(map(len, requests_mock.requests.values())) == 3
+
+    async def test_deadline_per_request(self, request_handler: RequestHandler, url: URL, requests_mock: aioresponses):
+        async def slow_response(*_, **__) -> None:
+            await asyncio.sleep(1)
+
+        requests_mock.get(url, callback=slow_response, payload={"key": "value"}, repeat=True)
+        request_handler.deadline = 5
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        async with request_handler as handler:
+            with pytest.raises(DeadlineExceededError):
+                await handler.get(url, deadline=0.1)
+
+        assert loop.time() - start < 0.5
+
+    async def test_deadline_rate_limit_wait(
+            self, request_handler: RequestHandler, url: URL, requests_mock: aioresponses
+    ):
+        request_handler.deadline = 1
+        request_handler.response_handlers = [RateLimitStatusHandler()]
+        requests_mock.get(url, status=429, headers={"Retry-After": "2"})
+
+        async with request_handler as handler:
+            with pytest.raises(DeadlineExceededError):
+                await handler.get(url)
+
+        assert sum(map(len, requests_mock.requests.values())) == 1
+
+    async def test_scheduler(self, request_handler: RequestHandler, url: URL, requests_mock: aioresponses):
+        request_handler.scheduler = RequestScheduler(lanes=[Lane("interactive", weight=4), Lane("bulk")], limit=1)
+        order = []
+
+        async def _response(request_url: URL, **__) -> None:
+            await asyncio.sleep(0.01)
+            order.append(request_url.name)
+
+        for lane in ("interactive", "bulk"):
+            requests_mock.get(url.joinpath(lane), callback=_response, payload={"key": "value"}, repeat=True)
+
+        async with request_handler as handler:
+            bulk = [handler.get(url.joinpath("bulk"), lane="bulk") for _ in range(10)]
+            interactive = [handler.get(url.joinpath("interactive")) for _ in range(4)]
+            await asyncio.gather(*bulk, *interactive)
+
+        assert request_handler.scheduler.in_flight == 0
+        # interactive requests are sent ahead of the earlier bulk requests without starving them
+        assert order[:6].count("interactive") == 4
+        assert order[:6].count("bulk") == 2
+
+    async def test_paginate_concurrent(self, request_handler: RequestHandler, url: URL, requests_mock: aioresponses):
+        url = url.joinpath("items")
+        items = list(range(23))
+        in_flight = 0
+        max_in_flight = 0
+
+        def _register(offset: int) -> None:
+            async def _response(*_, **__) -> None:
+                nonlocal in_flight, max_in_flight
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+                await asyncio.sleep(0.05 if offset % 10 else 0.01)  # later pages return first
+                in_flight -= 1
+
+            payload = {"items": items[offset:offset + 5], "total": len(items)}
+            requests_mock.get(url.with_query(offset=offset, limit=5), callback=_response, payload=payload)
+
+        for page in range(0, len(items), 5):
+            _register(page)
+
+        async with request_handler as handler:
+            results = [item async for item in handler.paginate(OffsetPaginator(limit=5), limit=2, url=url)]
+
+        assert results == items
+        assert sum(map(len, requests_mock.requests.values())) == 5
+        assert max_in_flight == 2
+
+    async def test_paginate_sequential(self, request_handler: RequestHandler, url: URL, requests_mock: aioresponses):
+        url = url.joinpath("items")
+        requests_mock.get(url, payload={"items": [1, 2], "next_cursor": "a"})
+        requests_mock.get(url.with_query(cursor="a"), payload={"items": [3, 4], "next_cursor": "b"})
+        requests_mock.get(url.with_query(cursor="b"), payload={"items": [5], "next_cursor": None})
+
+        async with request_handler as handler:
+            results = [item async for item in handler.paginate(CursorPaginator(), method="GET", url=url)]
+
+        assert results == [1, 2, 3, 4, 5]
+        assert sum(map(len, requests_mock.requests.values())) == 3
+
+    async def test_paginate_link_header(
+            self, request_handler: RequestHandler, url: URL, requests_mock: aioresponses
+    ):
+        url = url.joinpath("items")
+        requests_mock.get(url, payload=[1, 2], headers={"Link": f'<{url.with_query(page=2)}>; rel="next"'})
+        requests_mock.get(url.with_query(page=2), payload=[3])
+
+        async with request_handler as handler:
+            results = [item async for item in handler.paginate(LinkHeaderPaginator(), method="GET", url=url)]
+
+        assert results == [1, 2, 3]
+
+    async def test_paginate_stops_early(self, request_handler: RequestHandler, url: URL, requests_mock: aioresponses):
+        url = url.joinpath("items")
+        for offset in range(0, 100, 10):
+            payload = {"items": list(range(offset, offset + 10)), "total": 100}
+            requests_mock.get(url.with_query(offset=offset, limit=10), payload=payload)
+
+        async with request_handler as handler:
+            pages = handler.paginate(OffsetPaginator(limit=10), limit=3, method="GET", url=url)
+            async for item in pages:
+                if item == 15:
+                    break
+            await pages.aclose()
+
+        # only the first page and the pages prefetched at the time of stopping were requested
+        assert sum(map(len, requests_mock.requests.values())) <= 5
+
+    @pytest.fixture
+    def sent(self) -> asyncio.Event:
+        return asyncio.Event()
+
+    @pytest.fixture
+    def streaming_app(self, sent: asyncio.Event) -> web.Application:
+        failed: set[str] = set()
+
+        async def handle(request: web.Request) -> web.StreamResponse:
+            key = request.query.get("key", "")
+            if "fail" in key and key not in failed:  # fail the first request for each key
+                failed.add(key)
+                return web.json_response({"error": "unavailable"}, status=503)
+
+            response = web.StreamResponse(headers={"Content-Type": "application/json"})
+            await response.prepare(request)
+
+            await response.write(b'{"total": 3, "items": [{"id": 0}, ')
+            await sent.wait()  # the first item is returned before the response completes
+            await response.write(b'{"id": 1}, ')
+            if "break" in key:
+                request.transport.close()
+                return response
+
+            await response.write(b'{"id": 2}]}')
+            await response.write_eof()
+            return response
+
+        app = web.Application()
+        app.router.add_get("/", handle)
+        return app
+
+    async def test_stream_payload(self, streaming_app: web.Application, sent: asyncio.Event):
+        pool = ConnectionPool()
+        handler = RequestHandler.create(
+            pool=pool, response_handlers=[ClientErrorStatusHandler()], retry_timer=StepCountTimer(initial=0, count=1)
+        )
+        payload_handler = StreamingJSONPayloadHandler("items.*", chunk_size=8)
+
+        async with test_utils.TestServer(streaming_app) as server, handler:
+            values = []
+            async for value in handler.stream_payload(payload_handler, method="GET", url=server.make_url("/")):
+                values.append(value)
+                sent.set()
+            assert values == [{"id": 0}, {"id": 1}, {"id": 2}]
+            assert pool.stats.in_use == 0
+
+            # retries failed responses before any values are returned
+            url = server.make_url("/").with_query(key="fail")
+            values = [value async for value in handler.stream_payload(payload_handler, method="GET", url=url)]
+            assert values == [{"id": 0}, {"id": 1}, {"id": 2}]
+
+    async def test_stream_payload_stops_early(self, streaming_app: web.Application):
+        pool = ConnectionPool()
+        handler = RequestHandler.create(pool=pool)
+
+        async with test_utils.TestServer(streaming_app) as server, handler:
+            url = server.make_url("/")
+            values = handler.stream_payload(StreamingJSONPayloadHandler("items.*"), method="GET", url=url)
+            assert await anext(values) == {"id": 0}
+            assert pool.stats.in_use == 1
+
+            await values.aclose()
+            assert pool.stats.in_use == 0
+
+    async def test_stream_payload_fails_after_values_returned(
+            self, streaming_app: web.Application, sent: asyncio.Event
+    ):
+        handler = RequestHandler.create(retry_timer=StepCountTimer(initial=0, count=3))
+        payload_handler = StreamingJSONPayloadHandler("items.*")
+        sent.set()
+
+        async with test_utils.TestServer(streaming_app) as server, handler:
+            url = server.make_url("/").with_query(key="break")
+            values = []
+            with pytest.raises(PayloadHandlerError):
+                async for value in handler.stream_payload(payload_handler, method="GET", url=url):
+                    values.append(value)
+
+            assert values == [{"id": 0}, {"id": 1}]  # never retried once values are returned
+
+    @pytest.fixture
+    def download_data(self) -> bytes:
+        return bytes(range(256)) * 1024
+
+    @pytest.fixture
+    def ranges(self) -> list[tuple[str | None, str | None]]:
+        """The Range and If-Range headers of each request received by the download app"""
+        return []
+
+    @pytest.fixture
+    def download_app(self, download_data: bytes, ranges: list[tuple[str | None, str | None]]) -> web.Application:
+        async def handle(request: web.Request) -> web.StreamResponse:
+            ranges.append((request.headers.get("Range"), request.headers.get("If-Range")))
+
+            start = 0
+            if "range" in request.query and (header := request.headers.get("Range")):
+                start = int(header.removeprefix("bytes=").removesuffix("-"))
+
+            body = download_data[start:]
+            headers = {"Content-Length": str(len(body)), "ETag": '"version"'}
+            if start:
+                headers["Content-Range"] = f"bytes {start}-{len(download_data) - 1}/{len(download_data)}"
+
+            response = web.StreamResponse(status=206 if start else 200, headers=headers)
+            await response.prepare(request)
+
+            if len(ranges) == 1 and "fail" in request.query:  # fail the first request part way through the payload
+                await response.write(body[:len(body) // 2])
+                await asyncio.sleep(0.05)
+                request.transport.close()
+                return response
+
+            await response.write(body)
+            await response.write_eof()
+            return response
+
+        app = web.Application()
+        app.router.add_get("/", handle)
+        return app
+
+    async def test_download(
+            self,
+            download_app: web.Application,
+            download_data: bytes,
+            ranges: list[tuple[str | None, str | None]],
+            tmp_path: Path,
+    ):
+        handler = RequestHandler.create(retry_timer=StepCountTimer(initial=0, count=2))
+        payload_handler = FilePayloadHandler(tmp_path.joinpath("download.bin"), chunk_size=1024, digest="sha256")
+
+        async with test_utils.TestServer(download_app) as server, handler:
+            url = server.make_url("/").with_query(range="true", fail="true")
+            path = await handler.download(payload_handler, url=url)
+
+        assert path.read_bytes() == download_data
+        assert payload_handler.hexdigest == hashlib.sha256(download_data).hexdigest()
+
+        # the retried request resumes from the last byte written
+        assert len(ranges) == 2
+        assert ranges[0] == (None, None)
+        start = int(ranges[1][0].removeprefix("bytes=").removesuffix("-"))
+        assert ranges[1] == (f"bytes={start}-", '"version"')
+        assert 0 < start < len(download_data)
+        assert payload_handler.offset == len(download_data)
+
+    async def test_download_restarts_when_range_not_supported(
+            self,
+            download_app: web.Application,
+            download_data: bytes,
+            ranges: list[tuple[str | None, str | None]],
+            tmp_path: Path,
+    ):
+        handler = RequestHandler.create(retry_timer=StepCountTimer(initial=0, count=2))
+        payload_handler = FilePayloadHandler(tmp_path.joinpath("download.bin"), chunk_size=1024, digest="md5")
+
+        async with test_utils.TestServer(download_app) as server, handler:
+            url = server.make_url("/").with_query(fail="true")
+            path = await handler.download(payload_handler, url=url)
+
+            assert len(ranges) == 2
+            assert ranges[1][0] is not None  # resume was requested but the whole payload was returned
+            assert path.read_bytes() == download_data
+            assert payload_handler.hexdigest == hashlib.md5(download_data).hexdigest()
+
+            # progress is forgotten between downloads
+            ranges.clear()
+            await handler.download(payload_handler, url=server.make_url("/"))
+            assert ranges == [(None, None)]
+            assert path.read_bytes() == download_data
+
+    @pytest.fixture
+    def uploads(self) -> list[bytes]:
+        """The body of each request received by the upload app"""
+        return []
+
+    @pytest.fixture
+    def upload_app(self, uploads: list[bytes]) -> web.Application:
+        async def handle(request: web.Request) -> web.Response:
+            uploads.append(await request.read())
+            if len(uploads) == 1:  # fail the first request after the body has been consumed
+                return web.json_response({"error": "unavailable"}, status=503)
+            return web.json_response({"size": len(uploads[-1])})
+
+        app = web.Application(client_max_size=2 ** 24)
+        app.router.add_put("/", handle)
+        return app
+
+    @pytest.mark.parametrize("body_type", ["file", "stream", "factory"])
+    async def test_upload_retries_from_start(
+            self, upload_app: web.Application, uploads: list[bytes], body_type: str, tmp_path: Path
+    ):
+        data = bytes(range(256)) * 1024
+        path = tmp_path.joinpath("upload.bin")
+        path.write_bytes(data)
+
+        handler = RequestHandler.create(
+            retry_timer=StepCountTimer(initial=0, count=2), hedger=Hedger(delay=0), payload_handler=JSONPayloadHandler()
+        )
+
+        async with test_utils.TestServer(upload_app) as server, handler:
+            with path.open("rb") as file:
+                match body_type:
+                    case "file":
+                        body = FileBody(path, chunk_size=1024)
+                    case "stream":
+                        body = StreamBody(file, chunk_size=1024)
+                    case _:
+                        body = FactoryBody(lambda: (data[i:i + 1024] for i in range(0, len(data), 1024)))
+
+                assert await handler.put(server.make_url("/"), data=body) == {"size": len(data)}
+
+        # every attempt sends the whole body and the request is never hedged
+        assert uploads == [data, data]
+
+    async def test_upload_consumed_body_without_request_body(
+            self, upload_app: web.Application, uploads: list[bytes]
+    ):
+        async def generate():
+            yield b"data"
+
+        handler = RequestHandler.create(retry_timer=StepCountTimer(initial=0, count=2))
+        async with test_utils.TestServer(upload_app) as server, handler:
+            await handler.put(server.make_url("/"), data=generate())
+
+        assert uploads == [b"data", b""]  # the retried attempt sends the body already consumed
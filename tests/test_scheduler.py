@@ -0,0 +1,110 @@
+import asyncio
+
+import pytest
+
+from aiorequestful.exception import InputError
+from aiorequestful.scheduler import Lane, RequestScheduler
+
+
+class TestRequestScheduler:
+
+    @pytest.fixture
+    def scheduler(self) -> RequestScheduler:
+        return RequestScheduler(lanes=[Lane("interactive", weight=3), Lane("bulk", weight=1)], limit=1)
+
+    @staticmethod
+    async def run_all(scheduler: RequestScheduler, lanes: list[str]) -> list[str]:
+        """Queue a request for each of the given ``lanes`` behind one in-flight request and get the dispatch order"""
+        order = []
+
+        async def _request(lane: str) -> None:
+            await scheduler.acquire(lane)
+            order.append(lane)
+            await asyncio.sleep(0)
+            scheduler.release(lane)
+
+        await scheduler.acquire()
+        tasks = [asyncio.create_task(_request(lane)) for lane in lanes]
+        await asyncio.sleep(0)
+        assert scheduler.waiting == len(lanes)
+
+        scheduler.release()
+        await asyncio.wait_for(asyncio.gather(*tasks), timeout=1)
+        return order
+
+    def test_init_fails(self):
+        with pytest.raises(InputError):
+            Lane("lane", weight=0)
+        with pytest.raises(InputError):
+            Lane("lane", limit=0)
+        with pytest.raises(InputError):
+            RequestScheduler(lanes=[])
+        with pytest.raises(InputError):
+            RequestScheduler(lanes=[Lane("lane"), Lane("lane")])
+        with pytest.raises(InputError):
+            RequestScheduler(lanes=[Lane("lane")], limit=0)
+        with pytest.raises(InputError):
+            RequestScheduler(lanes=[Lane("lane")], default="unknown")
+
+    async def test_acquire_unknown_lane(self, scheduler: RequestScheduler):
+        assert scheduler.default == "interactive"
+        with pytest.raises(InputError):
+            await scheduler.acquire("unknown")
+
+    async def test_acquire_waits_for_limit(self, scheduler: RequestScheduler):
+        await scheduler.acquire("bulk")
+        assert scheduler.in_flight == 1
+        assert scheduler.get_in_flight("bulk") == 1
+
+        waiter = asyncio.create_task(scheduler.acquire())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+        assert scheduler.get_waiting() == 1
+
+        scheduler.release("bulk")
+        await asyncio.wait_for(waiter, timeout=1)
+        assert scheduler.get_in_flight("interactive") == 1
+        assert scheduler.get_in_flight("bulk") == 0
+
+    async def test_weighted_fair_queueing(self, scheduler: RequestScheduler):
+        order = await self.run_all(scheduler, ["bulk"] * 8 + ["interactive"] * 8)
+
+        # interactive requests skip ahead of earlier bulk requests with 3 times their share
+        assert order[:8].count("interactive") == 6
+        # bulk requests are not starved while interactive requests are waiting
+        assert "bulk" in order[:4]
+        assert order[8:].count("bulk") == 6
+
+    async def test_idle_lane_does_not_bank_share(self, scheduler: RequestScheduler):
+        await self.run_all(scheduler, ["interactive"] * 10)
+
+        # bulk lane was idle and cannot claim the capacity used by the interactive lane in the meantime
+        order = await self.run_all(scheduler, ["bulk"] * 4 + ["interactive"] * 4)
+        assert order[:4].count("interactive") == 3
+
+    async def test_lane_limit(self):
+        scheduler = RequestScheduler(lanes=[Lane("interactive", weight=10, limit=1), Lane("bulk")], limit=2)
+
+        await scheduler.acquire("interactive")
+        waiters = [asyncio.create_task(scheduler.acquire(lane)) for lane in ("interactive", "bulk")]
+        await asyncio.sleep(0)
+
+        # interactive lane is at its own limit so the free slot goes to the bulk lane
+        assert not waiters[0].done()
+        assert waiters[1].done()
+
+        scheduler.release("interactive")
+        await asyncio.wait_for(waiters[0], timeout=1)
+        assert scheduler.in_flight == 2
+
+    async def test_cancelled_waiter(self, scheduler: RequestScheduler):
+        await scheduler.acquire()
+
+        waiters = [asyncio.create_task(scheduler.acquire(lane)) for lane in ("interactive", "bulk")]
+        await asyncio.sleep(0)
+        waiters[0].cancel()
+
+        scheduler.release()
+        await asyncio.wait_for(waiters[1], timeout=1)
+        assert scheduler.in_flight == 1
+        assert scheduler.waiting == 0
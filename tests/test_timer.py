@@ -5,6 +5,7 @@ import pytest
 
 from aiorequestful.timer import CeilingTimer, StepCeilingTimer, GeometricCeilingTimer, PowerCeilingTimer
 from aiorequestful.timer import CountTimer, StepCountTimer, GeometricCountTimer, PowerCountTimer
+from aiorequestful.timer import JitterTimer, FullJitterTimer, EqualJitterTimer, DecorrelatedJitterTimer
 from aiorequestful.timer import Timer
 
 
@@ -237,3 +238,128 @@ class TestPowerCeilingTimer(CeilingTimerTester):
         assert timer.counter == 2
         assert timer.count_remaining == 1
         assert timer.total_remaining == 50
+
+
+###########################################################################
+## Jitter timers
+###########################################################################
+class JitterTimerTester(ABC):
+
+    @abstractmethod
+    def timer(self) -> JitterTimer:
+        raise NotImplementedError
+
+    @staticmethod
+    def test_values_within_bounds(timer: JitterTimer):
+        bounds = []
+        while True:
+            bounds.append(timer._get_bound(timer.counter))
+            assert 0 <= float(timer) <= bounds[-1]
+            if not timer.increase():
+                break
+
+        assert timer.counter == timer.count
+        assert not timer.can_increase
+        assert timer.final == bounds[-1]
+        assert timer.total == sum(bounds)
+        assert timer.total_remaining == 0
+
+    @staticmethod
+    def test_total_bounds(timer: JitterTimer):
+        total = timer.total
+        assert total >= timer.final
+
+        timer.increase()
+        timer.increase()
+        assert timer.counter == 2
+        assert timer.count_remaining == timer.count - 2
+        assert timer.total_remaining == sum(timer._get_bound(i) for i in range(3, timer.count + 1))
+        assert timer.total_remaining < total
+
+    @staticmethod
+    def test_infinite(timer: JitterTimer):
+        timer._count = None
+
+        assert timer.can_increase
+        assert timer.final == timer.cap
+        assert timer.total is None
+        assert timer.total_remaining is None
+        assert timer.count_remaining is None
+
+    @staticmethod
+    def test_seed_is_reproducible(timer: JitterTimer):
+        timer_seeded = timer.__class__(initial=timer.initial, count=timer.count, cap=timer.cap, seed=42)
+        timer_reseeded = timer.__class__(initial=timer.initial, count=timer.count, cap=timer.cap, seed=42)
+
+        values_seeded = [float(timer_seeded)]
+        values_reseeded = [float(timer_reseeded)]
+        while timer_seeded.increase() and timer_reseeded.increase():
+            values_seeded.append(float(timer_seeded))
+            values_reseeded.append(float(timer_reseeded))
+
+        assert values_seeded == values_reseeded
+        assert len(set(values_seeded)) > 1
+
+    @staticmethod
+    def test_copies_draw_different_values(timer: JitterTimer):
+        copies = [deepcopy(timer) for _ in range(10)]
+        assert all(t._random is timer._random for t in copies)
+        assert all(t.counter == 0 for t in copies)
+        assert len({float(t) for t in copies}) == len(copies)
+
+        timer_seeded = timer.__class__(initial=timer.initial, count=timer.count, cap=timer.cap, seed=42)
+        timer_reseeded = timer.__class__(initial=timer.initial, count=timer.count, cap=timer.cap, seed=42)
+        assert [float(deepcopy(timer_seeded)) for _ in range(5)] == [float(deepcopy(timer_reseeded)) for _ in range(5)]
+
+
+class TestFullJitterTimer(JitterTimerTester):
+
+    @pytest.fixture
+    def timer(self) -> FullJitterTimer:
+        return FullJitterTimer(initial=0.1, count=6, factor=2, cap=2, seed=1)
+
+    @staticmethod
+    def test_properties():
+        timer = FullJitterTimer(initial=1, count=5, factor=2, cap=10)
+        assert timer.final == 10
+        assert timer.total == sum([1, 2, 4, 8, 10, 10])
+
+        timer.increase()
+        timer.increase()
+        assert timer.total_remaining == sum([8, 10, 10])
+
+
+class TestEqualJitterTimer(JitterTimerTester):
+
+    @pytest.fixture
+    def timer(self) -> EqualJitterTimer:
+        return EqualJitterTimer(initial=0.1, count=6, factor=2, cap=2, seed=1)
+
+    @staticmethod
+    def test_values_above_half_bound(timer: EqualJitterTimer):
+        while True:
+            assert timer._get_bound(timer.counter) / 2 <= float(timer)
+            if not timer.increase():
+                break
+
+
+class TestDecorrelatedJitterTimer(JitterTimerTester):
+
+    @pytest.fixture
+    def timer(self) -> DecorrelatedJitterTimer:
+        return DecorrelatedJitterTimer(initial=0.1, count=6, cap=2, seed=1)
+
+    @staticmethod
+    def test_properties():
+        timer = DecorrelatedJitterTimer(initial=1, count=3, factor=3, cap=20)
+        assert timer.final == 20
+        assert timer.total == sum([3, 9, 20, 20])
+
+    @staticmethod
+    def test_values_decorrelated(timer: DecorrelatedJitterTimer):
+        previous = timer.initial
+        while True:
+            assert timer.initial <= float(timer) <= min(timer.cap, previous * timer.factor)
+            previous = float(timer)
+            if not timer.increase():
+                break